@@ -13,6 +13,9 @@ https://docs.djangoproject.com/en/6.0/ref/settings/
 from pathlib import Path
 import os
 
+import django
+import dj_database_url
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -42,13 +45,20 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    'app.middleware.RequestTimingMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    'whitenoise.middleware.WhiteNoiseMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
+    'app.middleware.SessionExpiredMiddleware',
+    'app.middleware.ShardMiddleware',
+    'app.middleware.ReplicaMiddleware',
+    'app.middleware.IdentityMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'app.middleware.ProfilingMiddleware',
 ]
 
 ROOT_URLCONF = 'Stock.urls'
@@ -56,7 +66,7 @@ ROOT_URLCONF = 'Stock.urls'
 
 TEMPLATES = [
     {
-        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        'BACKEND': 'app.instrumentation.TimedDjangoTemplates',
         'DIRS': [os.path.join(BASE_DIR, 'templates')],  # <== IMPORTANT
         'APP_DIRS': True,
         'OPTIONS': {
@@ -82,13 +92,196 @@ WSGI_APPLICATION = 'Stock.wsgi.application'
 
 # Database
 # https://docs.djangoproject.com/en/6.0/ref/settings/#databases
+# SQLite by default; set DATABASE_URL (postgres://, mysql://, sqlite://) for
+# anything else. Connections are kept open for DB_CONN_MAX_AGE seconds and
+# health-checked before reuse, so requests skip the connect/auth handshake.
+
+DATABASE_URL = os.environ.get('DATABASE_URL')
+DB_CONN_MAX_AGE = int(os.environ.get('DB_CONN_MAX_AGE', 600))
+# Postgres only: DB_POOL_MAX_SIZE > 0 uses Django's native connection pool
+# (needs psycopg 3 with psycopg_pool) instead of one connection per worker thread.
+DB_POOL_MIN_SIZE = int(os.environ.get('DB_POOL_MIN_SIZE', 0))
+DB_POOL_MAX_SIZE = int(os.environ.get('DB_POOL_MAX_SIZE', 0))
+DB_STATEMENT_TIMEOUT_MS = int(os.environ.get('DB_STATEMENT_TIMEOUT_MS', 30000))
+
+if DATABASE_URL:
+    DATABASES = {
+        'default': dj_database_url.parse(
+            DATABASE_URL, conn_max_age=DB_CONN_MAX_AGE, conn_health_checks=True,
+        ),
+    }
+else:
+    DATABASES = {
+        'default': {
+            'ENGINE': 'django.db.backends.sqlite3',
+            'NAME': BASE_DIR / 'db.sqlite3',
+            'CONN_MAX_AGE': DB_CONN_MAX_AGE,
+            'CONN_HEALTH_CHECKS': True,
+        }
+    }
 
-DATABASES = {
+# SQLite: applied to every new connection (app.sqlite.tune). WAL lets readers
+# run alongside the writer; synchronous=NORMAL syncs at checkpoints rather
+# than on every commit (safe in WAL, a crash may lose the last commits).
+SQLITE_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'busy_timeout': int(os.environ.get('SQLITE_BUSY_TIMEOUT_MS', 5000)),
+    'mmap_size': 256 * 1024 * 1024,
+    'cache_size': -64 * 1024,  # KiB
+    'temp_store': 'MEMORY',
+}
+# Group commit (app.sqlite.record): one writer thread per process saves
+# concurrent movement writes in one transaction. Helps threaded workers
+# (gunicorn --threads); SQLite only.
+GROUP_COMMIT = os.environ.get('GROUP_COMMIT', '0') == '1'
+GROUP_COMMIT_MAX_BATCH = int(os.environ.get('GROUP_COMMIT_MAX_BATCH', 100))
+
+# Read replica (app.routers): reports and lists read from it; a session that
+# wrote reads from the primary for REPLICA_PIN_SECONDS (read-your-writes).
+REPLICA_DATABASE_URL = os.environ.get('REPLICA_DATABASE_URL')
+REPLICA_PIN_SECONDS = int(os.environ.get('REPLICA_PIN_SECONDS', 10))
+
+if REPLICA_DATABASE_URL:
+    DATABASES['replica'] = dj_database_url.parse(
+        REPLICA_DATABASE_URL, conn_max_age=DB_CONN_MAX_AGE, conn_health_checks=True,
+    )
+    # Tests run against one database; the replica alias mirrors it.
+    DATABASES['replica']['TEST'] = {'MIRROR': 'default'}
+
+# Per-account shards (app.sharding): SHARD_DATABASE_URLS="shard1=postgres://...;shard2=..."
+# Each shard needs `migrate --database=<alias>`; move accounts with move_account.
+SHARDS = []
+for _entry in filter(None, os.environ.get('SHARD_DATABASE_URLS', '').split(';')):
+    _alias, _url = _entry.split('=', 1)
+    # Tests get a database per shard (see ShardMoveTests).
+    DATABASES[_alias] = dj_database_url.parse(_url, conn_max_age=DB_CONN_MAX_AGE, conn_health_checks=True)
+    SHARDS.append(_alias)
+SHARD_CACHE_TIMEOUT = int(os.environ.get('SHARD_CACHE_TIMEOUT', 5))
+SHARD_ID_BLOCK = 10 ** 12  # ids per database, so moved rows keep theirs
+
+DATABASE_ROUTERS = ['app.sharding.ShardRouter', 'app.routers.ReplicaRouter']
+
+# Per-engine session settings, applied by the driver as each connection opens.
+_engine = DATABASES['default']['ENGINE']
+_options = DATABASES['default'].setdefault('OPTIONS', {})
+
+if _engine == 'django.db.backends.postgresql':
+    # Cap runaway queries and sessions left idle inside a transaction.
+    _options.setdefault('options', (
+        f'-c statement_timeout={DB_STATEMENT_TIMEOUT_MS} '
+        f'-c idle_in_transaction_session_timeout={DB_STATEMENT_TIMEOUT_MS * 2}'
+    ))
+    if DB_POOL_MAX_SIZE:
+        # The pool replaces persistent connections; Django rejects both at once.
+        DATABASES['default']['CONN_MAX_AGE'] = 0
+        _options['pool'] = {'min_size': DB_POOL_MIN_SIZE, 'max_size': DB_POOL_MAX_SIZE}
+
+elif _engine == 'django.db.backends.sqlite3':
+    # Take the write lock when a transaction starts, so busy_timeout can wait
+    # for it; a deferred read-then-write transaction fails with "locked".
+    if django.VERSION >= (5, 1):
+        _options.setdefault('transaction_mode', 'IMMEDIATE')
+
+elif _engine == 'django.db.backends.mysql':
+    # PyMySQL stands in for mysqlclient; report a version Django accepts.
+    import pymysql
+
+    pymysql.version_info = (2, 2, 1, 'final', 0)
+    pymysql.install_as_MySQLdb()
+    _options.setdefault('charset', 'utf8mb4')
+    _options.setdefault('isolation_level', 'read committed')
+    _options.setdefault('init_command', "SET sql_mode='STRICT_TRANS_TABLES'")
+
+
+# Existing migrations use BigAutoField (the Django 6 default); keep Django 5.x in line.
+DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
+
+
+# Cache
+# With several gunicorn workers point this at a shared backend (memcached,
+# redis or file-based) so dashboard invalidations reach every worker.
+
+CACHES = {
     'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db.sqlite3',
+        'BACKEND': os.environ.get('CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'),
+        'LOCATION': os.environ.get('CACHE_LOCATION', 'stock-default'),
     }
 }
+# LocMem is private to each worker process; anything else is taken as shared.
+CACHE_IS_SHARED = CACHES['default']['BACKEND'] != 'django.core.cache.backends.locmem.LocMemCache'
+
+# Sessions: 'cached_db' reads from the cache and only falls back to the
+# database on a miss; it is the default with a shared cache, since a
+# per-process cache would keep serving a session another worker logged out
+# or changed. 'db' is the default otherwise. 'cache' keeps sessions in the
+# cache alone (use a shared, persistent cache); 'signed_cookies' stores
+# them in the browser. Sessions are only written when their data changes.
+SESSION_ENGINE = 'django.contrib.sessions.backends.' + os.environ.get(
+    'SESSION_BACKEND', 'cached_db' if CACHE_IS_SHARED else 'db'
+)
+
+# Upper bound on how long a dashboard counter may be served from cache.
+DASHBOARD_CACHE_TIMEOUT = int(os.environ.get('DASHBOARD_CACHE_TIMEOUT', 300))
+
+# How long a resolved request identity (user, account, branch) stays cached.
+# It decides what a request may see, and with a per-process cache an
+# invalidation only reaches the worker that made the change, so keep it to
+# seconds there.
+IDENTITY_CACHE_TIMEOUT = int(os.environ.get('IDENTITY_CACHE_TIMEOUT', 1800 if CACHE_IS_SHARED else 5))
+
+
+# Request instrumentation: Server-Timing header and a JSON log of slow requests.
+SERVER_TIMING = os.environ.get('SERVER_TIMING', '1') == '1'
+SLOW_REQUEST_THRESHOLD_MS = float(os.environ.get('SLOW_REQUEST_THRESHOLD_MS', 1000))
+SLOW_REQUEST_TOP_SQL = int(os.environ.get('SLOW_REQUEST_TOP_SQL', 5))
+SLOW_REQUEST_LOG = os.environ.get('SLOW_REQUEST_LOG')  # file path; stderr when unset
+
+# Opt-in view profiling: URL names always profiled (comma separated), or per
+# request by an admin with the X-Profile header / ?_profile=1.
+PROFILE_VIEWS = [name for name in os.environ.get('PROFILE_VIEWS', '').split(',') if name]
+PROFILER = os.environ.get('PROFILER', 'cprofile')  # 'cprofile' or 'sampling'
+PROFILE_DIR = os.environ.get('PROFILE_DIR', os.path.join(BASE_DIR, 'profiles'))
+PROFILE_KEEP = int(os.environ.get('PROFILE_KEEP', 50))
+
+# Prometheus metrics at /metrics. Under gunicorn set METRICS_DIR to a
+# directory shared by the workers (emptied before start) so /metrics sums
+# all of them. Scrapers send METRICS_TOKEN as a bearer token; without it
+# only signed-in admins can read the endpoint.
+METRICS_DIR = os.environ.get('METRICS_DIR')
+METRICS_FLUSH_INTERVAL = float(os.environ.get('METRICS_FLUSH_INTERVAL', 1))
+METRICS_TOKEN = os.environ.get('METRICS_TOKEN')
+
+# Background jobs (app.jobs, manage.py run_worker). JOBS_EAGER=1 runs them
+# inline instead, for development without a worker.
+JOBS_EAGER = os.environ.get('JOBS_EAGER', '0') == '1'
+JOB_MAX_ATTEMPTS = int(os.environ.get('JOB_MAX_ATTEMPTS', 5))
+JOB_RETRY_DELAY = int(os.environ.get('JOB_RETRY_DELAY', 30))  # seconds, doubled per attempt
+JOB_LOCK_TIMEOUT = int(os.environ.get('JOB_LOCK_TIMEOUT', 600))  # seconds before a claimed job is retaken
+# Daily stock checkpoints older than this are thinned to one per month (compact_snapshots job).
+SNAPSHOT_KEEP_DAYS = int(os.environ.get('SNAPSHOT_KEEP_DAYS', 90))
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'formatters': {
+        'message': {'format': '%(message)s'},
+    },
+    'handlers': {
+        'slow_requests': {
+            'class': 'logging.FileHandler' if SLOW_REQUEST_LOG else 'logging.StreamHandler',
+            'formatter': 'message',
+            **({'filename': SLOW_REQUEST_LOG} if SLOW_REQUEST_LOG else {}),
+        },
+    },
+    'loggers': {
+        'app.slow_requests': {
+            'handlers': ['slow_requests'],
+            'level': 'WARNING',
+            'propagate': False,
+        },
+    },
+}
 
 
 # Password validation
@@ -133,6 +326,21 @@ STATICFILES_DIRS = [
 
 STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')
 
+# `manage.py collectstatic` writes content-hashed copies of every file plus
+# .gz and .br (with Brotli installed) versions into STATIC_ROOT. WhiteNoise
+# serves the hashed names with a ten-year immutable Cache-Control and picks
+# the compressed copy the browser accepts; unhashed names get
+# WHITENOISE_MAX_AGE seconds.
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'app.storage.StaticFilesStorage',
+    },
+}
+WHITENOISE_MAX_AGE = int(os.environ.get('WHITENOISE_MAX_AGE', 3600))
+
 
 EMAIL_BACKEND = 'django.core.mail.backends.console.EmailBackend'
 DEFAULT_FROM_EMAIL = 'imanishimwe.glbrt@gmail.com'
\ No newline at end of file
@@ -1,7 +1,8 @@
 from django.contrib import admin
 from .models import (
     AdminInfo, Account, UserInfo, Branch,
-    Product, Stock, StockMovement, StockMovementLog
+    Product, Stock, StockMovement, StockMovementLog, StockSnapshot,
+    DailySalesRollup, Job, FailedJob,
 )
 
 # -------------------- 1. AdminInfo --------------------
@@ -81,3 +82,34 @@ class StockMovementLogAdmin(admin.ModelAdmin):
     list_display = ("movement", "before_qty", "after_qty", "profit", "payment_method", "changed_by", "changed_at")
     list_filter = ("changed_by", "payment_method")
     readonly_fields = ("before_qty", "after_qty", "profit", "payment_method", "changed_at")
+
+
+# -------------------- 9. StockSnapshot --------------------
+@admin.register(StockSnapshot)
+class StockSnapshotAdmin(admin.ModelAdmin):
+    list_display = ("product", "branch", "quantity", "taken_at")
+    list_filter = ("branch",)
+    search_fields = ("product__name",)
+
+
+# -------------------- 10. DailySalesRollup --------------------
+@admin.register(DailySalesRollup)
+class DailySalesRollupAdmin(admin.ModelAdmin):
+    list_display = ("day", "branch", "product", "payment_method", "quantity", "sales_amount", "profit", "count")
+    list_filter = ("day", "branch", "payment_method")
+    search_fields = ("product__name",)
+
+
+# -------------------- 11. Background Jobs --------------------
+@admin.register(Job)
+class JobAdmin(admin.ModelAdmin):
+    list_display = ("task", "attempts", "max_attempts", "run_at", "locked_by", "created_at")
+    list_filter = ("task",)
+    readonly_fields = ("created_at",)
+
+
+@admin.register(FailedJob)
+class FailedJobAdmin(admin.ModelAdmin):
+    list_display = ("task", "attempts", "created_at", "failed_at")
+    list_filter = ("task",)
+    readonly_fields = ("task", "payload", "attempts", "error", "created_at", "failed_at")
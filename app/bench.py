@@ -0,0 +1,240 @@
+"""
+Synthetic data and the hot query shapes used by the benchmark commands.
+"""
+import random
+import uuid
+from collections import defaultdict
+from datetime import datetime, time, timedelta
+from decimal import Decimal
+
+from django.contrib.auth.hashers import make_password
+from django.db import connections, router
+from django.db.models import Max, Sum
+from django.utils import timezone
+
+from .identity import Identity
+from .models import (
+    KIGALI_TZ,
+    Account,
+    AdminInfo,
+    Branch,
+    DailySalesRollup,
+    Product,
+    Stock,
+    StockMovement,
+    StockSnapshot,
+    UserInfo,
+)
+
+BATCH_SIZE = 5000
+PASSWORD = "bench"
+
+ALL_ROLES = ("admin", "manager", "staff")
+
+# (view, url name, roles allowed to open it) for the main pages.
+VIEWS = (
+    ("index", "index", ALL_ROLES),
+    ("products_view", "products", ALL_ROLES),
+    ("stock_movement_view", "stock_movement_view", ALL_ROLES),
+    ("stock_movement_all_records_view", "stock_movement_all_records_view", ALL_ROLES),
+    ("stock_view", "stock_view", ("admin", "manager")),
+    ("report_view", "report_view", ALL_ROLES),
+    ("settings_view", "settings_view", ("admin", "manager")),
+)
+
+# Relative traffic per Kigali opening hour and per weekday (Monday first).
+HOUR_WEIGHTS = {7: 2, 8: 4, 9: 6, 10: 7, 11: 8, 12: 10, 13: 9, 14: 7, 15: 6, 16: 7, 17: 9, 18: 10, 19: 7, 20: 4}
+WEEKDAY_WEIGHTS = (1.0, 0.9, 0.9, 1.0, 1.2, 1.4, 0.6)
+
+
+def _timestamps(count, days, rng):
+    """
+    Yield ``count`` ascending timestamps over the last ``days`` Kigali days:
+    opening hours only, busier at midday, in the evening and on weekends,
+    with traffic growing over the period.
+    """
+    today = timezone.now().astimezone(KIGALI_TZ).date()
+    dates = [today - timedelta(days=back) for back in range(days, 0, -1)]
+    weights = [
+        WEEKDAY_WEIGHTS[day.weekday()] * (0.6 + 0.4 * (i + 1) / len(dates))
+        for i, day in enumerate(dates)
+    ]
+    hours, hour_weights = zip(*HOUR_WEIGHTS.items())
+
+    total = sum(weights)
+    remaining = count
+    for i, day in enumerate(dates):
+        per_day = remaining if i == len(dates) - 1 else min(remaining, round(count * weights[i] / total))
+        remaining -= per_day
+        moments = sorted(
+            (hour, rng.randrange(3600))
+            for hour in rng.choices(hours, hour_weights, k=per_day)
+        )
+        for hour, second in moments:
+            yield datetime.combine(day, time(hour), tzinfo=KIGALI_TZ) + timedelta(seconds=second)
+
+
+def _insert_movements(rows):
+    """
+    Insert movements keeping their generated ``created_at``, which
+    bulk_create replaces with now() (auto_now_add).
+    """
+    if not connections[router.db_for_write(StockMovement)].features.can_return_rows_from_bulk_insert:
+        # Without ids there is nothing to update; raw saves keep the field as set.
+        for row in rows:
+            row.save_base(raw=True)
+        return
+
+    moments = [row.created_at for row in rows]
+    StockMovement.objects.bulk_create(rows)
+    for row, moment in zip(rows, moments):
+        row.created_at = moment
+    StockMovement.objects.bulk_update(rows, ["created_at"], batch_size=1000)
+
+
+def seed(accounts=2, branches=3, products=50, staff=1, movements=20000, days=90, seed=0, batch_size=BATCH_SIZE):
+    """
+    Create ``accounts`` shops with ``branches`` branches each (a manager
+    and ``staff`` staff members per branch), ``products`` products per
+    branch and one admin, then ``movements`` movements spread over the
+    last ``days`` days, written with ``bulk_create`` in batches.
+
+    Stock, daily rollups and weekly snapshots are filled to match; movement
+    logs are not. Everyone's password is ``PASSWORD``. Returns a dict of the
+    created admin, accounts, branches, products, managers and staff.
+    """
+    rng = random.Random(seed)
+    tag = uuid.uuid4().hex[:8]
+    password = make_password(PASSWORD)
+
+    data = defaultdict(list)
+    sellers = {}
+    data["admin"] = AdminInfo.objects.create(
+        firstname="Bench", lastname="Admin", email=f"bench-{tag}-admin@example.com", password=password,
+    )
+    for a in range(accounts):
+        account = Account.objects.create(name=f"Bench {tag} {a + 1}")
+        data["accounts"].append(account)
+
+        for b in range(branches):
+            manager = UserInfo.objects.create(
+                account=account, firstname="Bench", lastname=f"Manager {b + 1}",
+                email=f"bench-{tag}-{a}-{b}-manager@example.com", password=password, role="manager",
+            )
+            branch = Branch.objects.create(account=account, branch_name=f"Branch {b + 1}", manager=manager)
+            data["branches"].append(branch)
+            data["managers"].append(manager)
+            branch_staff = UserInfo.objects.bulk_create([
+                UserInfo(
+                    account=account, firstname="Bench", lastname=f"Staff {b + 1}.{s + 1}",
+                    email=f"bench-{tag}-{a}-{b}-staff-{s}@example.com", password=password, role="staff",
+                    branch=branch,
+                )
+                for s in range(staff)
+            ])
+            data["staff"].extend(branch_staff)
+            sellers[branch.id] = [manager, *branch_staff]
+
+            data["products"].extend(Product.objects.bulk_create([
+                Product(
+                    account=account, branch=branch, name=f"Product {p + 1}", category=f"Category {p % 5 + 1}",
+                    cost_price=Decimal(rng.randint(100, 5000)), selling_price=Decimal(rng.randint(5100, 9000)),
+                )
+                for p in range(products)
+            ]))
+
+    quantities = defaultdict(int)
+
+    def movement(product, movement_type, quantity, created_at):
+        quantities[(product.id, product.branch_id)] += quantity if movement_type == "IN" else -quantity
+        row = StockMovement(
+            product=product, branch_id=product.branch_id, account_id=product.account_id,
+            movement_type=movement_type, quantity=quantity, created_at=created_at,
+            created_by=rng.choice(sellers[product.branch_id]),
+        )
+        if movement_type == "OUT":
+            row.selling_amount = product.selling_price * quantity
+            row.profit = (product.selling_price - product.cost_price) * quantity
+            row.payment_method = rng.choice(("cash", "momo"))
+        return row
+
+    # An opening receipt per product, before the period, keeps every later sale covered.
+    opening = timezone.now() - timedelta(days=days + 1)
+    rows = [movement(product, "IN", movements * 5, opening) for product in data["products"]]
+
+    for moment in _timestamps(max(movements - len(rows), 0), days, rng):
+        product = rng.choice(data["products"])
+        if rng.random() < 0.2:
+            rows.append(movement(product, "IN", rng.randint(5, 50), moment))
+        else:
+            rows.append(movement(product, "OUT", rng.randint(1, 5), moment))
+
+        if len(rows) >= batch_size:
+            _insert_movements(rows)
+            rows = []
+    _insert_movements(rows)
+
+    Stock.objects.bulk_create(
+        [Stock(product_id=p, branch_id=b, quantity=q) for (p, b), q in quantities.items()],
+        batch_size=batch_size,
+    )
+
+    branch_ids = [branch.id for branch in data["branches"]]
+    DailySalesRollup.objects.rebuild(branch_ids=branch_ids)
+
+    today = timezone.now().astimezone(KIGALI_TZ).date()
+    for back in range(days, 0, -7):
+        StockSnapshot.objects.take(branch_ids, datetime.combine(today - timedelta(days=back), time.min, tzinfo=KIGALI_TZ))
+
+    return dict(data)
+
+
+def hot_queries(data):
+    """
+    ``(label, queryset)`` for the main query behind each list view,
+    scoped to the first seeded manager and staff member.
+    """
+    manager, staff = data["managers"][0], data["staff"][0]
+    as_manager = Identity(role="manager", user=manager, account=manager.account, branch=data["branches"][0])
+    as_staff = Identity(role="staff", user=staff, account=staff.account, branch=staff.branch)
+
+    now = timezone.now()
+    today = now.astimezone(KIGALI_TZ).date()
+    day_start = datetime.combine(today - timedelta(days=1), time.min, tzinfo=KIGALI_TZ)
+    week_start = day_start - timedelta(days=6)
+    branch = data["branches"][0]
+    product = data["products"][0]
+
+    return [
+        ("movements: manager, last 24 hours",
+         StockMovement.objects.for_scope(as_manager).filter(created_at__gte=now - timedelta(hours=24))
+         .listing().order_by("-created_at", "-id")),
+        ("movements: staff, last 24 hours",
+         StockMovement.objects.for_scope(as_staff).filter(created_at__gte=now - timedelta(hours=24))
+         .listing().order_by("-created_at", "-id")),
+        ("all records: manager, first page",
+         StockMovement.objects.for_scope(as_manager).listing().order_by("-id")[:51]),
+        ("all records: manager, one day",
+         StockMovement.objects.for_scope(as_manager)
+         .filter(created_at__gte=day_start, created_at__lt=day_start + timedelta(days=1))
+         .listing().order_by("-id")[:51]),
+        ("all records: staff, last 7 days",
+         StockMovement.objects.for_scope(as_staff).filter(created_at__gte=week_start)
+         .listing().order_by("-id")[:51]),
+        ("report: sale lines for one day",
+         StockMovement.objects.filter(
+             branch_id__in=[b.id for b in data["branches"] if b.account_id == manager.account_id],
+             movement_type="OUT", created_at__gte=day_start, created_at__lt=day_start + timedelta(days=1),
+         ).select_related("product").order_by("-created_at")),
+        ("stock: branch summary",
+         Stock.objects.filter(branch=branch).values("product__name")
+         .annotate(stock=Sum("quantity")).order_by("product__name")),
+        ("stock: product lookup",
+         Stock.objects.filter(product_id=product.id, branch_id=product.branch_id).values_list("quantity", flat=True)),
+        ("stock as of: replay since snapshot",
+         StockMovement.objects.filter(branch_id=branch.id, created_at__gte=week_start, created_at__lt=day_start)
+         .values("product_id").annotate(delta=Sum("quantity")).order_by()),
+        ("stock as of: latest snapshot",
+         StockSnapshot.objects.filter(branch_id__in=[branch.id], taken_at__lte=now)
+         .values("branch_id").annotate(latest=Max("taken_at")).order_by()),
+    ]
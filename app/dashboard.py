@@ -0,0 +1,198 @@
+"""
+Cached dashboard counters for the index view and the admin account table.
+
+Numbers are cached per scope (global, account, branch) under versioned
+keys. Writes to the models behind them replace the scope's version token
+(see app.signals), so stale entries are never read again and a cache hit
+costs no database query.
+"""
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, DecimalField, F, Q, Sum
+from django.utils import timezone
+
+from . import sharding
+from .models import KIGALI_TZ, Account, Branch, DailySalesRollup, Product, Stock, UserInfo
+
+CACHE_PREFIX = "dashboard"
+
+
+def _version(scope):
+    key = f"{CACHE_PREFIX}:version:{scope}"
+    version = cache.get(key)
+    if version is None:
+        cache.add(key, uuid.uuid4().hex, None)
+        version = cache.get(key)
+    return version
+
+
+def _cached(scope, compute):
+    key = f"{CACHE_PREFIX}:{scope}:{_version(scope)}"
+    metrics = cache.get(key)
+    if metrics is None:
+        metrics = compute()
+        cache.set(key, metrics, settings.DASHBOARD_CACHE_TIMEOUT)
+    return metrics
+
+
+def invalidate(account_id=None, branch_id=None, using=None):
+    """
+    Give the global scope and the given account/branch scopes a new version
+    once the current transaction on ``using`` commits.
+    """
+    scopes = ["global"]
+    if account_id:
+        scopes.append(f"account:{account_id}")
+    if branch_id:
+        scopes.append(f"branch:{branch_id}")
+
+    def bump():
+        cache.set_many({f"{CACHE_PREFIX}:version:{scope}": uuid.uuid4().hex for scope in scopes}, None)
+
+    transaction.on_commit(bump, using=using)
+
+
+# -------------------- Scopes --------------------
+def global_metrics():
+    def count():
+        return {
+            'total_accounts': Account.objects.count(),
+            'total_users': UserInfo.objects.count(),
+            'total_branches': Branch.objects.count(),
+            'total_products': Product.objects.count(),
+            'total_stock': Stock.objects.aggregate(total=Sum('quantity'))['total'] or 0,
+            'total_profit': DailySalesRollup.objects.aggregate(total=Sum('profit'))['total'] or 0,
+        }
+
+    def compute():
+        totals = {}
+        for _, metrics in sharding.fan_out(count):
+            for name, value in metrics.items():
+                totals[name] = totals.get(name, 0) + value
+        return totals
+    return _cached("global", compute)
+
+
+def account_metrics(account_id):
+    def compute():
+        return {
+            'total_branches': Branch.objects.filter(account_id=account_id).count(),
+            'total_staff': UserInfo.objects.filter(account_id=account_id, role='staff').count(),
+            'total_products': Product.objects.filter(account_id=account_id).count(),
+            'total_stock': Stock.objects.filter(branch__account_id=account_id).aggregate(total=Sum('quantity'))['total'] or 0,
+            'total_profit': DailySalesRollup.objects.filter(branch__account_id=account_id).aggregate(total=Sum('profit'))['total'] or 0,
+        }
+    return _cached(f"account:{account_id}", compute)
+
+
+def branch_metrics(branch_id):
+    def compute():
+        branch = Branch.objects.filter(id=branch_id).values_list('branch_name', flat=True).first()
+        return {
+            'branch_name': branch or "N/A",
+            'total_products': Product.objects.filter(branch_id=branch_id).count(),
+            'total_stock': Stock.objects.filter(branch_id=branch_id).aggregate(total=Sum('quantity'))['total'] or 0,
+            'total_profit': DailySalesRollup.objects.filter(branch_id=branch_id).aggregate(total=Sum('profit'))['total'] or 0,
+        }
+    return _cached(f"branch:{branch_id}", compute)
+
+
+# -------------------- Account statistics --------------------
+ACCOUNT_STATS = (
+    'total_users', 'managers_count', 'staff_count', 'branches_count',
+    'products_count', 'stock_value', 'monthly_sales',
+)
+
+
+def _compute_account_stats(account_ids, month_start):
+    """
+    One grouped query per metric, merged per account. Joining all the
+    relations in a single query would multiply rows (users x products x
+    movements) and inflate the counts.
+    """
+    stats = {account_id: dict.fromkeys(ACCOUNT_STATS, 0) for account_id in account_ids}
+
+    for row in (
+        UserInfo.objects.filter(account_id__in=account_ids)
+        .values('account_id')
+        .annotate(
+            total=Count('id'),
+            managers=Count('id', filter=Q(role='manager')),
+            staff=Count('id', filter=Q(role='staff')),
+        )
+        .order_by()
+    ):
+        stats[row['account_id']].update(
+            total_users=row['total'], managers_count=row['managers'], staff_count=row['staff']
+        )
+
+    counts = (
+        ('branches_count', Branch.objects.filter(account_id__in=account_ids).values('account_id')),
+        ('products_count', Product.objects.filter(account_id__in=account_ids).values('account_id')),
+    )
+    for metric, queryset in counts:
+        for row in queryset.annotate(total=Count('id')).order_by():
+            stats[row['account_id']][metric] = row['total']
+
+    for row in (
+        Stock.objects.filter(product__account_id__in=account_ids)
+        .values('product__account_id')
+        .annotate(total=Sum(
+            F('quantity') * F('product__cost_price'),
+            output_field=DecimalField(max_digits=14, decimal_places=2),
+        ))
+        .order_by()
+    ):
+        stats[row['product__account_id']]['stock_value'] = row['total'] or 0
+
+    for row in (
+        DailySalesRollup.objects.filter(branch__account_id__in=account_ids, day__gte=month_start)
+        .values('branch__account_id')
+        .annotate(total=Sum('sales_amount'))
+        .order_by()
+    ):
+        stats[row['branch__account_id']]['monthly_sales'] = row['total'] or 0
+
+    return stats
+
+
+def account_stats(accounts):
+    """
+    Attach the ACCOUNT_STATS numbers to each account, served from the
+    per-account cache and computing only the accounts that missed.
+    """
+    accounts = list(accounts)
+    month_start = timezone.now().astimezone(KIGALI_TZ).date().replace(day=1)
+
+    version_keys = {account.id: f"{CACHE_PREFIX}:version:account:{account.id}" for account in accounts}
+    versions = cache.get_many(version_keys.values())
+
+    keys = {}
+    for account in accounts:
+        version = versions.get(version_keys[account.id]) or _version(f"account:{account.id}")
+        keys[account.id] = f"{CACHE_PREFIX}:stats:{account.id}:{month_start}:{version}"
+
+    cached = cache.get_many(keys.values())
+    stats = {account_id: cached[key] for account_id, key in keys.items() if key in cached}
+
+    missing = [account for account in accounts if account.id not in stats]
+    if missing:
+        by_shard = {}
+        for account in missing:
+            by_shard.setdefault(account._state.db, []).append(account)
+
+        computed = {}
+        for shard_accounts in by_shard.values():
+            with sharding.use_shard_of(shard_accounts[0]):
+                computed.update(_compute_account_stats([account.id for account in shard_accounts], month_start))
+        cache.set_many({keys[account_id]: values for account_id, values in computed.items()}, settings.DASHBOARD_CACHE_TIMEOUT)
+        stats.update(computed)
+
+    for account in accounts:
+        for metric, value in stats[account.id].items():
+            setattr(account, metric, value)
+
+    return accounts
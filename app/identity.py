@@ -0,0 +1,96 @@
+"""
+Who is making the request, resolved once per request.
+
+``IdentityMiddleware`` attaches ``request.identity`` lazily. The resolved
+identity is cached per user, and app.signals drops the entry when the
+user, their account or their branch changes.
+"""
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from .models import AdminInfo, Branch, UserInfo
+
+CACHE_PREFIX = "identity"
+
+
+class Identity:
+    """
+    Role plus the admin or user, account and branch behind a session.
+    For managers ``branch`` is the branch they manage; for staff, the one
+    they are assigned to.
+    """
+    def __init__(self, role=None, admin=None, user=None, account=None, branch=None):
+        self.role = role
+        self.admin = admin
+        self.user = user
+        self.account = account
+        self.branch = branch
+
+    @property
+    def is_authenticated(self):
+        return self.admin is not None or self.user is not None
+
+    @property
+    def person(self):
+        return self.admin or self.user
+
+
+ANONYMOUS = Identity()
+
+
+def _admin_key(admin_id):
+    return f"{CACHE_PREFIX}:admin:{admin_id}"
+
+
+def _user_key(user_id):
+    return f"{CACHE_PREFIX}:user:{user_id}"
+
+
+def _load_admin(admin_id):
+    admin = AdminInfo.objects.defer('password').filter(id=admin_id).first()
+    return Identity(role='admin', admin=admin) if admin else None
+
+
+def _load_user(user_id):
+    user = (
+        UserInfo.objects.select_related('account', 'branch')
+        .defer('password')
+        .filter(id=user_id)
+        .first()
+    )
+    if not user:
+        return None
+
+    branch = user.branch
+    if user.role == 'manager':
+        branch = Branch.objects.filter(manager=user).first()
+
+    return Identity(role=user.role, user=user, account=user.account, branch=branch)
+
+
+def resolve(request):
+    """
+    Identity for the request's session, from cache when possible.
+    """
+    if request.session.get('admin_id'):
+        key, load, pk = _admin_key, _load_admin, request.session['admin_id']
+    elif request.session.get('user_id'):
+        key, load, pk = _user_key, _load_user, request.session['user_id']
+    else:
+        return ANONYMOUS
+
+    identity = cache.get(key(pk))
+    if identity is None:
+        identity = load(pk)
+        if identity is None:
+            return ANONYMOUS
+        cache.set(key(pk), identity, settings.IDENTITY_CACHE_TIMEOUT)
+
+    return identity
+
+
+def invalidate(user_ids=(), admin_ids=(), using=None):
+    keys = [_user_key(pk) for pk in user_ids] + [_admin_key(pk) for pk in admin_ids]
+    if keys:
+        transaction.on_commit(lambda: cache.delete_many(keys), using=using)
@@ -0,0 +1,224 @@
+"""
+Bulk import of stock movements (goods receipts) from CSV or JSON files.
+
+Rows are parsed as a stream and saved in chunks through
+``StockMovement.objects.record_many``: stock changes once per
+(product, branch) per chunk and rows go in with ``bulk_create``.
+A bad row is reported with its line number and skipped. Sales are
+checked against stock in file order, as if the rows were saved one by
+one, so chunking never changes which rows are accepted. A file that
+stops being readable keeps the rows imported before that point.
+"""
+import csv
+import json
+from decimal import Decimal, InvalidOperation
+
+from django.core.exceptions import ValidationError
+
+from .models import Stock, StockMovement
+
+CHUNK_SIZE = 20000
+READ_SIZE = 64 * 1024
+
+
+# -------------------- Parsing --------------------
+def iter_csv(stream):
+    """
+    Yield ``(line_number, row)`` from a CSV text stream with a header row.
+    """
+    reader = csv.DictReader(stream)
+    for row in reader:
+        yield reader.line_num, row
+
+
+def iter_json(stream):
+    """
+    Yield ``(index, row)`` from a JSON array of objects or JSON Lines,
+    decoding one object at a time instead of loading the whole file.
+    """
+    decoder = json.JSONDecoder()
+    buffer = ""
+    pos = 0
+    index = 0
+    eof = False
+
+    while True:
+        while pos < len(buffer) and buffer[pos] in " \t\r\n,[]":
+            pos += 1
+
+        if pos >= len(buffer):
+            if eof:
+                return
+            chunk = stream.read(READ_SIZE)
+            eof = not chunk
+            buffer, pos = chunk, 0
+            continue
+
+        try:
+            row, end = decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            if eof:
+                raise ValueError(f"Invalid JSON near row {index + 1}.")
+            chunk = stream.read(READ_SIZE)
+            eof = not chunk
+            buffer, pos = buffer[pos:] + chunk, 0
+            continue
+
+        index += 1
+        pos = end
+        yield index, row
+
+
+def iter_rows(stream, filename):
+    if filename.lower().endswith((".json", ".jsonl", ".ndjson")):
+        return iter_json(stream)
+    return iter_csv(stream)
+
+
+# -------------------- Lookups --------------------
+def build_lookup(products, branches):
+    """
+    Preload products and branches once and index them by ID and by name.
+
+    Product names are only unique per branch, so a bare name resolves
+    only when it is unambiguous.
+    """
+    branch_map = {}
+    for branch in branches:
+        branch_map[str(branch.id)] = branch
+        branch_map[branch.branch_name.strip().lower()] = branch
+
+    product_map = {}
+    for product in products:
+        name = product.name.strip().lower()
+        product_map[str(product.id)] = product
+        product_map[(product.branch_id, name)] = product
+        product_map[name] = None if name in product_map else product
+
+    return product_map, branch_map
+
+
+def _resolve(row, product_map, branch_map, default_branch, created_by):
+    if not isinstance(row, dict):
+        raise ValidationError("Row must be an object.")
+
+    row = {key.strip().lower(): (str(value).strip() if value is not None else "") for key, value in row.items() if key}
+
+    branch_key = row.get("branch", "").lower()
+    branch = branch_map.get(branch_key) if branch_key else default_branch
+    if not branch:
+        raise ValidationError(f"Unknown branch '{row.get('branch', '')}'.")
+
+    product_key = row.get("product", "").lower()
+    product = (
+        product_map.get(product_key)
+        if product_key.isdigit()
+        else product_map.get((branch.id, product_key)) or product_map.get(product_key)
+    )
+    if not product:
+        raise ValidationError(f"Unknown product '{row.get('product', '')}'.")
+
+    movement_type = (row.get("movement_type") or "IN").upper()
+    if movement_type not in dict(StockMovement.MOVEMENT_CHOICES):
+        raise ValidationError(f"Invalid movement type '{movement_type}'.")
+
+    try:
+        quantity = int(row.get("quantity", ""))
+    except ValueError:
+        raise ValidationError("Quantity must be a whole number.")
+    if quantity <= 0:
+        raise ValidationError("Quantity must be positive.")
+
+    selling_amount = row.get("selling_amount") or None
+    if selling_amount is not None:
+        try:
+            selling_amount = Decimal(selling_amount)
+        except InvalidOperation:
+            raise ValidationError(f"Invalid selling amount '{selling_amount}'.")
+        if not selling_amount.is_finite() or selling_amount < 0:
+            raise ValidationError(f"Invalid selling amount '{selling_amount}'.")
+
+    payment_method = (row.get("payment_method") or "").lower() or None
+    if payment_method and payment_method not in dict(StockMovement.PAYMENT_CHOICES):
+        raise ValidationError(f"Invalid payment method '{payment_method}'.")
+
+    return StockMovement(
+        product=product,
+        branch=branch,
+        movement_type=movement_type,
+        quantity=quantity,
+        selling_amount=selling_amount,
+        payment_method=payment_method,
+        notes=row.get("notes") or "",
+        created_by=created_by,
+    )
+
+
+# -------------------- Import --------------------
+def _check_stock(chunk, errors):
+    """
+    Reject the rows that would take stock below zero at their place in the
+    file and return the rest.
+    """
+    running = Stock.objects.quantities({(m.product_id, m.branch_id) for _, m in chunk})
+    kept = []
+    for line, movement in chunk:
+        key = (movement.product_id, movement.branch_id)
+        available = running.get(key, 0)
+        if available + movement.stock_delta < 0:
+            errors.append((line, f"Cannot sell {movement.quantity} units of {movement.product.name}. Only {available} available."))
+            continue
+        running[key] = available + movement.stock_delta
+        kept.append((line, movement))
+    return kept
+
+
+def _save_chunk(chunk, errors):
+    """
+    Save one chunk. If stock changed since the check (another writer),
+    save each half separately so only the rows that no longer fit are
+    rejected.
+    """
+    try:
+        StockMovement.objects.record_many([movement for _, movement in chunk])
+        return len(chunk)
+    except ValidationError as e:
+        if len(chunk) == 1:
+            errors.append((chunk[0][0], " ".join(e.messages)))
+            return 0
+
+    middle = len(chunk) // 2
+    return _save_chunk(chunk[:middle], errors) + _save_chunk(chunk[middle:], errors)
+
+
+def import_movements(rows, products, branches, default_branch=None, created_by=None, chunk_size=CHUNK_SIZE):
+    """
+    Import ``(line, row)`` pairs and return ``(imported_count, errors)``
+    where ``errors`` is a list of ``(line, message)``. A file that cannot
+    be read further adds a line 0 error; rows before it are still saved.
+    """
+    product_map, branch_map = build_lookup(products, branches)
+    imported = 0
+    errors = []
+    chunk = []
+
+    try:
+        for line, row in rows:
+            try:
+                movement = _resolve(row, product_map, branch_map, default_branch, created_by)
+                movement.clean()
+            except ValidationError as e:
+                errors.append((line, " ".join(e.messages)))
+                continue
+
+            chunk.append((line, movement))
+            if len(chunk) >= chunk_size:
+                imported += _save_chunk(_check_stock(chunk, errors), errors)
+                chunk = []
+    except (ValueError, csv.Error) as e:
+        errors.append((0, f"Could not read file: {e}"))
+
+    if chunk:
+        imported += _save_chunk(_check_stock(chunk, errors), errors)
+
+    return imported, errors
@@ -0,0 +1,105 @@
+"""
+Per-request timings: SQL (count, time, slowest statements), template
+rendering and total time.
+
+``RequestTimingMiddleware`` keeps a ``RequestMetrics`` in a context
+variable for the duration of the request; ``TimedDjangoTemplates`` adds
+render time to it. Nothing is collected outside a request.
+"""
+import heapq
+import json
+import logging
+import time
+from contextvars import ContextVar
+
+from django.template.backends.django import DjangoTemplates, Template
+
+slow_log = logging.getLogger("app.slow_requests")
+
+current = ContextVar("request_metrics", default=None)
+
+
+class RequestMetrics:
+    def __init__(self, top_sql):
+        self.started = time.perf_counter()
+        self.queries = 0
+        self.db_time = 0.0
+        self.template_time = 0.0
+        self.top_sql = top_sql
+        self._slowest = []
+
+    def record_query(self, sql, duration):
+        self.queries += 1
+        self.db_time += duration
+        if self.top_sql:
+            entry = (duration, self.queries, sql)
+            if len(self._slowest) < self.top_sql:
+                heapq.heappush(self._slowest, entry)
+            elif duration > self._slowest[0][0]:
+                heapq.heapreplace(self._slowest, entry)
+
+    def slowest(self):
+        return [
+            {"ms": round(duration * 1000, 2), "sql": sql}
+            for duration, _, sql in sorted(self._slowest, reverse=True)
+        ]
+
+    def execute_wrapper(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.record_query(sql, time.perf_counter() - started)
+
+    def server_timing(self, total):
+        app_time = max(total - self.db_time - self.template_time, 0)
+        return ", ".join([
+            f'db;dur={self.db_time * 1000:.1f};desc="{self.queries} queries"',
+            f"tpl;dur={self.template_time * 1000:.1f}",
+            f"app;dur={app_time * 1000:.1f}",
+            f"total;dur={total * 1000:.1f}",
+        ])
+
+
+def log_slow_request(request, response, metrics, total):
+    match = getattr(request, "resolver_match", None)
+    session = getattr(request, "session", None)
+    slow_log.warning(json.dumps({
+        "method": request.method,
+        "path": request.path,
+        "status": response.status_code,
+        "view": match.view_name if match else None,
+        "role": session.get("role") if session is not None else None,
+        "account_id": session.get("account_id") if session is not None else None,
+        "total_ms": round(total * 1000, 1),
+        "db_ms": round(metrics.db_time * 1000, 1),
+        "template_ms": round(metrics.template_time * 1000, 1),
+        "queries": metrics.queries,
+        "slowest_sql": metrics.slowest(),
+    }))
+
+
+# -------------------- Templates --------------------
+class TimedTemplate(Template):
+    def render(self, context=None, request=None):
+        metrics = current.get()
+        if metrics is None:
+            return super().render(context, request)
+
+        started = time.perf_counter()
+        try:
+            return super().render(context, request)
+        finally:
+            metrics.template_time += time.perf_counter() - started
+
+
+class TimedDjangoTemplates(DjangoTemplates):
+    """
+    The Django template backend, adding render time to the current request's metrics.
+    """
+    def from_string(self, template_code):
+        return TimedTemplate(self.engine.from_string(template_code), self)
+
+    def get_template(self, template_name):
+        template = super().get_template(template_name)
+        return TimedTemplate(template.template, self)
@@ -0,0 +1,144 @@
+"""
+A small database-backed job queue for slow side effects (email, stock
+checkpoints, rollup rebuilds, cleanups), so request handlers do not wait
+on them.
+
+``enqueue("send_email", ...)`` inserts a Job row in the caller's
+transaction; ``manage.py run_worker`` claims due jobs and runs the task
+registered under that name. Failures are retried with exponential backoff
+(``JOB_RETRY_DELAY`` seconds, doubled per attempt) and, after
+``JOB_MAX_ATTEMPTS`` tries, moved to the FailedJob dead-letter table.
+With ``JOBS_EAGER`` tasks run inline instead (tests, local development).
+"""
+import logging
+import traceback
+from datetime import datetime, timedelta
+
+from django.conf import settings
+from django.core.mail import send_mail
+from django.core.management import call_command
+from django.db import transaction
+from django.utils import timezone
+
+from . import sharding
+from .models import FailedJob, Job, PasswordResetOTP, StockSnapshot
+
+logger = logging.getLogger(__name__)
+
+TASKS = {}
+
+# Management commands the "command" task may run.
+COMMANDS = ("rebuild_rollups", "snapshot_stock", "clear_expired_sessions")
+
+
+def task(name):
+    def register(func):
+        TASKS[name] = func
+        return func
+    return register
+
+
+def enqueue(name, delay=0, max_attempts=None, **payload):
+    """
+    Queue task ``name`` with keyword arguments ``payload`` (JSON-serialisable)
+    to run ``delay`` seconds from now.
+    """
+    if name not in TASKS:
+        raise ValueError(f"Unknown task: {name}")
+
+    if settings.JOBS_EAGER:
+        TASKS[name](**payload)
+        return None
+
+    return Job.objects.create(
+        task=name,
+        payload=payload,
+        max_attempts=max_attempts or settings.JOB_MAX_ATTEMPTS,
+        run_at=timezone.now() + timedelta(seconds=delay),
+    )
+
+
+def run(job):
+    """
+    Run a claimed job. Returns True on success, False if it failed (and was
+    rescheduled or dead-lettered).
+    """
+    try:
+        TASKS[job.task](**job.payload)
+    except Exception:
+        fail(job, traceback.format_exc())
+        return False
+
+    job.delete()
+    return True
+
+
+def fail(job, error):
+    job.attempts += 1
+    job.last_error = error
+
+    if job.attempts >= job.max_attempts:
+        logger.error("Job %s failed %s times; moved to FailedJob.\n%s", job, job.attempts, error)
+        with transaction.atomic():
+            FailedJob.objects.create(
+                task=job.task, payload=job.payload, attempts=job.attempts,
+                error=error, created_at=job.created_at,
+            )
+            job.delete()
+        return
+
+    delay = settings.JOB_RETRY_DELAY * 2 ** (job.attempts - 1)
+    logger.warning("Job %s failed; retrying in %ss.\n%s", job, delay, error)
+    job.run_at = timezone.now() + timedelta(seconds=delay)
+    job.locked_at = None
+    job.locked_by = ''
+    job.save(update_fields=['attempts', 'last_error', 'run_at', 'locked_at', 'locked_by'])
+
+
+def retry_failed(ids=None):
+    """
+    Move dead letters (all, or those in ``ids``) back onto the queue.
+    """
+    failed = FailedJob.objects.all()
+    if ids:
+        failed = failed.filter(id__in=ids)
+
+    with transaction.atomic():
+        jobs = Job.objects.bulk_create([
+            Job(task=f.task, payload=f.payload, max_attempts=settings.JOB_MAX_ATTEMPTS) for f in failed
+        ])
+        failed.delete()
+    return len(jobs)
+
+
+# -------------------- Tasks --------------------
+@task("send_email")
+def send_email(subject, message, recipients, from_email=None):
+    send_mail(subject, message, from_email or settings.DEFAULT_FROM_EMAIL, recipients)
+
+
+@task("command")
+def run_command(command, args=(), options=None):
+    if command not in COMMANDS:
+        raise ValueError(f"Command {command} may not run as a job.")
+    call_command(command, *args, **(options or {}))
+
+
+@task("purge_otps")
+def purge_otps():
+    PasswordResetOTP.objects.filter(created_at__lt=timezone.now() - timedelta(minutes=10)).delete()
+
+
+@task("refresh_snapshots")
+def refresh_snapshots(alias, branch_ids, moments):
+    # Retake the checkpoints a back-dated edit dropped, oldest first so each
+    # builds on the one before.
+    with sharding.use_shard(alias):
+        for moment in sorted(moments):
+            StockSnapshot.objects.take(branch_ids, datetime.fromisoformat(moment))
+
+
+@task("compact_snapshots")
+def compact_snapshots():
+    before = timezone.now() - timedelta(days=settings.SNAPSHOT_KEEP_DAYS)
+    sharding.fan_out(lambda: StockSnapshot.objects.compact(before))
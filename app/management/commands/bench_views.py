@@ -0,0 +1,162 @@
+import json
+import statistics
+import subprocess
+import time
+import tracemalloc
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, connections, transaction
+from django.test import Client
+from django.test.utils import setup_test_environment, teardown_test_environment
+from django.urls import reverse
+
+from app.bench import PASSWORD, VIEWS, seed
+from app.models import AdminInfo, UserInfo
+
+
+class Command(BaseCommand):
+    help = (
+        "Request every main view through the test client as admin, manager and staff and print "
+        "p50/p95 latency, query count and peak memory per view as JSON. Uses the latest seed_bench "
+        "data, or --fresh to seed a throwaway dataset that is rolled back afterwards."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--repeat", type=int, default=20, help="Timed requests per view.")
+        parser.add_argument("--output", help="Write the JSON report to this file instead of stdout.")
+        parser.add_argument("--fresh", action="store_true", help="Seed a dataset just for this run.")
+        parser.add_argument("--movements", type=int, default=20000, help="Movements to seed with --fresh.")
+        parser.add_argument("--seed", type=int, default=0, help="Random seed for --fresh.")
+
+    def handle(self, *args, **options):
+        if options["repeat"] < 1:
+            raise CommandError("--repeat must be at least 1.")
+
+        connect = self._connect_timings(options["repeat"])
+
+        setup_test_environment()
+        try:
+            with transaction.atomic():
+                if options["fresh"]:
+                    seed(movements=options["movements"], seed=options["seed"])
+                people = self._bench_people()
+                results = self._run(people, options["repeat"])
+                transaction.set_rollback(True)
+        finally:
+            teardown_test_environment()
+
+        report = json.dumps({
+            "commit": self._commit(),
+            "database": connection.vendor,
+            "connection": {
+                "conn_max_age": connection.settings_dict["CONN_MAX_AGE"],
+                "health_checks": connection.settings_dict["CONN_HEALTH_CHECKS"],
+                "pool": bool(connection.settings_dict["OPTIONS"].get("pool")),
+                "connect_p50_ms": round(statistics.median(connect), 2),
+                "connect_p95_ms": round(self._percentile(connect, 95), 2),
+            },
+            "repeat": options["repeat"],
+            "results": results,
+        }, indent=2)
+
+        if options["output"]:
+            with open(options["output"], "w") as f:
+                f.write(report + "\n")
+            self.stderr.write(f"Wrote {options['output']}")
+        else:
+            self.stdout.write(report)
+
+    @staticmethod
+    def _connect_timings(repeat):
+        # What a request pays when it cannot reuse a connection. The test
+        # client never closes connections, so the view timings exclude it.
+        timings = []
+        for _ in range(repeat):
+            fresh = connections.create_connection("default")
+            started = time.perf_counter()
+            fresh.ensure_connection()
+            timings.append((time.perf_counter() - started) * 1000)
+            fresh.close()
+        return timings
+
+    def _bench_people(self):
+        admin = AdminInfo.objects.filter(email__startswith="bench-", email__endswith="-admin@example.com").order_by("-id").first()
+        if not admin:
+            raise CommandError("No benchmark data found. Run seed_bench first or pass --fresh.")
+        tag = admin.email.split("-")[1]
+
+        manager = UserInfo.objects.filter(email__startswith=f"bench-{tag}-", role="manager").order_by("id").first()
+        staff = UserInfo.objects.filter(email__startswith=f"bench-{tag}-", role="staff").order_by("id").first()
+        return {"admin": ("admin", admin), "manager": ("user", manager), "staff": ("user", staff)}
+
+    def _login(self, user_type, person):
+        client = Client()
+        response = client.post(reverse("login_view"), {
+            "user_type": user_type, "email": person.email, "password": PASSWORD,
+        })
+        if response.status_code != 302:
+            raise CommandError(f"Could not log in as {person.email}.")
+        return client
+
+    def _run(self, people, repeat):
+        results = {}
+        for role, (user_type, person) in people.items():
+            if person is None:
+                continue
+            client = self._login(user_type, person)
+
+            for view, url_name, roles in VIEWS:
+                if role not in roles:
+                    continue
+                url = reverse(url_name)
+                client.get(url)  # warm caches and templates
+
+                timings = []
+                for _ in range(repeat):
+                    started = time.perf_counter()
+                    response = client.get(url)
+                    timings.append((time.perf_counter() - started) * 1000)
+
+                # CaptureQueriesContext loses queries when reset_queries runs on request_started.
+                queries = []
+                with connection.execute_wrapper(self._counter(queries)):
+                    client.get(url)
+
+                tracemalloc.start()
+                client.get(url)
+                peak = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+
+                results[f"{role}:{view}"] = {
+                    "url": url,
+                    "status": response.status_code,
+                    "p50_ms": round(statistics.median(timings), 2),
+                    "p95_ms": round(self._percentile(timings, 95), 2),
+                    "queries": len(queries),
+                    "peak_memory_kb": round(peak / 1024, 1),
+                }
+        return results
+
+    @staticmethod
+    def _counter(queries):
+        def wrapper(execute, sql, params, many, context):
+            queries.append(sql)
+            return execute(sql, params, many, context)
+        return wrapper
+
+    @staticmethod
+    def _percentile(values, percent):
+        ordered = sorted(values)
+        index = max(0, min(len(ordered) - 1, round(percent / 100 * len(ordered)) - 1))
+        return ordered[index]
+
+    @staticmethod
+    def _commit():
+        try:
+            return subprocess.run(
+                ["git", "rev-parse", "--short", "HEAD"], cwd=settings.BASE_DIR,
+                capture_output=True, text=True, check=True,
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
@@ -0,0 +1,100 @@
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections, transaction
+
+from app import sharding
+from app.bench import hot_queries, seed
+from app.models import StockMovement, StockSnapshot
+
+INDEXED_MODELS = (StockMovement, StockSnapshot)
+
+
+class Command(BaseCommand):
+    help = (
+        "Seed synthetic data and print the EXPLAIN plan and timing of each list view's main query, "
+        "first without and then with the indexes declared on the models. Everything is rolled back."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--accounts", type=int, default=2)
+        parser.add_argument("--branches", type=int, default=3, help="Branches per account.")
+        parser.add_argument("--products", type=int, default=50, help="Products per branch.")
+        parser.add_argument("--movements", type=int, default=20000)
+        parser.add_argument("--days", type=int, default=90, help="Spread movements over this many days.")
+        parser.add_argument("--repeat", type=int, default=5, help="Runs per query; the median is reported.")
+        parser.add_argument(
+            "--current-only", action="store_true",
+            help="Skip the run without indexes (implied on databases that cannot roll back DDL).",
+        )
+        parser.add_argument("--database", default="default", help="Shard to seed and measure on.")
+
+    def handle(self, *args, **options):
+        if options["repeat"] < 1:
+            raise CommandError("--repeat must be at least 1.")
+
+        alias = options["database"]
+        if alias not in sharding.aliases():
+            raise CommandError(f"Unknown database {alias!r}. Choose from: {', '.join(sharding.aliases())}.")
+        self.connection = connections[alias]
+        baseline = not options["current_only"] and self.connection.features.can_rollback_ddl
+
+        with sharding.use_shard(alias), transaction.atomic(using=alias):
+            self.stdout.write(f"Seeding {options['movements']} movements...")
+            data = seed(
+                accounts=options["accounts"], branches=options["branches"], products=options["products"],
+                movements=options["movements"], days=options["days"],
+            )
+            with self.connection.cursor() as cursor:
+                cursor.execute("ANALYZE")
+
+            results = {}
+            if baseline:
+                self._toggle_indexes("remove")
+                results["without indexes"] = self._measure(data, options["repeat"])
+                self._toggle_indexes("create")
+            results["with indexes"] = self._measure(data, options["repeat"])
+
+            transaction.set_rollback(True, using=alias)
+
+        self._report(results)
+
+    def _toggle_indexes(self, action):
+        connection = self.connection
+        editor = connection.schema_editor()
+        with connection.cursor() as cursor:
+            for model in INDEXED_MODELS:
+                for index in model._meta.indexes:
+                    if action == "remove":
+                        cursor.execute(f"DROP INDEX {connection.ops.quote_name(index.name)}")
+                    else:
+                        cursor.execute(str(index.create_sql(model, editor)))
+            cursor.execute("ANALYZE")
+
+    def _measure(self, data, repeat):
+        measured = {}
+        for label, queryset in hot_queries(data):
+            timings = []
+            for _ in range(repeat):
+                started = time.perf_counter()
+                list(queryset._chain())
+                timings.append((time.perf_counter() - started) * 1000)
+            measured[label] = (statistics.median(timings), queryset.explain())
+        return measured
+
+    def _report(self, results):
+        labels = next(iter(results.values()))
+        for label in labels:
+            self.stdout.write(self.style.MIGRATE_HEADING(f"\n== {label} =="))
+            for mode, measured in results.items():
+                ms, plan = measured[label]
+                self.stdout.write(f"{mode}: {ms:.2f} ms")
+                for line in plan.splitlines():
+                    self.stdout.write(f"    {line}")
+
+        self.stdout.write(self.style.MIGRATE_HEADING("\n== Summary (median ms) =="))
+        modes = list(results)
+        self.stdout.write("  ".join(f"{mode:>16}" for mode in modes) + "  query")
+        for label in labels:
+            self.stdout.write("  ".join(f"{results[mode][label][0]:>16.2f}" for mode in modes) + f"  {label}")
@@ -0,0 +1,63 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from app import sharding
+from app.importers import CHUNK_SIZE, import_movements, iter_rows
+from app.models import Account, Branch, Product, UserInfo
+
+
+class Command(BaseCommand):
+    help = "Import stock movements (goods receipts) for one account from a CSV or JSON file."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="CSV (with header) or JSON / JSON Lines file.")
+        parser.add_argument("--account", type=int, required=True, help="Account ID the rows belong to.")
+        parser.add_argument("--branch", help="Default branch ID or name for rows without one.")
+        parser.add_argument("--user", help="Email of the user recorded as creator.")
+        parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+
+    def handle(self, *args, **options):
+        if sharding.lookup(options["account"])[1]:
+            raise CommandError(f"Account {options['account']} is being moved to another shard; try again later.")
+        # The account's rows live on its shard.
+        with sharding.use_account_shard(options["account"]):
+            self._import(options)
+
+    def _import(self, options):
+        try:
+            account = Account.objects.get(id=options["account"])
+        except Account.DoesNotExist:
+            raise CommandError(f"Account {options['account']} does not exist.")
+
+        branches = list(Branch.objects.filter(account=account))
+        products = Product.objects.filter(account=account).only(
+            "id", "name", "branch_id", "account_id", "cost_price"
+        )
+
+        default_branch = None
+        if options["branch"]:
+            default_branch = next(
+                (b for b in branches if options["branch"] in (str(b.id), b.branch_name)), None
+            )
+            if not default_branch:
+                raise CommandError(f"Branch {options['branch']} not found in this account.")
+
+        created_by = None
+        if options["user"]:
+            created_by = UserInfo.objects.filter(account=account, email=options["user"]).first()
+            if not created_by:
+                raise CommandError(f"User {options['user']} not found in this account.")
+
+        with open(options["path"], newline="", encoding="utf-8-sig") as stream:
+            imported, errors = import_movements(
+                iter_rows(stream, options["path"]),
+                products,
+                branches,
+                default_branch=default_branch,
+                created_by=created_by,
+                chunk_size=options["chunk_size"],
+            )
+
+        for line, message in errors:
+            self.stderr.write(f"line {line}: {message}")
+
+        self.stdout.write(self.style.SUCCESS(f"Imported {imported} movements, {len(errors)} rows rejected."))
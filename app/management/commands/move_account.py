@@ -0,0 +1,185 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Max
+
+from app import dashboard, identity, sharding
+from app.models import (
+    Account, AccountShard, Branch, DailySalesRollup, Product, Stock, StockMovement,
+    StockMovementLog, StockSnapshot, UserInfo,
+)
+
+# Small or frequently updated tables, copied in full again at the end.
+# Listed parents first; deletes run in reverse.
+MUTABLE = (
+    (Account, "id"),
+    (UserInfo, "account_id"),
+    (Branch, "account_id"),
+    (Product, "account_id"),
+    (Stock, "branch__account_id"),
+    (StockSnapshot, "branch__account_id"),
+    (DailySalesRollup, "branch__account_id"),
+)
+
+
+class Command(BaseCommand):
+    help = (
+        "Move an account's rows (users, branches, products, stock, movements, logs, snapshots, "
+        "rollups) to another shard while it keeps trading. History is copied first; writes are "
+        "refused (HTTP 503) only while the last changes are copied and the directory switches."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("account_id", type=int)
+        parser.add_argument("target", help="Database alias to move the account to.")
+        parser.add_argument("--batch-size", type=int, default=2000)
+
+    def handle(self, *args, **options):
+        account_id, target, self.batch_size = options["account_id"], options["target"], options["batch_size"]
+        if not settings.SHARDS:
+            raise CommandError("No shards configured; set SHARD_DATABASE_URLS.")
+        if target not in sharding.aliases():
+            raise CommandError(f"Unknown shard {target!r}. Shards: {', '.join(sharding.aliases())}.")
+
+        entry = AccountShard.objects.filter(account_id=account_id).first()
+        source = entry.alias if entry else "default"
+        if source == target:
+            raise CommandError(f"Account {account_id} is already on {target}.")
+        if not Account.objects.using(source).filter(id=account_id).exists():
+            raise CommandError(f"Account {account_id} not found on {source}.")
+
+        started = time.perf_counter()
+        try:
+            # Logs first: every log up to log_mark belongs to a movement up to movement_mark.
+            log_mark = self._max_id(StockMovementLog, source, "movement__account_id", account_id)
+            movement_mark = self._max_id(StockMovement, source, "account_id", account_id)
+            self.stdout.write(f"Copying account {account_id} from {source} to {target}...")
+            self._copy_history(account_id, source, target, movement_mark, log_mark)
+
+            self.stdout.write("Pausing writes for the final copy...")
+            self._set_directory(account_id, source, moving=True)
+            self._wait_for_workers()
+            self._catch_up(account_id, source, target, movement_mark, log_mark)
+        except BaseException:
+            self._set_directory(account_id, source, moving=False)
+            self._delete_account(target, account_id)
+            raise
+
+        self._set_directory(account_id, target, moving=True)
+        self._wait_for_workers()
+        self._set_directory(account_id, target, moving=False)
+        dashboard.invalidate(account_id=account_id)
+        with sharding.use_shard(target):
+            user_ids = list(UserInfo.objects.filter(account_id=account_id).values_list("id", flat=True))
+        identity.invalidate(user_ids=user_ids)
+        elapsed = time.perf_counter() - started
+
+        self.stdout.write(f"Removing account {account_id} from {source}...")
+        self._delete_account(source, account_id)
+        self.stdout.write(self.style.SUCCESS(f"Moved account {account_id} to {target} in {elapsed:.1f}s."))
+
+    # -------------------- Copying --------------------
+    def _rows(self, model, alias, lookup, account_id):
+        return model.objects.using(alias).filter(**{lookup: account_id})
+
+    def _max_id(self, model, alias, lookup, account_id):
+        return self._rows(model, alias, lookup, account_id).aggregate(top=Max("id"))["top"] or 0
+
+    def _upsert(self, model, target, rows):
+        fields = [field.name for field in model._meta.concrete_fields if not field.primary_key]
+        # bulk_create stamps auto_now/auto_now_add fields with now(); put the
+        # source values back afterwards (bulk_update leaves them as given).
+        stamped = [
+            field for field in model._meta.concrete_fields
+            if getattr(field, "auto_now", False) or getattr(field, "auto_now_add", False)
+        ]
+        original = [[getattr(row, field.attname) for field in stamped] for row in rows]
+
+        model.objects.using(target).bulk_create(
+            rows, batch_size=self.batch_size,
+            update_conflicts=True, unique_fields=["id"], update_fields=fields,
+        )
+        if stamped and rows:
+            for row, values in zip(rows, original):
+                for field, value in zip(stamped, values):
+                    setattr(row, field.attname, value)
+            model.objects.using(target).bulk_update(
+                rows, [field.name for field in stamped], batch_size=self.batch_size,
+            )
+
+    def _copy_in_batches(self, model, queryset, target):
+        last = 0
+        while True:
+            rows = list(queryset.filter(id__gt=last).order_by("id")[:self.batch_size])
+            if not rows:
+                return
+            with transaction.atomic(using=target):
+                self._upsert(model, target, rows)
+            last = rows[-1].id
+
+    def _copy_mutable(self, account_id, source, target):
+        for model, lookup in MUTABLE:
+            self._upsert(model, target, list(self._rows(model, source, lookup, account_id)))
+
+    def _copy_history(self, account_id, source, target, movement_mark, log_mark):
+        with transaction.atomic(using=target):
+            self._copy_mutable(account_id, source, target)
+        self._copy_in_batches(
+            StockMovement, self._rows(StockMovement, source, "account_id", account_id).filter(id__lte=movement_mark), target,
+        )
+        self._copy_in_batches(
+            StockMovementLog,
+            self._rows(StockMovementLog, source, "movement__account_id", account_id).filter(id__lte=log_mark), target,
+        )
+
+    def _catch_up(self, account_id, source, target, movement_mark, log_mark):
+        """
+        Copy what changed during the bulk copy. Movement edits always add a
+        log row, so logs past ``log_mark`` name the edited movements.
+        """
+        movements = self._rows(StockMovement, source, "account_id", account_id)
+        logs = self._rows(StockMovementLog, source, "movement__account_id", account_id)
+        new_logs = list(logs.filter(id__gt=log_mark))
+        changed = movements.filter(id__gt=movement_mark) | movements.filter(id__in={log.movement_id for log in new_logs})
+
+        copied = set(self._rows(StockMovement, target, "account_id", account_id).values_list("id", flat=True))
+        deleted = copied - set(movements.values_list("id", flat=True))
+
+        with transaction.atomic(using=target):
+            self._copy_mutable(account_id, source, target)
+            self._upsert(StockMovement, target, list(changed))
+            self._upsert(StockMovementLog, target, new_logs)
+
+            # Raw deletes: no cascades or signals, the source already did them.
+            StockMovementLog.objects.using(target).filter(movement_id__in=deleted)._raw_delete(target)
+            StockMovement.objects.using(target).filter(id__in=deleted)._raw_delete(target)
+            for model, lookup in reversed(MUTABLE):
+                kept = self._rows(model, source, lookup, account_id).values_list("id", flat=True)
+                self._rows(model, target, lookup, account_id).exclude(id__in=list(kept))._raw_delete(target)
+
+    # -------------------- Directory --------------------
+    def _set_directory(self, account_id, alias, moving):
+        AccountShard.objects.update_or_create(account_id=account_id, defaults={"alias": alias, "moving": moving})
+        sharding.forget(account_id)
+
+    def _wait_for_workers(self):
+        # Other processes may hold the old directory entry for this long.
+        time.sleep(settings.SHARD_CACHE_TIMEOUT + 1)
+
+    # -------------------- Cleanup --------------------
+    def _delete_account(self, alias, account_id):
+        movements = self._rows(StockMovement, alias, "account_id", account_id).order_by("id")
+        while True:
+            ids = list(movements.values_list("id", flat=True)[:self.batch_size])
+            if not ids:
+                break
+            with transaction.atomic(using=alias):
+                StockMovementLog.objects.using(alias).filter(movement_id__in=ids)._raw_delete(alias)
+                StockMovement.objects.using(alias).filter(id__in=ids)._raw_delete(alias)
+
+        with transaction.atomic(using=alias):
+            for model, lookup in reversed(MUTABLE):
+                ids = list(self._rows(model, alias, lookup, account_id).values_list("id", flat=True))
+                model.objects.using(alias).filter(id__in=ids)._raw_delete(alias)
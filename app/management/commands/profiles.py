@@ -0,0 +1,70 @@
+import io
+import pstats
+from collections import Counter
+from datetime import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+
+from app.profiling import profiles
+
+
+class Command(BaseCommand):
+    help = "List captured view profiles and summarise them (top cumulative functions or hottest frames)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("names", nargs="*", help="Profile file names to summarise. Defaults to the newest.")
+        parser.add_argument("--list", action="store_true", help="Only list the captured profiles.")
+        parser.add_argument("--limit", type=int, default=20, help="Functions to show per profile.")
+        parser.add_argument("--sort", default="cumulative", help="pstats sort key for .prof files.")
+        parser.add_argument("--dir", help="Profile directory. Defaults to PROFILE_DIR.")
+
+    def handle(self, *args, **options):
+        files = profiles(options["dir"])
+        if not files:
+            self.stdout.write("No profiles captured.")
+            return
+
+        if options["list"]:
+            for path in files:
+                stat = path.stat()
+                self.stdout.write(
+                    f"{datetime.fromtimestamp(stat.st_mtime):%Y-%m-%d %H:%M:%S}  {stat.st_size:>9}  {path.name}"
+                )
+            return
+
+        by_name = {path.name: path for path in files}
+        selected = [by_name.get(name) for name in options["names"]] if options["names"] else files[:1]
+        if None in selected:
+            missing = [name for name in options["names"] if name not in by_name]
+            raise CommandError(f"Unknown profile: {', '.join(missing)}")
+
+        for path in selected:
+            self.stdout.write(self.style.MIGRATE_HEADING(f"== {path.name} =="))
+            if path.suffix == ".prof":
+                self._summarise_prof(path, options["sort"], options["limit"])
+            else:
+                self._summarise_collapsed(path, options["limit"])
+
+    def _summarise_prof(self, path, sort, limit):
+        out = io.StringIO()
+        pstats.Stats(str(path), stream=out).strip_dirs().sort_stats(sort).print_stats(limit)
+        self.stdout.write(out.getvalue())
+
+    def _summarise_collapsed(self, path, limit):
+        own = Counter()
+        total = Counter()
+        samples = 0
+        with open(path) as f:
+            for line in f:
+                stack, _, count = line.rstrip("\n").rpartition(" ")
+                count = int(count)
+                frames = stack.split(";")
+                samples += count
+                own[frames[-1]] += count
+                for frame in set(frames):
+                    total[frame] += count
+
+        self.stdout.write(f"{samples} samples")
+        self.stdout.write(f"{'total %':>8} {'own %':>7}  function")
+        for frame, count in total.most_common(limit):
+            self.stdout.write(f"{count * 100 / samples:>8.1f} {own[frame] * 100 / samples:>7.1f}  {frame}")
@@ -0,0 +1,29 @@
+from datetime import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+
+from app import sharding
+from app.models import DailySalesRollup
+
+
+class Command(BaseCommand):
+    help = "Recompute DailySalesRollup rows from stock movements (backfill or repair)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--from", dest="date_from", help="First Kigali day to rebuild (YYYY-MM-DD).")
+        parser.add_argument("--to", dest="date_to", help="Last Kigali day to rebuild (YYYY-MM-DD).")
+        parser.add_argument("--branch", type=int, action="append", help="Branch ID (repeatable). Defaults to all.")
+
+    def handle(self, *args, **options):
+        try:
+            date_from, date_to = (
+                datetime.strptime(options[key], "%Y-%m-%d").date() if options[key] else None
+                for key in ("date_from", "date_to")
+            )
+        except ValueError:
+            raise CommandError("Dates must be YYYY-MM-DD.")
+
+        for alias, rows in sharding.fan_out(
+            lambda: DailySalesRollup.objects.rebuild(date_from, date_to, options["branch"])
+        ):
+            self.stdout.write(self.style.SUCCESS(f"Rebuilt {rows} daily sales rollup rows on {alias}."))
@@ -0,0 +1,65 @@
+import os
+import signal
+import socket
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections
+
+from app import jobs
+from app.models import Job
+
+
+class Command(BaseCommand):
+    help = (
+        "Run queued background jobs (emails, rollup rebuilds, cleanups). Keep one or more running "
+        "next to the web server; stop with SIGINT/SIGTERM after the current job."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--once", action="store_true", help="Run the jobs due now, then exit.")
+        parser.add_argument("--batch", type=int, default=10, help="Jobs to claim per poll.")
+        parser.add_argument("--sleep", type=float, default=1.0, help="Seconds to wait when the queue is empty.")
+        parser.add_argument("--retry-failed", action="store_true", help="Requeue every dead letter and exit.")
+
+    def handle(self, *args, **options):
+        if options["batch"] < 1:
+            raise CommandError("--batch must be at least 1.")
+
+        if options["retry_failed"]:
+            self.stdout.write(self.style.SUCCESS(f"Requeued {jobs.retry_failed()} failed jobs."))
+            return
+
+        worker = f"{socket.gethostname()}:{os.getpid()}"
+        self._stopping = False
+        signal.signal(signal.SIGTERM, self._stop)
+        signal.signal(signal.SIGINT, self._stop)
+
+        done = failed = 0
+        self.stdout.write(f"Worker {worker} started.")
+        while not self._stopping:
+            close_old_connections()
+            claimed = Job.objects.claim(worker, options["batch"], settings.JOB_LOCK_TIMEOUT)
+
+            for job in claimed:
+                if self._stopping:
+                    # Give the rest back rather than wait for the lock timeout.
+                    Job.objects.filter(id=job.id, locked_by=worker).update(locked_at=None, locked_by="")
+                    continue
+                job_id = job.id
+                if jobs.run(job):
+                    done += 1
+                else:
+                    failed += 1
+                    self.stderr.write(f"{job.task} #{job_id} failed (attempt {job.attempts}).")
+
+            if not claimed:
+                if options["once"]:
+                    break
+                time.sleep(options["sleep"])
+
+        self.stdout.write(f"Worker {worker} stopped: {done} jobs done, {failed} failed.")
+
+    def _stop(self, signum, frame):
+        self._stopping = True
@@ -0,0 +1,56 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from app import sharding
+from app.bench import BATCH_SIZE, PASSWORD, seed
+from app.models import AccountShard
+
+
+class Command(BaseCommand):
+    help = (
+        "Generate synthetic shops (accounts, branches, staff, products) and stock movements "
+        "at production-like volume for local benchmarking."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--accounts", type=int, default=2)
+        parser.add_argument("--branches", type=int, default=3, help="Branches per account.")
+        parser.add_argument("--products", type=int, default=50, help="Products per branch.")
+        parser.add_argument("--staff", type=int, default=2, help="Staff members per branch.")
+        parser.add_argument("--movements", type=int, default=100000, help="Total stock movements.")
+        parser.add_argument("--days", type=int, default=180, help="Spread movements over this many days.")
+        parser.add_argument("--seed", type=int, default=0, help="Random seed, for repeatable data.")
+        parser.add_argument("--batch-size", type=int, default=BATCH_SIZE)
+        parser.add_argument(
+            "--database", default="default", help="Shard to create the accounts on (see SHARD_DATABASE_URLS).",
+        )
+
+    def handle(self, *args, **options):
+        if min(options["accounts"], options["branches"], options["products"], options["days"]) < 1:
+            raise CommandError("--accounts, --branches, --products and --days must be at least 1.")
+        alias = options["database"]
+        if alias not in sharding.aliases():
+            raise CommandError(f"Unknown database {alias!r}. Choose from: {', '.join(sharding.aliases())}.")
+
+        started = time.perf_counter()
+        with sharding.use_shard(alias), transaction.atomic(using=alias):
+            data = seed(
+                accounts=options["accounts"], branches=options["branches"], products=options["products"],
+                staff=options["staff"], movements=options["movements"], days=options["days"],
+                seed=options["seed"], batch_size=options["batch_size"],
+            )
+        if alias != "default":
+            AccountShard.objects.bulk_create([AccountShard(account_id=a.id, alias=alias) for a in data["accounts"]])
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Seeded {len(data['accounts'])} accounts, {len(data['branches'])} branches, "
+            f"{len(data['products'])} products and {options['movements']} movements "
+            f"in {time.perf_counter() - started:.1f}s."
+        ))
+        self.stdout.write(f"Admin login: {data['admin'].email}")
+        self.stdout.write(f"Manager login: {data['managers'][0].email}")
+        if data["staff"]:
+            self.stdout.write(f"Staff login: {data['staff'][0].email}")
+        self.stdout.write(f"Password: {PASSWORD}")
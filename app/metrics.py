@@ -0,0 +1,224 @@
+"""
+In-process counters and histograms, rendered in the Prometheus text format
+by the ``/metrics`` view.
+
+Each gunicorn worker keeps its own numbers. When ``METRICS_DIR`` is set,
+every process also writes them to ``<METRICS_DIR>/<pid>.json`` (at most
+once per ``METRICS_FLUSH_INTERVAL`` seconds, from a timer so the last
+changes are written even if the worker goes quiet, and on exit) and
+``/metrics`` sums the files of all workers, including ones that have
+since exited.
+Empty the directory before starting the server.
+"""
+import atexit
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from pathlib import Path
+
+from django.conf import settings
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class Metric:
+    kind = None
+
+    def __init__(self, name, help, labels=()):
+        self.name = name
+        self.help = help
+        self.labels = tuple(labels)
+        self.values = {}
+
+    def _key(self, labels):
+        if set(labels) != set(self.labels):
+            raise ValueError(f"{self.name} expects labels {self.labels}, got {tuple(labels)}.")
+        return tuple(str(labels[name]) for name in self.labels)
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def __init__(self, name, help, labels=()):
+        super().__init__(name, help, labels)
+        if not self.labels:
+            self.values[()] = 0
+
+    def inc(self, amount=1, **labels):
+        key = self._key(labels)
+        with registry.lock:
+            self.values[key] = self.values.get(key, 0) + amount
+        registry.changed()
+
+    @staticmethod
+    def merge(total, value):
+        return (total or 0) + value
+
+    def samples(self, key, value):
+        yield self.name + "_total", key, value
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(self, name, help, labels=(), buckets=LATENCY_BUCKETS):
+        super().__init__(name, help, labels)
+        self.buckets = tuple(buckets)
+
+    def observe(self, value, **labels):
+        key = self._key(labels)
+        with registry.lock:
+            # Per-bucket (not cumulative) counts, then sum and count.
+            state = self.values.setdefault(key, [0] * (len(self.buckets) + 2))
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[i] += 1
+                    break
+            state[-2] += value
+            state[-1] += 1
+        registry.changed()
+
+    @staticmethod
+    def merge(total, value):
+        return [a + b for a, b in zip(total, value)] if total else list(value)
+
+    def samples(self, key, value):
+        cumulative = 0
+        for bound, count in zip(self.buckets, value):
+            cumulative += count
+            yield self.name + "_bucket", key + (("le", _format(bound)),), cumulative
+        yield self.name + "_bucket", key + (("le", "+Inf"),), value[-1]
+        yield self.name + "_sum", key, value[-2]
+        yield self.name + "_count", key, value[-1]
+
+
+class Registry:
+    def __init__(self):
+        self.metrics = {}
+        self.lock = threading.Lock()
+        self._flushed = 0.0
+        self._timer = None
+
+    def register(self, metric):
+        self.metrics[metric.name] = metric
+        return metric
+
+    def snapshot(self):
+        with self.lock:
+            return {
+                name: [[list(key), value] for key, value in metric.values.items()]
+                for name, metric in self.metrics.items()
+            }
+
+    # -------------------- Multiprocess --------------------
+    def changed(self):
+        if not settings.METRICS_DIR:
+            return
+        wait = settings.METRICS_FLUSH_INTERVAL - (time.monotonic() - self._flushed)
+        if wait <= 0:
+            self.flush()
+            return
+        with self.lock:
+            if self._timer is not None:
+                return
+            timer = self._timer = threading.Timer(wait, self.flush)
+            timer.daemon = True
+        timer.start()
+
+    def flush(self):
+        directory = settings.METRICS_DIR
+        if not directory:
+            return
+        self._flushed = time.monotonic()
+        with self.lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+        os.makedirs(directory, exist_ok=True)
+        path = Path(directory) / f"{os.getpid()}.json"
+        tmp = path.with_suffix(f".{threading.get_ident()}.tmp")
+        tmp.write_text(json.dumps(self.snapshot()))
+        os.replace(tmp, path)
+
+    def collect(self):
+        """
+        ``{name: {label values: value}}`` for this process, or summed over
+        every process's file when ``METRICS_DIR`` is set.
+        """
+        if not settings.METRICS_DIR:
+            snapshots = [self.snapshot()]
+        else:
+            self.flush()
+            snapshots = []
+            for path in Path(settings.METRICS_DIR).glob("*.json"):
+                try:
+                    snapshots.append(json.loads(path.read_text()))
+                except (OSError, ValueError):
+                    continue  # replaced or half-written mid-read
+
+        totals = defaultdict(dict)
+        for snapshot in snapshots:
+            for name, entries in snapshot.items():
+                metric = self.metrics.get(name)
+                if metric is None:
+                    continue
+                for key, value in entries:
+                    key = tuple(key)
+                    totals[name][key] = metric.merge(totals[name].get(key), value)
+        return totals
+
+    def render(self):
+        totals = self.collect()
+        lines = []
+        for name, metric in self.metrics.items():
+            lines.append(f"# HELP {name} {metric.help}")
+            lines.append(f"# TYPE {name} {metric.kind}")
+            for key, value in sorted(totals.get(name, {}).items()):
+                pairs = tuple(zip(metric.labels, key))
+                for sample, labels, number in metric.samples(pairs, value):
+                    lines.append(f"{sample}{_labels(labels)} {_format(number)}")
+        return "\n".join(lines) + "\n"
+
+
+def _labels(pairs):
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+def _escape(value):
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format(number):
+    return repr(float(number)) if isinstance(number, float) else str(number)
+
+
+registry = Registry()
+atexit.register(registry.flush)
+
+
+# -------------------- Metrics --------------------
+request_latency = registry.register(Histogram(
+    "http_request_duration_seconds", "Request latency by URL name.", ["view", "method"],
+))
+request_count = registry.register(Counter(
+    "http_requests", "Requests by URL name and status code.", ["view", "method", "status"],
+))
+movements_written = registry.register(Counter(
+    "stock_movements", "Stock movements written.", ["movement_type", "payment_method"],
+))
+stock_conflicts = registry.register(Counter(
+    "stock_adjust_conflicts", "Stock writes that lost a race with another writer.",
+))
+oversells_rejected = registry.register(Counter(
+    "stock_oversells_rejected", "Sales rejected for lack of stock.",
+))
+login_attempts = registry.register(Counter(
+    "login_attempts", "Login attempts by user type and result.", ["user_type", "result"],
+))
+otp_attempts = registry.register(Counter(
+    "otp_attempts", "Password reset OTP requests and verifications.", ["action", "result"],
+))
@@ -0,0 +1,157 @@
+import time
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.db import connections
+from django.http import HttpResponse
+from django.shortcuts import redirect
+from django.urls import reverse
+from django.utils.functional import SimpleLazyObject
+
+from . import profiling, routers, sharding
+from .identity import resolve
+from .instrumentation import RequestMetrics, current, log_slow_request
+from .metrics import request_count, request_latency
+
+
+class IdentityMiddleware:
+    """
+    Attach ``request.identity`` (role, admin/user, account, branch),
+    resolved on first use and cached across requests.
+    """
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        request.identity = SimpleLazyObject(lambda: resolve(request))
+        return self.get_response(request)
+
+
+class ShardMiddleware:
+    """
+    Route the request's tenant queries to the shard of the session's
+    account (see app.sharding). Writes to an account that is being moved
+    get a 503 asking the client to retry.
+    """
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not settings.SHARDS:
+            return self.get_response(request)
+
+        alias, moving = sharding.lookup(request.session.get("account_id"))
+        if moving and request.method not in ("GET", "HEAD", "OPTIONS"):
+            response = HttpResponse("This account is being moved. Please try again in a minute.", status=503)
+            response["Retry-After"] = str(settings.SHARD_CACHE_TIMEOUT * 2)
+            return response
+
+        with sharding.use_shard(alias if request.session.get("account_id") else None):
+            return self.get_response(request)
+
+
+class ReplicaMiddleware:
+    """
+    Track writes per session for read-replica routing (see app.routers).
+    Does nothing unless a replica database is configured.
+    """
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not routers.replica_configured():
+            return self.get_response(request)
+
+        state = routers.RequestRouting(pinned=routers.pinned(request.session))
+        token = routers.routing.set(state)
+        try:
+            response = self.get_response(request)
+        finally:
+            routers.routing.reset(token)
+
+        if state.wrote:
+            routers.mark_written(request.session)
+        return response
+
+
+class SessionExpiredMiddleware:
+    """
+    Send users whose login data vanished from their session back to the
+    login page with a "session expired" message.
+    """
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+
+        # If user was logged in but role/session is missing -> session expired
+        if request.session.get("was_logged_in") and not request.session.get("role"):
+
+            # Clear session
+            request.session.flush()
+
+            # Redirect to login with GET param
+            return redirect(reverse("login_view") + "?session_expired=1")
+
+        response = self.get_response(request)
+
+        # Mark user as logged in if role exists. Only the first time: any
+        # assignment marks the session modified and costs a session write.
+        if request.session.get("role") and not request.session.get("was_logged_in"):
+            request.session["was_logged_in"] = True
+
+        return response
+
+
+class RequestTimingMiddleware:
+    """
+    Time SQL, template rendering and the whole request. Adds a
+    ``Server-Timing`` header and logs requests slower than
+    ``SLOW_REQUEST_THRESHOLD_MS`` to the ``app.slow_requests`` logger.
+    Latency is also recorded per URL name in app.metrics.
+    Place it first so the time of the other middleware is included.
+    """
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        metrics = RequestMetrics(settings.SLOW_REQUEST_TOP_SQL)
+        token = current.set(metrics)
+        try:
+            with ExitStack() as stack:
+                for alias in connections:
+                    stack.enter_context(connections[alias].execute_wrapper(metrics.execute_wrapper))
+                response = self.get_response(request)
+        finally:
+            current.reset(token)
+
+        total = time.perf_counter() - metrics.started
+        if settings.SERVER_TIMING:
+            response["Server-Timing"] = metrics.server_timing(total)
+        if total * 1000 >= settings.SLOW_REQUEST_THRESHOLD_MS:
+            log_slow_request(request, response, metrics, total)
+
+        # URL names, not paths, keep the number of label values bounded.
+        match = getattr(request, "resolver_match", None)
+        view = match.url_name if match and match.url_name else "unmatched"
+        request_latency.observe(total, view=view, method=request.method)
+        request_count.inc(view=view, method=request.method, status=response.status_code)
+
+        return response
+
+
+class ProfilingMiddleware:
+    """
+    Run selected views under a profiler (see app.profiling). Place it last
+    so every other middleware's process_view runs before the view does.
+    """
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        return self.get_response(request)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if not profiling.wanted(request):
+            return None
+        return profiling.profile_view(request, view_func, view_args, view_kwargs)
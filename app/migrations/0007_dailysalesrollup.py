@@ -0,0 +1,70 @@
+# Generated by Django 5.2.18 on 2026-10-17 04:02
+
+from zoneinfo import ZoneInfo
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncDate
+
+
+def backfill_rollups(apps, schema_editor):
+    StockMovement = apps.get_model('app', 'StockMovement')
+    DailySalesRollup = apps.get_model('app', 'DailySalesRollup')
+
+    grouped = (
+        StockMovement.objects.filter(movement_type='OUT')
+        .annotate(day=TruncDate('created_at', tzinfo=ZoneInfo('Africa/Kigali')))
+        .values('day', 'branch_id', 'product_id', 'payment_method')
+        .annotate(
+            total_quantity=Sum('quantity'),
+            total_amount=Sum('selling_amount'),
+            total_profit=Sum('profit'),
+            total_count=Count('id'),
+        )
+        .order_by()
+    )
+    DailySalesRollup.objects.bulk_create(
+        [
+            DailySalesRollup(
+                day=row['day'],
+                branch_id=row['branch_id'],
+                product_id=row['product_id'],
+                payment_method=row['payment_method'] or '',
+                quantity=row['total_quantity'] or 0,
+                sales_amount=row['total_amount'] or 0,
+                profit=row['total_profit'] or 0,
+                count=row['total_count'],
+            )
+            for row in grouped.iterator()
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0006_stocksnapshot'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailySalesRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('payment_method', models.CharField(blank=True, default='', max_length=10)),
+                ('quantity', models.IntegerField(default=0)),
+                ('sales_amount', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('profit', models.DecimalField(decimal_places=2, default=0, max_digits=14)),
+                ('count', models.IntegerField(default=0)),
+                ('branch', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_sales', to='app.branch')),
+                ('product', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_sales', to='app.product')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('day', 'branch', 'product', 'payment_method'), name='unique_daily_sales_rollup')],
+            },
+        ),
+        migrations.RunPython(backfill_rollups, migrations.RunPython.noop),
+    ]
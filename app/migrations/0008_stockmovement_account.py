@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-17 04:07
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery
+
+
+def backfill_account(apps, schema_editor):
+    StockMovement = apps.get_model('app', 'StockMovement')
+    Branch = apps.get_model('app', 'Branch')
+
+    StockMovement.objects.update(account_id=Subquery(
+        Branch.objects.filter(id=OuterRef('branch_id')).values('account_id')[:1]
+    ))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0007_dailysalesrollup'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='stockmovement',
+            name='account',
+            field=models.ForeignKey(editable=False, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='movements', to='app.account'),
+        ),
+        migrations.RunPython(backfill_account, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='stockmovement',
+            name='account',
+            field=models.ForeignKey(editable=False, on_delete=django.db.models.deletion.CASCADE, related_name='movements', to='app.account'),
+        ),
+    ]
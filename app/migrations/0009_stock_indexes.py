@@ -0,0 +1,53 @@
+# Generated by Django 5.2.18 on 2026-10-17 04:08
+
+from django.db import migrations, models
+from django.db.models import Count, Max, Min, Sum
+
+
+def merge_duplicate_stock(apps, schema_editor):
+    """
+    Fold duplicate (product, branch) rows left by racing get_or_create
+    calls into the oldest one, keeping the summed quantity.
+    """
+    Stock = apps.get_model('app', 'Stock')
+
+    duplicates = (
+        Stock.objects.values('product_id', 'branch_id')
+        .annotate(rows=Count('id'), keep_id=Min('id'), total=Sum('quantity'), updated=Max('last_updated'))
+        .filter(rows__gt=1)
+        .order_by()
+    )
+    for row in duplicates:
+        Stock.objects.filter(id=row['keep_id']).update(quantity=row['total'], last_updated=row['updated'])
+        Stock.objects.filter(product_id=row['product_id'], branch_id=row['branch_id']).exclude(id=row['keep_id']).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('app', '0008_stockmovement_account'),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicate_stock, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='stockmovement',
+            index=models.Index(fields=['branch', 'created_at'], name='movement_branch_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='stockmovement',
+            index=models.Index(fields=['account', 'created_at'], name='movement_account_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='stockmovement',
+            index=models.Index(fields=['branch', 'movement_type', 'created_at'], name='movement_branch_type_date_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='stocksnapshot',
+            index=models.Index(fields=['branch', 'taken_at'], name='snapshot_branch_taken_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='stock',
+            constraint=models.UniqueConstraint(fields=('branch', 'product'), name='unique_stock_branch_product'),
+        ),
+    ]
@@ -1,6 +1,64 @@
-from django.db import models, transaction
+from collections import defaultdict
+from datetime import datetime, time, timedelta
+from decimal import Decimal, InvalidOperation
+
+from django.db import IntegrityError, connections, models, router, transaction
+from django.db.models import Case, Count, F, Max, Q, Sum, Value, When
+from django.db.models.functions import Coalesce, TruncDate
+from django.dispatch import Signal
 from django.core.exceptions import ValidationError
 from django.contrib.auth.hashers import make_password, check_password
+from django.utils import timezone
+
+from . import metrics, routers
+
+try:
+    from zoneinfo import ZoneInfo
+    KIGALI_TZ = ZoneInfo("Africa/Kigali")
+except ImportError:
+    import pytz
+    KIGALI_TZ = pytz.timezone("Africa/Kigali")
+
+
+# -------------------- Scoping --------------------
+class ScopedQuerySet(models.QuerySet):
+    """
+    Narrow rows to what a request identity may see: admins see everything,
+    managers their account and staff their assigned branch. Filters use
+    the direct foreign-key columns named by ``account_field`` and
+    ``branch_field`` so no join is needed.
+    """
+    account_field = 'account_id'
+    branch_field = 'branch_id'
+    related = ()
+
+    def for_scope(self, scope):
+        if scope.role == 'admin':
+            return self
+
+        user = scope.user
+        if user is None:
+            return self.none()
+
+        if scope.role == 'manager':
+            return self.filter(**{self.account_field: user.account_id})
+
+        if not user.branch_id:
+            return self.none()
+        return self.filter(**{self.branch_field: user.branch_id})
+
+    def listing(self):
+        """
+        Load the relations list pages display with each row.
+        """
+        return self.select_related(*self.related) if self.related else self
+
+    def from_replica(self):
+        """
+        Read from the replica database when one is configured and the
+        current session has not written recently.
+        """
+        return self.using(routers.read_alias())
 
 # -------------------- 1. Admin --------------------
 class AdminInfo(models.Model):
@@ -41,7 +99,7 @@ class Account(models.Model):
 
     def delete(self, *args, **kwargs):
         if self.users.exists() or self.branches.exists() or self.products.exists() or \
-           StockMovement.objects.filter(product__account=self).exists():
+           self.movements.exists():
             raise ValidationError("Cannot delete Account with users, branches, products, or stock movements.")
         super().delete(*args, **kwargs)
 
@@ -91,6 +149,34 @@ class UserInfo(models.Model):
 
 
 # -------------------- 4. Branch --------------------
+class BranchQuerySet(ScopedQuerySet):
+    branch_field = 'id'
+    related = ('account', 'manager')
+
+    def with_totals(self):
+        """
+        Annotate ``product_count`` and ``stock_value`` (quantity x cost price)
+        with subqueries instead of a query per branch.
+        """
+        money = models.DecimalField(max_digits=14, decimal_places=2)
+        stock_value = (
+            Stock.objects.filter(branch=models.OuterRef('pk'))
+            .values('branch')
+            .annotate(total=Sum(F('quantity') * F('product__cost_price'), output_field=money))
+            .values('total')
+        )
+        product_count = (
+            Product.objects.filter(branch=models.OuterRef('pk'))
+            .values('branch')
+            .annotate(total=Count('id'))
+            .values('total')
+        )
+        return self.annotate(
+            product_count=Coalesce(models.Subquery(product_count), Value(0)),
+            stock_value=Coalesce(models.Subquery(stock_value, output_field=money), Value(0, output_field=money)),
+        )
+
+
 class Branch(models.Model):
     account = models.ForeignKey(Account, on_delete=models.CASCADE, related_name='branches')
     branch_name = models.CharField(max_length=100)
@@ -103,6 +189,8 @@ class Branch(models.Model):
     )
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = BranchQuerySet.as_manager()
+
     def __str__(self):
         return f"{self.branch_name} - {self.account.name}"
 
@@ -113,6 +201,10 @@ class Branch(models.Model):
 
 
 # -------------------- 5. Product --------------------
+class ProductQuerySet(ScopedQuerySet):
+    related = ('branch',)
+
+
 class Product(models.Model):
     account = models.ForeignKey(Account, on_delete=models.CASCADE, related_name='products')
     branch = models.ForeignKey(Branch, on_delete=models.CASCADE, related_name='products')
@@ -122,6 +214,8 @@ class Product(models.Model):
     selling_price = models.DecimalField(max_digits=10, decimal_places=2)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = ProductQuerySet.as_manager()
+
     def __str__(self):
         return f"{self.name} ({self.branch.branch_name})"
 
@@ -132,12 +226,129 @@ class Product(models.Model):
 
 
 # -------------------- 6. Stock --------------------
+class StockManager(models.Manager):
+    BATCH_SIZE = 500
+
+    def adjust(self, product_id, branch_id, delta):
+        """
+        Add ``delta`` to the (product, branch) stock in one conditional UPDATE.
+
+        Removals only match rows with ``quantity >= -delta`` so concurrent
+        sales can neither oversell nor overwrite each other. Returns the number
+        of rows changed: 0 means there was not enough stock.
+        """
+        rows = self.filter(product_id=product_id, branch_id=branch_id)
+        if delta < 0:
+            rows = rows.filter(quantity__gte=-delta)
+
+        changed = rows.update(quantity=F("quantity") + delta, last_updated=timezone.now())
+
+        if not changed and delta >= 0:
+            try:
+                with transaction.atomic(using=router.db_for_write(self.model)):
+                    self.create(product_id=product_id, branch_id=branch_id, quantity=delta)
+                changed = 1
+            except IntegrityError:
+                # Another writer created the row first; add to theirs.
+                metrics.stock_conflicts.inc()
+                changed = self.filter(product_id=product_id, branch_id=branch_id).update(
+                    quantity=F("quantity") + delta, last_updated=timezone.now()
+                )
+
+        return changed
+
+    def adjust_many(self, deltas):
+        """
+        Apply ``{(product_id, branch_id): delta}`` with one conditional UPDATE
+        per batch of keys, creating missing rows for positive deltas first.
+
+        Returns the number of keys changed. Anything less than ``len(deltas)``
+        means some key lacked stock; the caller must roll back the transaction.
+        """
+        deltas = {key: delta for key, delta in deltas.items() if delta}
+        keys = list(deltas)
+
+        existing = self.quantities(key for key in keys if deltas[key] > 0)
+        missing = [key for key in keys if deltas[key] > 0 and key not in existing]
+        self.bulk_create(
+            [Stock(product_id=p, branch_id=b, quantity=0) for p, b in missing],
+            ignore_conflicts=True,
+        )
+
+        changed = 0
+        for start in range(0, len(keys), self.BATCH_SIZE):
+            batch = keys[start:start + self.BATCH_SIZE]
+
+            # Increases need no stock check, so match them per branch with IN.
+            match = Q()
+            amount = []
+            increases = defaultdict(list)
+            for branch_id, products in self._group_by_branch(batch).items():
+                branch_amount = []
+                for product_id in products:
+                    delta = deltas[(product_id, branch_id)]
+                    if delta > 0:
+                        increases[branch_id].append(product_id)
+                    else:
+                        match |= Q(product_id=product_id, branch_id=branch_id, quantity__gte=-delta)
+                    branch_amount.append(When(product_id=product_id, then=Value(delta)))
+                amount.append(When(branch_id=branch_id, then=Case(*branch_amount, default=Value(0))))
+
+            for branch_id, products in increases.items():
+                match |= Q(branch_id=branch_id, product_id__in=products)
+
+            changed += self.filter(match).update(
+                quantity=F("quantity") + Case(*amount, default=Value(0), output_field=models.IntegerField()),
+                last_updated=timezone.now(),
+            )
+
+        return changed
+
+    @staticmethod
+    def _group_by_branch(keys):
+        grouped = defaultdict(list)
+        for product_id, branch_id in keys:
+            grouped[branch_id].append(product_id)
+        return grouped
+
+    def quantities(self, keys):
+        """
+        Current quantity per ``(product_id, branch_id)`` for the given keys.
+        """
+        keys = list(keys)
+        result = {}
+        for start in range(0, len(keys), self.BATCH_SIZE):
+            match = Q()
+            for branch_id, products in self._group_by_branch(keys[start:start + self.BATCH_SIZE]).items():
+                match |= Q(branch_id=branch_id, product_id__in=products)
+            for product_id, branch_id, quantity in self.filter(match).values_list(
+                "product_id", "branch_id", "quantity"
+            ):
+                result[(product_id, branch_id)] = quantity
+        return result
+
+    def quantity_of(self, product_id, branch_id):
+        return (
+            self.filter(product_id=product_id, branch_id=branch_id)
+            .values_list("quantity", flat=True)
+            .first()
+        ) or 0
+
+
 class Stock(models.Model):
     product = models.ForeignKey(Product, on_delete=models.CASCADE, related_name='stocks')
     branch = models.ForeignKey(Branch, on_delete=models.CASCADE, related_name='stocks')
     quantity = models.IntegerField(default=0)
     last_updated = models.DateTimeField(auto_now=True)
 
+    objects = StockManager()
+
+    class Meta:
+        constraints = [
+            # Branch first so the same index serves per-branch stock lists.
+            models.UniqueConstraint(fields=['branch', 'product'], name='unique_stock_branch_product'),
+        ]
+
     def __str__(self):
         return f"{self.product.name} - {self.quantity}"
 
@@ -148,6 +359,89 @@ class Stock(models.Model):
 
 
 # -------------------- 7. Stock Movements --------------------
+# Sent after record_many() saves movements with bulk_create, which skips post_save.
+movements_recorded = Signal()
+
+
+class StockMovementQuerySet(ScopedQuerySet):
+    related = ('product', 'branch', 'created_by')
+
+
+class StockMovementManager(models.Manager.from_queryset(StockMovementQuerySet)):
+    BATCH_SIZE = 1000
+
+    def record_many(self, movements):
+        """
+        Save many new movements in one transaction.
+
+        Stock changes are summed per (product, branch) and applied with
+        ``Stock.objects.adjust_many``; movements and their logs are written
+        with ``bulk_create``. If any product would go below zero nothing is
+        saved and a ValidationError lists the short lines.
+        """
+        deltas = defaultdict(int)
+        for movement in movements:
+            movement.clean()
+            movement.set_profit()
+            movement.account_id = movement.branch.account_id
+            deltas[(movement.product_id, movement.branch_id)] += movement.stock_delta
+
+        using = router.db_for_write(self.model)
+        with transaction.atomic(using=using):
+            if Stock.objects.adjust_many(deltas) < len([d for d in deltas.values() if d]):
+                available = Stock.objects.quantities(deltas)
+                names = {(m.product_id, m.branch_id): m.product.name for m in movements}
+                short = [
+                    f"Cannot sell {-delta} units of {names[key]}. Only {available.get(key, 0)} available."
+                    for key, delta in deltas.items()
+                    if delta < 0 and available.get(key, 0) < -delta
+                ]
+                if short:
+                    metrics.oversells_rejected.inc(len(short))
+                else:
+                    metrics.stock_conflicts.inc()
+                raise ValidationError(short or "Stock changed while saving. Please try again.")
+
+            running = {
+                key: quantity - deltas[key]
+                for key, quantity in Stock.objects.quantities(deltas).items()
+            }
+
+            self._insert(movements)
+            DailySalesRollup.objects.record(movements)
+
+            logs = []
+            for movement in movements:
+                key = (movement.product_id, movement.branch_id)
+                before_qty = running.get(key, 0)
+                running[key] = before_qty + movement.stock_delta
+                logs.append(StockMovementLog(
+                    movement=movement,
+                    before_qty=before_qty,
+                    after_qty=running[key],
+                    changed_by=movement.created_by,
+                    profit=movement.profit,
+                    payment_method=movement.payment_method,
+                ))
+            StockMovementLog.objects.bulk_create(logs, batch_size=self.BATCH_SIZE)
+
+        movements_recorded.send(sender=StockMovement, movements=movements, using=using)
+
+        return movements
+
+    def _insert(self, movements):
+        if connections[router.db_for_write(self.model)].features.can_return_rows_from_bulk_insert:
+            self.bulk_create(movements, batch_size=self.BATCH_SIZE)
+        else:
+            # Without RETURNING the logs would have no movement ids. Raw saves
+            # skip auto_now_add, so stamp created_at as bulk_create would.
+            created_at = timezone.now()
+            for movement in movements:
+                if movement.created_at is None:
+                    movement.created_at = created_at
+                movement.save_base(raw=True)
+
+
 class StockMovement(models.Model):
     MOVEMENT_CHOICES = (
         ('IN', 'IN'),
@@ -161,6 +455,8 @@ class StockMovement(models.Model):
 
     product = models.ForeignKey(Product, on_delete=models.CASCADE, related_name='movements')
     branch = models.ForeignKey(Branch, on_delete=models.CASCADE, related_name='movements')
+    # Copied from branch on save so account-wide lists filter without a join.
+    account = models.ForeignKey(Account, on_delete=models.CASCADE, related_name='movements', editable=False)
     movement_type = models.CharField(max_length=10, choices=MOVEMENT_CHOICES)
     quantity = models.IntegerField()
     selling_amount = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)
@@ -170,76 +466,104 @@ class StockMovement(models.Model):
     created_by = models.ForeignKey(UserInfo, on_delete=models.SET_NULL, null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    objects = StockMovementManager()
+
+    class Meta:
+        indexes = [
+            # Staff lists, snapshot replays and per-branch date ranges.
+            models.Index(fields=['branch', 'created_at'], name='movement_branch_created_idx'),
+            # Manager lists through the denormalised account.
+            models.Index(fields=['account', 'created_at'], name='movement_account_created_idx'),
+            # Daily report: OUT lines per branch over a date range.
+            models.Index(fields=['branch', 'movement_type', 'created_at'], name='movement_branch_type_date_idx'),
+        ]
+
     def clean(self):
-        if self.movement_type == 'OUT':
-            stock = Stock.objects.filter(product=self.product, branch=self.branch).first()
-            if not stock or self.quantity > stock.quantity:
+        if self.movement_type == 'OUT' and not self.payment_method:
+            raise ValidationError("Payment method is required for OUT movements.")
+
+    @property
+    def stock_delta(self):
+        return self.quantity if self.movement_type == 'IN' else -self.quantity
+
+    def _apply_stock(self, product_id, branch_id, delta):
+        """
+        Apply ``delta`` to stock and return the quantity after the change.
+        """
+        if not Stock.objects.adjust(product_id, branch_id, delta):
+            available = Stock.objects.quantity_of(product_id, branch_id)
+            if self.movement_type == 'OUT':
+                metrics.oversells_rejected.inc()
                 raise ValidationError(
-                    f"Cannot sell {self.quantity} units. Only {stock.quantity if stock else 0} available."
+                    f"Cannot sell {self.quantity} units. Only {available} available."
                 )
-            if not self.payment_method:
-                raise ValidationError("Payment method is required for OUT movements.")
+            raise ValidationError(
+                f"Cannot change this movement. Stock would become negative."
+            )
+        return Stock.objects.quantity_of(product_id, branch_id)
 
-    def save(self, *args, **kwargs):
-        self.clean()
+    def set_profit(self):
         if self.movement_type == 'OUT':
-            cost_total = float(self.product.cost_price) * self.quantity
-            selling_total = float(self.selling_amount or 0)
+            cost_total = self.product.cost_price * self.quantity
+            try:
+                selling_total = Decimal(str(self.selling_amount or 0))
+            except InvalidOperation:
+                raise ValidationError("Selling amount must be a number.")
             self.profit = selling_total - cost_total
         else:
             self.profit = 0
 
-        with transaction.atomic():
-            stock, created = Stock.objects.get_or_create(
-                product=self.product,
-                branch=self.branch,
-                defaults={'quantity': 0}
-            )
+    def save(self, *args, **kwargs):
+        self.clean()
+        self.set_profit()
+        self.account_id = self.branch.account_id
+
+        with transaction.atomic(using=router.db_for_write(type(self), instance=self)):
+            delta = self.stock_delta
 
             if self.pk:
-                old = StockMovement.objects.get(pk=self.pk)
-                if old.movement_type == 'IN':
-                    stock.quantity -= old.quantity
-                elif old.movement_type == 'OUT':
-                    stock.quantity += old.quantity
+                old = StockMovement.objects.only(
+                    'product_id', 'branch_id', 'movement_type', 'quantity',
+                    'selling_amount', 'profit', 'payment_method', 'created_at'
+                ).get(pk=self.pk)
+                DailySalesRollup.objects.record([old], sign=-1)
+
+                if (old.product_id, old.branch_id) == (self.product_id, self.branch_id):
+                    delta -= old.stock_delta
+                else:
+                    self._apply_stock(old.product_id, old.branch_id, -old.stock_delta)
 
-            before_qty = stock.quantity
+                StockSnapshot.objects.invalidate({old.branch_id, self.branch_id}, self.created_at)
 
-            if self.movement_type == 'IN':
-                stock.quantity += self.quantity
-            elif self.movement_type == 'OUT':
-                stock.quantity -= self.quantity
+            after_qty = self._apply_stock(self.product_id, self.branch_id, delta)
+            before_qty = after_qty - self.stock_delta
 
-            stock.save()
             super().save(*args, **kwargs)
+            DailySalesRollup.objects.record([self])
 
             StockMovementLog.objects.create(
                 movement=self,
                 before_qty=before_qty,
-                after_qty=stock.quantity,
+                after_qty=after_qty,
                 changed_by=self.created_by,
                 profit=self.profit,
                 payment_method=self.payment_method
             )
 
     def delete(self, *args, **kwargs):
-        with transaction.atomic():
-            stock = Stock.objects.get(product=self.product, branch=self.branch)
+        with transaction.atomic(using=router.db_for_write(type(self), instance=self)):
+            delta = -self.stock_delta
 
-            if self.movement_type == 'IN' and stock.quantity < self.quantity:
+            if not Stock.objects.adjust(self.product_id, self.branch_id, delta):
                 raise ValidationError(
                     f"Cannot delete this movement. Stock would become negative."
                 )
 
-            if self.movement_type == 'IN':
-                stock.quantity -= self.quantity
-            elif self.movement_type == 'OUT':
-                stock.quantity += self.quantity
-
-            before_qty = stock.quantity + self.quantity if self.movement_type == "IN" else stock.quantity - self.quantity
-            after_qty = stock.quantity
+            after_qty = Stock.objects.quantity_of(self.product_id, self.branch_id)
+            before_qty = after_qty - delta
+            StockSnapshot.objects.invalidate([self.branch_id], self.created_at)
+            DailySalesRollup.objects.record([self], sign=-1)
 
-            stock.save()
             StockMovementLog.objects.create(
                 movement=self,
                 before_qty=before_qty,
@@ -271,6 +595,244 @@ class StockMovementLog(models.Model):
 
 
 
+# -------------------- 9. Stock Snapshots --------------------
+# Sent when an edit drops checkpoints; app.signals queues taking them again.
+snapshots_invalidated = Signal()
+
+
+class StockSnapshotManager(models.Manager):
+    def quantities_as_of(self, branch_ids, moment):
+        """
+        Stock per ``(product_id, branch_id)`` at ``moment``: each branch's latest
+        snapshot taken at or before ``moment`` plus the movements since it.
+        Branches without a snapshot are summed from their full history.
+        Runs three queries whatever the number of branches.
+        """
+        branch_ids = list(branch_ids)
+        latest = dict(
+            self.filter(branch_id__in=branch_ids, taken_at__lte=moment)
+            .values("branch_id")
+            .annotate(last=Max("taken_at"))
+            .values_list("branch_id", "last")
+        )
+
+        quantities = defaultdict(int)
+        snapshot_match = Q()
+        for branch_id, taken_at in latest.items():
+            snapshot_match |= Q(branch_id=branch_id, taken_at=taken_at)
+        if latest:
+            for product_id, branch_id, quantity in self.filter(snapshot_match).values_list(
+                "product_id", "branch_id", "quantity"
+            ):
+                quantities[(product_id, branch_id)] = quantity
+
+        since = Q(branch_id__in=[b for b in branch_ids if b not in latest])
+        for branch_id, taken_at in latest.items():
+            since |= Q(branch_id=branch_id, created_at__gte=taken_at)
+
+        deltas = (
+            StockMovement.objects.filter(since, created_at__lt=moment)
+            .values("product_id", "branch_id")
+            .annotate(delta=Sum(Case(
+                When(movement_type="IN", then=F("quantity")),
+                When(movement_type="OUT", then=-F("quantity")),
+                default=Value(0),
+                output_field=models.IntegerField(),
+            )))
+            .values_list("product_id", "branch_id", "delta")
+        )
+        for product_id, branch_id, delta in deltas:
+            quantities[(product_id, branch_id)] += delta or 0
+
+        return quantities
+
+    def take(self, branch_ids, moment):
+        """
+        Store a checkpoint of every product's stock in each branch as of ``moment``.
+        """
+        quantities = self.quantities_as_of(branch_ids, moment)
+        with transaction.atomic(using=router.db_for_write(self.model)):
+            self.filter(branch_id__in=branch_ids, taken_at=moment).delete()
+            self.bulk_create(
+                [
+                    StockSnapshot(product_id=product_id, branch_id=branch_id, quantity=quantity, taken_at=moment)
+                    for (product_id, branch_id), quantity in quantities.items()
+                ],
+                batch_size=1000,
+            )
+        return len(quantities)
+
+    def invalidate(self, branch_ids, since):
+        """
+        Drop checkpoints that an edit or delete of a movement made at ``since`` changed.
+        """
+        dropped = self.filter(branch_id__in=branch_ids, taken_at__gt=since)
+        moments = sorted(set(dropped.values_list("taken_at", flat=True)))
+        if moments:
+            dropped.delete()
+            snapshots_invalidated.send(
+                sender=StockSnapshot, branch_ids=sorted(branch_ids), moments=moments,
+                using=router.db_for_write(self.model),
+            )
+
+    def compact(self, before):
+        """
+        Drop checkpoints taken before ``before`` except those at the start of a
+        Kigali month; "as of" reads for the days between replay from the
+        month's checkpoint instead.
+        """
+        moments = self.filter(taken_at__lt=before).values_list("taken_at", flat=True).distinct()
+        dropped = [moment for moment in moments if timezone.localtime(moment, KIGALI_TZ).day != 1]
+        return self.filter(taken_at__in=dropped).delete()[0] if dropped else 0
+
+
+class StockSnapshot(models.Model):
+    """
+    Stock of a product in a branch as of ``taken_at`` (movements with
+    ``created_at < taken_at``), used to answer "as of date" questions
+    without replaying the whole history.
+    """
+    product = models.ForeignKey(Product, on_delete=models.CASCADE, related_name='snapshots')
+    branch = models.ForeignKey(Branch, on_delete=models.CASCADE, related_name='snapshots')
+    quantity = models.IntegerField()
+    taken_at = models.DateTimeField()
+
+    objects = StockSnapshotManager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['branch', 'taken_at'], name='snapshot_branch_taken_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.product.name} - {self.quantity} @ {self.taken_at:%Y-%m-%d %H:%M}"
+
+
+# -------------------- 10. Daily Sales Rollup --------------------
+class DailySalesRollupManager(models.Manager):
+    def record(self, movements, sign=1):
+        """
+        Add (``sign=1``) or remove (``sign=-1``) the OUT movements' totals,
+        one UPDATE per (day, branch, product, payment method) touched.
+        Call inside the transaction that writes the movements.
+        """
+        totals = {}
+        for movement in movements:
+            if movement.movement_type != 'OUT':
+                continue
+            key = (
+                timezone.localtime(movement.created_at, KIGALI_TZ).date(),
+                movement.branch_id,
+                movement.product_id,
+                movement.payment_method or '',
+            )
+            total = totals.setdefault(key, [0, Decimal(0), Decimal(0), 0])
+            total[0] += sign * movement.quantity
+            total[1] += sign * Decimal(str(movement.selling_amount or 0))
+            total[2] += sign * Decimal(str(movement.profit or 0))
+            total[3] += sign
+
+        for (day, branch_id, product_id, payment_method), (quantity, amount, profit, count) in totals.items():
+            rows = self.filter(day=day, branch_id=branch_id, product_id=product_id, payment_method=payment_method)
+            changes = dict(
+                quantity=F('quantity') + quantity,
+                sales_amount=F('sales_amount') + amount,
+                profit=F('profit') + profit,
+                count=F('count') + count,
+            )
+            if rows.update(**changes):
+                if sign < 0:
+                    rows.filter(count__lte=0).delete()
+                continue
+            try:
+                with transaction.atomic(using=router.db_for_write(self.model)):
+                    self.create(
+                        day=day, branch_id=branch_id, product_id=product_id, payment_method=payment_method,
+                        quantity=quantity, sales_amount=amount, profit=profit, count=count,
+                    )
+            except IntegrityError:
+                rows.update(**changes)
+
+    def rebuild(self, date_from=None, date_to=None, branch_ids=None):
+        """
+        Recompute rollups from StockMovement for the given Kigali days
+        (all history by default). Returns the number of rows written.
+        """
+        movements = StockMovement.objects.filter(movement_type='OUT')
+        rollups = self.all()
+        if date_from:
+            movements = movements.filter(created_at__gte=datetime.combine(date_from, time.min, tzinfo=KIGALI_TZ))
+            rollups = rollups.filter(day__gte=date_from)
+        if date_to:
+            movements = movements.filter(created_at__lt=datetime.combine(date_to + timedelta(days=1), time.min, tzinfo=KIGALI_TZ))
+            rollups = rollups.filter(day__lte=date_to)
+        if branch_ids:
+            movements = movements.filter(branch_id__in=branch_ids)
+            rollups = rollups.filter(branch_id__in=branch_ids)
+
+        grouped = (
+            movements
+            .annotate(day=TruncDate('created_at', tzinfo=KIGALI_TZ))
+            .values('day', 'branch_id', 'product_id', 'payment_method')
+            .annotate(
+                total_quantity=Sum('quantity'),
+                total_amount=Sum('selling_amount'),
+                total_profit=Sum('profit'),
+                total_count=Count('id'),
+            )
+            .order_by()
+        )
+
+        with transaction.atomic(using=router.db_for_write(self.model)):
+            rollups.delete()
+            created = self.bulk_create(
+                [
+                    DailySalesRollup(
+                        day=row['day'],
+                        branch_id=row['branch_id'],
+                        product_id=row['product_id'],
+                        payment_method=row['payment_method'] or '',
+                        quantity=row['total_quantity'] or 0,
+                        sales_amount=row['total_amount'] or 0,
+                        profit=row['total_profit'] or 0,
+                        count=row['total_count'],
+                    )
+                    for row in grouped.iterator()
+                ],
+                batch_size=1000,
+            )
+        return len(created)
+
+
+class DailySalesRollup(models.Model):
+    """
+    Sales (OUT movements) per Kigali day, branch, product and payment method,
+    kept in step with StockMovement writes so reports read these rows
+    instead of scanning every movement.
+    """
+    day = models.DateField()
+    branch = models.ForeignKey(Branch, on_delete=models.CASCADE, related_name='daily_sales')
+    product = models.ForeignKey(Product, on_delete=models.CASCADE, related_name='daily_sales')
+    payment_method = models.CharField(max_length=10, blank=True, default='')
+    quantity = models.IntegerField(default=0)
+    sales_amount = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    profit = models.DecimalField(max_digits=14, decimal_places=2, default=0)
+    count = models.IntegerField(default=0)
+
+    objects = DailySalesRollupManager()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['day', 'branch', 'product', 'payment_method'],
+                name='unique_daily_sales_rollup',
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.day} {self.branch_id}/{self.product_id} {self.payment_method or '-'}: {self.sales_amount}"
+
+
 import random
 from django.utils import timezone
 from datetime import timedelta
@@ -289,3 +851,78 @@ class PasswordResetOTP(models.Model):
 
     def __str__(self):
         return f"{self.email} - {self.otp}"
+
+
+# -------------------- 11. Background Jobs --------------------
+class JobManager(models.Manager):
+    def claim(self, worker, limit, lock_timeout):
+        """
+        Lock up to ``limit`` due jobs for ``worker`` and return them, oldest
+        first. Each job is taken with a conditional UPDATE so two workers
+        never run the same job; locks older than ``lock_timeout`` seconds
+        belong to crashed workers and are taken over.
+        """
+        now = timezone.now()
+        free = Q(locked_at__isnull=True) | Q(locked_at__lt=now - timedelta(seconds=lock_timeout))
+        due = self.filter(free, run_at__lte=now).order_by('run_at', 'id').values_list('id', flat=True)[:limit]
+
+        claimed = [job_id for job_id in list(due) if self.filter(free, id=job_id).update(locked_at=now, locked_by=worker)]
+        return list(self.filter(id__in=claimed).order_by('run_at', 'id'))
+
+
+class Job(models.Model):
+    """
+    A queued side effect (see app.jobs), run by ``manage.py run_worker``.
+    Done jobs are deleted; jobs out of attempts move to FailedJob.
+    """
+    task = models.CharField(max_length=100)
+    payload = models.JSONField(default=dict)
+    attempts = models.IntegerField(default=0)
+    max_attempts = models.IntegerField(default=5)
+    run_at = models.DateTimeField(default=timezone.now)
+    locked_at = models.DateTimeField(null=True, blank=True)
+    locked_by = models.CharField(max_length=100, blank=True, default='')
+    last_error = models.TextField(blank=True, default='')
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    objects = JobManager()
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['run_at'], name='job_run_at_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.task} #{self.id} (attempt {self.attempts})"
+
+
+class FailedJob(models.Model):
+    """
+    Dead letters: jobs that failed ``max_attempts`` times, kept for
+    inspection and for requeueing with ``run_worker --retry-failed``.
+    """
+    task = models.CharField(max_length=100)
+    payload = models.JSONField(default=dict)
+    attempts = models.IntegerField()
+    error = models.TextField()
+    created_at = models.DateTimeField()
+    failed_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.task} failed at {self.failed_at}"
+
+
+# -------------------- 12. Sharding --------------------
+class AccountShard(models.Model):
+    """
+    Which database alias holds an account's rows (see app.sharding). Lives
+    in ``default``; accounts without a row are in ``default`` too.
+    """
+    account_id = models.BigIntegerField(unique=True)
+    alias = models.CharField(max_length=50)
+    # Set while manage.py move_account copies the account; writes are refused.
+    moving = models.BooleanField(default=False)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"Account {self.account_id} -> {self.alias}{' (moving)' if self.moving else ''}"
@@ -0,0 +1,109 @@
+"""
+Opt-in profiling of single views.
+
+A view is profiled when its URL name is in ``PROFILE_VIEWS``, or when an
+admin sends the ``X-Profile`` header or the ``_profile`` query parameter.
+With ``PROFILER = "cprofile"`` a ``.prof`` file (pstats) is written; with
+``"sampling"`` a ``.collapsed`` stack file (flamegraph input) is written
+instead. Files go to ``PROFILE_DIR``, keeping the newest ``PROFILE_KEEP``.
+"""
+import cProfile
+import re
+import sys
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+
+from django.conf import settings
+
+EXTENSIONS = (".prof", ".collapsed")
+
+
+def wanted(request):
+    match = request.resolver_match
+    if match and match.url_name in settings.PROFILE_VIEWS:
+        return True
+    if request.headers.get("X-Profile") or "_profile" in request.GET:
+        return request.identity.role == "admin"
+    return False
+
+
+class Sampler:
+    """
+    Minimal sampling profiler: a background thread records the profiled
+    thread's stack every ``interval`` seconds.
+    """
+    def __init__(self, interval=0.005):
+        self.interval = interval
+        self.stacks = Counter()
+        self._stop = threading.Event()
+
+    def __enter__(self):
+        self._target = threading.get_ident()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self._target)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(f"{code.co_name} ({Path(code.co_filename).name}:{code.co_firstlineno})")
+                frame = frame.f_back
+            if stack:
+                self.stacks[";".join(reversed(stack))] += 1
+
+    def write(self, path):
+        with open(path, "w") as f:
+            for stack, count in self.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+
+def profile_view(request, view_func, view_args, view_kwargs):
+    """
+    Run the view under the configured profiler and dump the result.
+    """
+    directory = Path(settings.PROFILE_DIR)
+    directory.mkdir(parents=True, exist_ok=True)
+    name = re.sub(r"[^\w.-]+", "_", request.resolver_match.view_name or "view")
+
+    started = time.perf_counter()
+    if settings.PROFILER == "sampling":
+        with Sampler() as sampler:
+            response = view_func(request, *view_args, **view_kwargs)
+        elapsed = time.perf_counter() - started
+        path = directory / f"{time.strftime('%Y%m%d-%H%M%S')}-{name}-{elapsed * 1000:.0f}ms.collapsed"
+        sampler.write(path)
+    else:
+        profiler = cProfile.Profile()
+        response = profiler.runcall(view_func, request, *view_args, **view_kwargs)
+        elapsed = time.perf_counter() - started
+        path = directory / f"{time.strftime('%Y%m%d-%H%M%S')}-{name}-{elapsed * 1000:.0f}ms.prof"
+        profiler.dump_stats(path)
+
+    rotate(directory, settings.PROFILE_KEEP)
+    response["X-Profile-File"] = path.name
+    return response
+
+
+def profiles(directory=None):
+    """
+    Profile files in ``directory`` (``PROFILE_DIR`` by default), newest first.
+    """
+    directory = Path(directory or settings.PROFILE_DIR)
+    if not directory.is_dir():
+        return []
+    files = [path for path in directory.iterdir() if path.suffix in EXTENSIONS]
+    return sorted(files, key=lambda path: path.stat().st_mtime, reverse=True)
+
+
+def rotate(directory, keep):
+    for path in profiles(directory)[keep:]:
+        path.unlink(missing_ok=True)
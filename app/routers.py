@@ -0,0 +1,112 @@
+"""
+Read-replica routing.
+
+When a ``replica`` database is configured (``REPLICA_DATABASE_URL``), reads
+inside views decorated with ``replica_reads`` (GET/HEAD only) and querysets
+built with ``.from_replica()`` go to it; everything else, and every write,
+uses ``default``. Tenant rows on other shards are routed by ShardRouter,
+listed before this router, or follow the shard they were loaded from; the
+replica only mirrors ``default``.
+
+Read-your-writes: ``ReplicaMiddleware`` stamps the session when a request
+writes, and for ``REPLICA_PIN_SECONDS`` afterwards that session reads from
+``default`` only, so replication lag never hides the user's own changes.
+"""
+import time
+from contextvars import ContextVar
+from functools import wraps
+
+from django.conf import settings
+
+REPLICA = "replica"
+WRITE_KEY = "last_write_at"
+
+
+class RequestRouting:
+    def __init__(self, pinned=False):
+        self.pinned = pinned
+        self.replica_reads = False
+        self.wrote = False
+
+
+routing = ContextVar("request_routing", default=None)
+
+
+def replica_configured():
+    return REPLICA in settings.DATABASES
+
+
+def read_alias():
+    """
+    The alias an explicit replica read should use right now; None leaves
+    the choice to the routers.
+    """
+    state = routing.get()
+    if not replica_configured() or (state is not None and state.pinned):
+        return None
+    return REPLICA
+
+
+def pinned(session):
+    return time.time() - session.get(WRITE_KEY, 0) < settings.REPLICA_PIN_SECONDS
+
+
+def mark_written(session):
+    session[WRITE_KEY] = time.time()
+
+
+def note_write():
+    """
+    Tell ``ReplicaMiddleware`` the current request wrote, for writes made
+    outside the routers (the group-commit writer thread).
+    """
+    state = routing.get()
+    if state is not None:
+        state.wrote = True
+
+
+def replica_reads(view):
+    """
+    Send the view's reads to the replica on GET and HEAD requests.
+    """
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        state = routing.get()
+        if state is None or request.method not in ("GET", "HEAD"):
+            return view(request, *args, **kwargs)
+
+        state.replica_reads = True
+        try:
+            return view(request, *args, **kwargs)
+        finally:
+            state.replica_reads = False
+    return wrapper
+
+
+def _shard_of(hints):
+    # A row loaded from a shard (by an admin or find_user) stays on it.
+    instance = hints.get("instance")
+    alias = instance._state.db if instance is not None else None
+    return alias if alias not in (None, "default", REPLICA) else None
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        alias = _shard_of(hints)
+        if alias:
+            return alias
+        state = routing.get()
+        if state is not None and state.replica_reads and not state.pinned and replica_configured():
+            return REPLICA
+        return None
+
+    def db_for_write(self, model, **hints):
+        note_write()
+        return _shard_of(hints) or "default"
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # The replica holds the same rows as the primary.
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db != REPLICA
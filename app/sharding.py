@@ -0,0 +1,245 @@
+"""
+Per-account sharding.
+
+With ``SHARDS`` configured, an account's tenant rows (``SHARDED_MODELS``)
+live in the database alias recorded for it in AccountShard; accounts
+without an entry stay in ``default``, which also keeps admins, sessions,
+jobs and the directory itself. ``ShardMiddleware`` picks the alias from
+the session's ``account_id`` and ``ShardRouter`` sends tenant queries
+there. Queries for accounts in ``default`` fall through to the next router
+(app.routers), so they can still read from the replica. Admin pages with
+no account use ``fan_out`` to query every shard, and ``admin_writes`` to
+change a row on the shard that holds it.
+
+Every database allocates ids from its own block (``reserve_ids``), so rows
+keep their ids when ``manage.py move_account`` copies them between shards.
+"""
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from functools import wraps
+
+from django.apps import apps
+from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
+
+from . import routers
+from .models import AccountShard, UserInfo
+
+SHARDED_MODELS = {
+    'account', 'userinfo', 'branch', 'product', 'stock', 'stockmovement',
+    'stockmovementlog', 'stocksnapshot', 'dailysalesrollup',
+}
+
+CACHE_PREFIX = "shard"
+
+current = ContextVar("shard", default=None)
+
+
+def aliases():
+    return ["default", *settings.SHARDS]
+
+
+def _key(account_id):
+    return f"{CACHE_PREFIX}:account:{account_id}"
+
+
+def lookup(account_id):
+    """
+    ``(alias, moving)`` for an account. Cached for ``SHARD_CACHE_TIMEOUT``
+    seconds; move_account waits that long between its steps.
+    """
+    if not settings.SHARDS or not account_id:
+        return "default", False
+
+    entry = cache.get(_key(account_id))
+    if entry is None:
+        row = AccountShard.objects.filter(account_id=account_id).values_list("alias", "moving").first()
+        entry = tuple(row) if row else ("default", False)
+        cache.set(_key(account_id), entry, settings.SHARD_CACHE_TIMEOUT)
+    return entry
+
+
+def shard_for_account(account_id):
+    return lookup(account_id)[0]
+
+
+def forget(account_id):
+    cache.delete(_key(account_id))
+
+
+@contextmanager
+def use_shard(alias):
+    token = current.set(alias)
+    try:
+        yield alias
+    finally:
+        current.reset(token)
+
+
+def use_shard_of(instance):
+    """
+    Route tenant queries to the shard ``instance`` was loaded from.
+    """
+    return use_shard(instance._state.db) if settings.SHARDS else nullcontext()
+
+
+def use_account_shard(account_id):
+    return use_shard(shard_for_account(account_id)) if settings.SHARDS else nullcontext()
+
+
+def per_shard(queryset):
+    """
+    ``queryset`` pinned to the request's shard, or to each shard in turn
+    when the request has no account (admins). Pinned querysets can be read
+    after the request's routing has ended (streaming). Ids grow from shard
+    to shard, so results ordered by id can simply be concatenated.
+    """
+    if not settings.SHARDS:
+        return [queryset]
+    if current.get() is not None:
+        return [_pin(queryset, current.get())]
+    return [_pin(queryset, alias) for alias in aliases()]
+
+
+def _pin(queryset, alias):
+    # The replica mirrors default; keep reads already sent there.
+    if alias == "default" and queryset.db == routers.REPLICA:
+        alias = routers.REPLICA
+    return queryset.using(alias)
+
+
+def gather(queryset, key=None, reverse=False, limit=None):
+    """
+    Rows of ``queryset`` from every shard (see ``per_shard``), sorted on
+    ``key`` and cut to ``limit``.
+    """
+    parts = per_shard(queryset)
+    if len(parts) == 1:
+        return list(parts[0][:limit])
+
+    rows = [row for part in parts for row in part[:limit]]
+    if key:
+        rows.sort(key=key, reverse=reverse)
+    return rows[:limit]
+
+
+def fan_out(func):
+    """
+    ``[(alias, func())]`` with ``func`` run once per shard. Without shards
+    it runs once, unrouted.
+    """
+    if not settings.SHARDS:
+        return [("default", func())]
+
+    results = []
+    for alias in aliases():
+        with use_shard(alias):
+            results.append((alias, func()))
+    return results
+
+
+def locate(model, pk):
+    """
+    The alias holding ``model`` row ``pk``, or None.
+    """
+    for alias, found in fan_out(lambda: model.objects.filter(pk=pk).exists()):
+        if found:
+            return alias
+    return None
+
+
+def admin_writes(*lookups):
+    """
+    Run POSTs without an account (admins) on the shard holding the row the
+    form names. ``lookups`` are ``(model, field)`` pairs tried in order,
+    e.g. ``(Product, "product_id"), (Branch, "branch")``.
+    """
+    def decorator(view):
+        @wraps(view)
+        def wrapper(request, *args, **kwargs):
+            if not settings.SHARDS or request.method != "POST" or current.get() is not None:
+                return view(request, *args, **kwargs)
+
+            for model, field in lookups:
+                pk = request.POST.get(field, "")
+                alias = locate(model, int(pk)) if pk.isdigit() else None
+                if alias:
+                    with use_shard(alias):
+                        return view(request, *args, **kwargs)
+            return view(request, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def find_user(email):
+    """
+    The UserInfo with ``email`` on whichever shard holds it.
+    """
+    for _, user in fan_out(lambda: UserInfo.objects.filter(email=email).first()):
+        if user:
+            return user
+    return None
+
+
+# -------------------- Ids --------------------
+def reserve_ids(alias):
+    """
+    Move the id sequences of the sharded tables on ``alias`` to the start
+    of its block (``position * SHARD_ID_BLOCK``) unless they are already
+    past it. ``default`` keeps the low ids.
+    """
+    position = aliases().index(alias)
+    if not position:
+        return
+    start = position * settings.SHARD_ID_BLOCK
+
+    connection = connections[alias]
+    with connection.cursor() as cursor:
+        for model in sharded_models():
+            table = model._meta.db_table
+            if connection.vendor == "postgresql":
+                cursor.execute(
+                    "SELECT setval(pg_get_serial_sequence(%s, 'id'), "
+                    f"GREATEST(%s, (SELECT COALESCE(MAX(id), 0) FROM {connection.ops.quote_name(table)})))",
+                    [table, start],
+                )
+            elif connection.vendor == "mysql":
+                cursor.execute(f"ALTER TABLE {connection.ops.quote_name(table)} AUTO_INCREMENT = %s", [start])
+            elif connection.vendor == "sqlite":
+                cursor.execute("DELETE FROM sqlite_sequence WHERE name = %s AND seq < %s", [table, start])
+                cursor.execute(
+                    "INSERT INTO sqlite_sequence (name, seq) SELECT %s, %s "
+                    "WHERE NOT EXISTS (SELECT 1 FROM sqlite_sequence WHERE name = %s)",
+                    [table, start, table],
+                )
+
+
+def sharded_models():
+    return [model for model in apps.get_app_config("app").get_models() if model._meta.model_name in SHARDED_MODELS]
+
+
+# -------------------- Router --------------------
+class ShardRouter:
+    def _db(self, model):
+        if model._meta.app_label == "app" and model._meta.model_name in SHARDED_MODELS:
+            alias = current.get()
+            # Left to ReplicaRouter, which tracks writes and picks the replica.
+            if alias != "default":
+                return alias
+        return None
+
+    def db_for_read(self, model, **hints):
+        return self._db(model)
+
+    def db_for_write(self, model, **hints):
+        return self._db(model)
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return None
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        if db not in settings.SHARDS:
+            return None
+        # Shards only hold tenant tables.
+        return app_label == "app" and model_name in SHARDED_MODELS
@@ -0,0 +1,108 @@
+"""
+Signal receivers that keep cached dashboard counters and identities fresh,
+queue retaking dropped stock checkpoints, count writes for app.metrics and
+tune new SQLite connections.
+"""
+from collections import Counter
+
+from django.conf import settings
+from django.db import transaction
+from django.db.backends.signals import connection_created
+from django.db.models import Q
+from django.db.models.signals import post_delete, post_migrate, post_save
+from django.dispatch import receiver
+
+from . import dashboard, identity, jobs, metrics, sharding, sqlite
+from .models import (
+    AdminInfo, Account, Branch, Product, StockMovement, UserInfo, movements_recorded, snapshots_invalidated,
+)
+
+
+@receiver([post_save, post_delete], sender=Account)
+def account_changed(sender, instance, using, **kwargs):
+    dashboard.invalidate(account_id=instance.id, using=using)
+
+
+@receiver([post_save, post_delete], sender=Branch)
+def branch_changed(sender, instance, using, **kwargs):
+    dashboard.invalidate(account_id=instance.account_id, branch_id=instance.id, using=using)
+
+
+@receiver([post_save, post_delete], sender=Product)
+@receiver([post_save, post_delete], sender=UserInfo)
+def account_member_changed(sender, instance, using, **kwargs):
+    dashboard.invalidate(account_id=instance.account_id, branch_id=instance.branch_id, using=using)
+
+
+@receiver([post_save, post_delete], sender=StockMovement)
+def movement_changed(sender, instance, using, **kwargs):
+    dashboard.invalidate(account_id=instance.account_id, branch_id=instance.branch_id, using=using)
+
+
+@receiver(movements_recorded)
+def movements_bulk_recorded(sender, movements, using, **kwargs):
+    for account_id, branch_id in {(m.account_id, m.branch_id) for m in movements}:
+        dashboard.invalidate(account_id=account_id, branch_id=branch_id, using=using)
+
+
+# -------------------- Stock snapshots --------------------
+@receiver(snapshots_invalidated)
+def snapshots_dropped(sender, branch_ids, moments, using, **kwargs):
+    # Queued once the edit commits, so the job sees it.
+    transaction.on_commit(lambda: jobs.enqueue(
+        "refresh_snapshots", alias=using, branch_ids=branch_ids, moments=[moment.isoformat() for moment in moments],
+    ), using=using)
+
+
+# -------------------- Metrics --------------------
+@receiver(post_save, sender=StockMovement)
+def movement_written(sender, instance, created, raw, **kwargs):
+    # record_many saves raw rows on backends without bulk RETURNING; those
+    # are counted below with the rest of the batch.
+    if created and not raw:
+        metrics.movements_written.inc(
+            movement_type=instance.movement_type, payment_method=instance.payment_method or "none",
+        )
+
+
+@receiver(movements_recorded)
+def movements_bulk_written(sender, movements, **kwargs):
+    counts = Counter((m.movement_type, m.payment_method or "none") for m in movements)
+    for (movement_type, payment_method), count in counts.items():
+        metrics.movements_written.inc(count, movement_type=movement_type, payment_method=payment_method)
+
+
+# -------------------- Identity --------------------
+@receiver([post_save, post_delete], sender=AdminInfo)
+def admin_identity_changed(sender, instance, using, **kwargs):
+    identity.invalidate(admin_ids=[instance.id], using=using)
+
+
+@receiver([post_save, post_delete], sender=UserInfo)
+def user_identity_changed(sender, instance, using, **kwargs):
+    identity.invalidate(user_ids=[instance.id], using=using)
+
+
+@receiver([post_save, post_delete], sender=Branch)
+def branch_identity_changed(sender, instance, using, **kwargs):
+    identity.invalidate(user_ids=UserInfo.objects.filter(
+        Q(branch_id=instance.id) | Q(id=instance.manager_id)
+    ).values_list('id', flat=True), using=using)
+
+
+@receiver([post_save, post_delete], sender=Account)
+def account_identity_changed(sender, instance, using, **kwargs):
+    identity.invalidate(user_ids=UserInfo.objects.filter(account_id=instance.id).values_list('id', flat=True), using=using)
+
+
+# -------------------- Database --------------------
+@receiver(connection_created)
+def connection_opened(sender, connection, **kwargs):
+    if connection.vendor == "sqlite":
+        sqlite.tune(connection)
+
+
+@receiver(post_migrate)
+def shard_migrated(sender, using, **kwargs):
+    if sender.name == "app" and using in settings.SHARDS:
+        sharding.reserve_ids(using)
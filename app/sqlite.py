@@ -0,0 +1,129 @@
+"""
+SQLite under concurrent load.
+
+``tune(connection)`` applies ``SQLITE_PRAGMAS`` (WAL, synchronous=NORMAL,
+busy timeout, mmap and page cache) to each new SQLite connection; see the
+connection_created receiver in app.signals.
+
+``record(movements)`` saves a sale or stock change. With ``GROUP_COMMIT``
+on (and an SQLite database) calls from every thread of the process are
+handed to one writer thread, which saves whatever has queued up in a single
+transaction: one write lock and one commit for many requests instead of one
+each (one per shard when callers write to several). Each caller's
+movements still get their own savepoint, so one oversell fails only that
+caller. Otherwise, or when the caller is already inside a transaction, it
+is ``StockMovement.objects.record_many``.
+"""
+import queue
+import threading
+from concurrent.futures import Future
+
+from django.conf import settings
+from django.db import close_old_connections, router, transaction
+
+from . import routers, sharding
+from .models import StockMovement
+
+
+def tune(connection):
+    with connection.cursor() as cursor:
+        for name, value in settings.SQLITE_PRAGMAS.items():
+            cursor.execute(f"PRAGMA {name} = {value}")
+
+
+class GroupCommitWriter:
+    def __init__(self, max_batch):
+        self.max_batch = max_batch
+        self.queue = queue.Queue()
+        self._thread = None
+        self._start_lock = threading.Lock()
+
+    def submit(self, movements):
+        """
+        Queue ``movements`` and wait until they are committed. Raises what
+        ``record_many`` raised for them.
+        """
+        future = Future()
+        # Queued under the lock so nothing lands between a dying thread
+        # draining the queue and the next thread starting.
+        with self._start_lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="group-commit", daemon=True)
+                self._thread.start()
+            self.queue.put((sharding.current.get(), movements, future))
+
+        result = future.result()
+        # The writer thread's queries never reach this request's routing state.
+        routers.note_write()
+        return result
+
+    def _run(self):
+        batch = []
+        try:
+            while True:
+                # Whatever arrived while the last commit ran goes in the next one.
+                batch = [self.queue.get()]
+                while len(batch) < self.max_batch:
+                    try:
+                        batch.append(self.queue.get_nowait())
+                    except queue.Empty:
+                        break
+                # The thread has no request context: commit each caller's
+                # movements on the shard that caller was routed to.
+                groups = {}
+                for alias, movements, future in batch:
+                    groups.setdefault(alias, []).append((movements, future))
+                for alias, group in groups.items():
+                    with sharding.use_shard(alias):
+                        self._commit(group)
+                batch = []
+        except BaseException as exc:
+            # Fail the batch in hand and everything still queued rather than
+            # leave those callers waiting; the next submit starts a new thread.
+            with self._start_lock:
+                self._thread = None
+                while True:
+                    try:
+                        batch.append(self.queue.get_nowait())
+                    except queue.Empty:
+                        break
+            for *_, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            raise
+
+    @staticmethod
+    def _commit(batch):
+        close_old_connections()
+        using = router.db_for_write(StockMovement)
+        results = []
+        try:
+            with transaction.atomic(using=using):
+                for movements, future in batch:
+                    try:
+                        with transaction.atomic(using=using):
+                            StockMovement.objects.record_many(movements)
+                        results.append((future, movements, None))
+                    except Exception as exc:
+                        results.append((future, None, exc))
+        except Exception as exc:
+            # The commit itself failed: nothing in the batch was saved.
+            for _, future in batch:
+                future.set_exception(exc)
+            return
+
+        for future, movements, exc in results:
+            if exc is None:
+                future.set_result(movements)
+            else:
+                future.set_exception(exc)
+
+
+writer = GroupCommitWriter(max_batch=settings.GROUP_COMMIT_MAX_BATCH)
+
+
+def record(movements):
+    connection = transaction.get_connection(router.db_for_write(StockMovement))
+    if settings.GROUP_COMMIT and connection.vendor == "sqlite" and not connection.in_atomic_block:
+        return writer.submit(movements)
+    return StockMovement.objects.record_many(movements)
@@ -0,0 +1,31 @@
+"""
+Static files storage.
+
+WhiteNoise's ``CompressedManifestStaticFilesStorage`` (hashed names plus
+gzip/brotli copies, see STORAGES in settings) resolves ``{% static %}``
+through the manifest ``collectstatic`` writes. Test runs and checkouts that
+never ran ``collectstatic`` have no manifest; they get the plain names,
+which WhiteNoise or ``runserver`` serve from the app's static folders.
+
+The vendored theme bundles reference fonts and source maps they do not
+ship; those references are left as they are instead of failing
+``collectstatic``.
+"""
+from whitenoise.storage import CompressedManifestStaticFilesStorage
+
+
+class StaticFilesStorage(CompressedManifestStaticFilesStorage):
+    def stored_name(self, name):
+        if not self.hashed_files:
+            return name
+        return super().stored_name(name)
+
+    def url_converter(self, name, hashed_files, template=None):
+        convert = super().url_converter(name, hashed_files, template)
+
+        def converter(matchobj):
+            try:
+                return convert(matchobj)
+            except ValueError:
+                return matchobj["matched"]
+        return converter
@@ -1,3 +1,1130 @@
-from django.test import TestCase
+import csv
+import io
+import json
+import os
+import runpy
+import tempfile
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from unittest import mock, skipUnless
 
-# Create your tests here.
+from django.conf import settings
+from django.contrib.sessions.models import Session
+from django.core.cache import cache
+from django.core import mail
+from django.core.exceptions import ValidationError
+from django.core.management import CommandError, call_command
+from django.db import OperationalError, connection, router, transaction
+from django.test import Client, SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from . import dashboard, identity, jobs, metrics, profiling, routers, sharding, sqlite
+from .bench import VIEWS, seed
+from .middleware import ReplicaMiddleware
+from .importers import import_movements, iter_rows
+from .models import (
+    KIGALI_TZ, AccountShard, AdminInfo, Account, Branch, DailySalesRollup, FailedJob, Job, PasswordResetOTP,
+    Product, Stock, StockMovement, StockSnapshot, UserInfo,
+)
+
+
+def create_shop():
+    account = Account.objects.create(name="Shop")
+    manager = UserInfo.objects.create(
+        account=account, firstname="Main", lastname="Manager",
+        email="manager@shop.test", password="secret", role="manager",
+    )
+    branch = Branch.objects.create(account=account, branch_name="Main", manager=manager)
+    product = Product.objects.create(
+        account=account, branch=branch, name="Soap", category="Care",
+        cost_price=10, selling_price=15,
+    )
+    return account, manager, branch, product
+
+
+def login(role, person):
+    """
+    A test client with a session for ``person``, as login_view would set it.
+    """
+    client = Client()
+    session = client.session
+    if role == "admin":
+        session.update({"admin_id": person.id, "role": "admin", "user_name": person.firstname})
+    else:
+        branch = person.branch if role == "staff" else person.managed_branch.first()
+        session.update({
+            "user_id": person.id, "role": role, "account_id": person.account_id,
+            "user_name": person.firstname, "branch_name": branch.branch_name, "branch_id": branch.id,
+        })
+    session.save()
+    client.cookies[settings.SESSION_COOKIE_NAME] = session.session_key
+    return client
+
+
+# -------------------- Stock adjustment --------------------
+class StockAdjustmentTests(TestCase):
+    def setUp(self):
+        self.account, self.manager, self.branch, self.product = create_shop()
+
+    def move(self, movement_type, quantity, **extra):
+        return StockMovement.objects.create(
+            product=self.product, branch=self.branch, movement_type=movement_type,
+            quantity=quantity, created_by=self.manager, **extra
+        )
+
+    def quantity(self):
+        return Stock.objects.get(product=self.product, branch=self.branch).quantity
+
+    def test_in_out_update_delete_keep_stock_in_sync(self):
+        receipt = self.move("IN", 10)
+        sale = self.move("OUT", 4, selling_amount=60, payment_method="cash")
+        self.assertEqual(self.quantity(), 6)
+
+        sale.quantity = 7
+        sale.save()
+        self.assertEqual(self.quantity(), 3)
+        self.assertEqual(sale.logs.last().before_qty, 10)
+
+        sale.delete()
+        self.assertEqual(self.quantity(), 10)
+
+        receipt.delete()
+        self.assertEqual(self.quantity(), 0)
+
+    def test_oversell_is_rejected_without_touching_stock(self):
+        self.move("IN", 3)
+        with self.assertRaisesMessage(ValidationError, "Only 3 available"):
+            self.move("OUT", 4, selling_amount=60, payment_method="cash")
+        self.assertEqual(self.quantity(), 3)
+        self.assertEqual(StockMovement.objects.count(), 1)
+
+    def test_adjust_reports_rows_changed(self):
+        self.assertEqual(Stock.objects.adjust(self.product.id, self.branch.id, 5), 1)
+        self.assertEqual(Stock.objects.adjust(self.product.id, self.branch.id, -6), 0)
+        self.assertEqual(Stock.objects.adjust(self.product.id, self.branch.id, -5), 1)
+        self.assertEqual(self.quantity(), 0)
+
+
+class ConcurrentStockAdjustmentTests(TransactionTestCase):
+    """
+    Parallel writers must neither lose updates nor oversell.
+    """
+    workers = 8
+    sales_per_worker = 10
+    max_attempts = 50
+    retry_delay = 0.01
+
+    def setUp(self):
+        self.account, self.manager, self.branch, self.product = create_shop()
+
+    def run_workers(self, movement_type):
+        results = []
+        self.barrier = threading.Barrier(self.workers)
+        threads = [threading.Thread(target=self.write, args=(movement_type, results)) for _ in range(self.workers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        if "locked" in results:
+            self.fail(f"A write was still locked out after {self.max_attempts} attempts.")
+        return results
+
+    def write(self, movement_type, results):
+        try:
+            self.barrier.wait()
+            for _ in range(self.sales_per_worker):
+                # SQLite reports lock contention instead of waiting; retry it.
+                for _ in range(self.max_attempts):
+                    try:
+                        StockMovement.objects.create(
+                            product=self.product, branch=self.branch, movement_type=movement_type,
+                            quantity=1, selling_amount=15, payment_method="cash",
+                            created_by=self.manager,
+                        )
+                        results.append("ok")
+                        break
+                    except OperationalError:
+                        time.sleep(self.retry_delay)
+                    except ValidationError:
+                        results.append("rejected")
+                        break
+                else:
+                    results.append("locked")
+        finally:
+            connection.close()
+
+    def test_parallel_receipts_do_not_lose_updates(self):
+        results = self.run_workers("IN")
+
+        expected = self.workers * self.sales_per_worker
+        self.assertEqual(results.count("ok"), expected)
+        self.assertEqual(Stock.objects.get(product=self.product, branch=self.branch).quantity, expected)
+
+    def test_parallel_sales_never_oversell(self):
+        available = self.workers * self.sales_per_worker // 2
+        StockMovement.objects.create(
+            product=self.product, branch=self.branch, movement_type="IN",
+            quantity=available, created_by=self.manager,
+        )
+
+        results = self.run_workers("OUT")
+
+        self.assertEqual(results.count("ok"), available)
+        self.assertEqual(results.count("rejected"), self.workers * self.sales_per_worker - available)
+        self.assertEqual(Stock.objects.get(product=self.product, branch=self.branch).quantity, 0)
+        self.assertEqual(StockMovement.objects.filter(movement_type="OUT").count(), available)
+
+
+# -------------------- Group commit --------------------
+class GroupCommitTests(TransactionTestCase):
+    def setUp(self):
+        self.account, self.manager, self.branch, self.product = create_shop()
+        StockMovement.objects.create(
+            product=self.product, branch=self.branch, movement_type="IN", quantity=10, created_by=self.manager,
+        )
+        self.writer = sqlite.GroupCommitWriter(max_batch=10)
+        self.batches = []
+        self.release = threading.Event()
+        commit = sqlite.GroupCommitWriter._commit
+
+        def held_commit(batch):
+            # Hold the first commit so the next callers queue up behind it.
+            self.batches.append(len(batch))
+            self.release.wait(5)
+            commit(batch)
+
+        patcher = mock.patch.object(sqlite.GroupCommitWriter, "_commit", staticmethod(held_commit))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(self.release.set)
+
+    def sell(self, quantity, results):
+        try:
+            self.writer.submit([StockMovement(
+                product=self.product, branch=self.branch, movement_type="OUT", quantity=quantity,
+                selling_amount=15 * quantity, payment_method="cash", created_by=self.manager,
+            )])
+            results.append(quantity)
+        except ValidationError as e:
+            results.append(e)
+        finally:
+            connection.close()
+
+    def wait_for(self, condition):
+        deadline = time.monotonic() + 5
+        while not condition() and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def test_queued_callers_commit_together_and_an_oversell_fails_only_its_caller(self):
+        results = []
+        first = threading.Thread(target=self.sell, args=(1, results))
+        first.start()
+        self.wait_for(lambda: self.batches)
+        queued = [threading.Thread(target=self.sell, args=(quantity, results)) for quantity in (2, 20, 3)]
+        for thread in queued:
+            thread.start()
+        self.wait_for(lambda: self.writer.queue.qsize() == 3)
+        self.release.set()
+        for thread in [first, *queued]:
+            thread.join()
+
+        self.assertEqual(self.batches, [1, 3])
+        self.assertEqual(sorted(r for r in results if isinstance(r, int)), [1, 2, 3])
+        [error] = [r for r in results if isinstance(r, ValidationError)]
+        self.assertIn("Only", " ".join(error.messages))
+        self.assertEqual(Stock.objects.quantity_of(self.product.id, self.branch.id), 4)
+        self.assertEqual(StockMovement.objects.filter(movement_type="OUT").count(), 3)
+
+
+# -------------------- Basket checkout --------------------
+class CheckoutTests(TestCase):
+    def setUp(self):
+        self.account, self.manager, self.branch, self.product = create_shop()
+        self.other = Product.objects.create(
+            account=self.account, branch=self.branch, name="Oil", category="Food",
+            cost_price=20, selling_price=25,
+        )
+        for product in (self.product, self.other):
+            StockMovement.objects.create(
+                product=product, branch=self.branch, movement_type="IN", quantity=5, created_by=self.manager,
+            )
+        self.client = login("manager", self.manager)
+
+    def checkout(self, body):
+        return self.client.post(
+            reverse("stock_checkout_view"), json.dumps(body), content_type="application/json",
+        )
+
+    def basket(self, *lines):
+        return {"branch": self.branch.id, "payment_method": "cash", "lines": list(lines)}
+
+    def test_basket_is_sold_in_one_receipt(self):
+        response = self.checkout(self.basket(
+            {"product": self.product.id, "quantity": 4, "selling_amount": "60"},
+            {"product": self.other.id, "quantity": 1},
+        ))
+
+        self.assertEqual(response.status_code, 200)
+        receipt = response.json()["receipt"]
+        self.assertEqual([line["profit"] for line in receipt["lines"]], ["20.00", "5.00"])
+        self.assertEqual(receipt["total_amount"], "85.00")
+        self.assertEqual(Stock.objects.quantity_of(self.product.id, self.branch.id), 1)
+        self.assertEqual(Stock.objects.quantity_of(self.other.id, self.branch.id), 4)
+
+    def test_short_line_rejects_the_whole_basket(self):
+        response = self.checkout(self.basket(
+            {"product": self.product.id, "quantity": 1},
+            {"product": self.other.id, "quantity": 6},
+        ))
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("Only 5 available", response.json()["error"])
+        self.assertEqual(StockMovement.objects.filter(movement_type="OUT").count(), 0)
+        self.assertEqual(Stock.objects.quantity_of(self.product.id, self.branch.id), 5)
+
+    def test_basket_is_saved_without_bulk_returning(self):
+        # MySQL cannot return ids from a bulk insert; movements are saved one by one.
+        with mock.patch.object(type(connection.features), "can_return_rows_from_bulk_insert", False):
+            response = self.checkout(self.basket({"product": self.product.id, "quantity": 2}))
+
+        self.assertEqual(response.status_code, 200)
+        sale = StockMovement.objects.get(movement_type="OUT")
+        self.assertIsNotNone(sale.created_at)
+        self.assertEqual(sale.logs.get().after_qty, 3)
+
+    def test_malformed_requests_get_400(self):
+        response = self.checkout([{"product": self.product.id, "quantity": 1}])
+        self.assertEqual(response.status_code, 400)
+
+        response = self.checkout(self.basket(
+            {"product": self.product.id, "quantity": 1, "selling_amount": "15"},
+            {"product": self.other.id, "quantity": 1, "selling_amount": "abc"},
+        ))
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()["lines"], [2])
+        self.assertEqual(StockMovement.objects.filter(movement_type="OUT").count(), 0)
+
+
+# -------------------- Movement history --------------------
+class MovementRecordsTests(TestCase):
+    def setUp(self):
+        self.account, self.manager, self.branch, self.product = create_shop()
+        self.movements = [
+            StockMovement.objects.create(
+                product=self.product, branch=self.branch, movement_type="IN", quantity=quantity, created_by=self.manager,
+            )
+            for quantity in (1, 2, 3, 4, 5)
+        ]
+        StockMovement.objects.create(
+            product=self.product, branch=self.branch, movement_type="OUT", quantity=1,
+            selling_amount=15, payment_method="momo", created_by=self.manager,
+        )
+        self.client = login("manager", self.manager)
+
+    def page(self, **params):
+        response = self.client.get(reverse("stock_movement_records_page"), {"format": "json", **params})
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_pages_follow_the_cursor_newest_first(self):
+        ids = [m.id for m in reversed(self.movements)]
+
+        first = self.page(movement_type="IN", page_size=2)
+        second = self.page(movement_type="IN", page_size=2, cursor=first["next_cursor"])
+        last = self.page(movement_type="IN", page_size=2, cursor=second["next_cursor"])
+
+        self.assertEqual([row["id"] for row in first["results"]], ids[:2])
+        self.assertEqual([row["id"] for row in second["results"]], ids[2:4])
+        self.assertEqual([row["id"] for row in last["results"]], ids[4:])
+        self.assertIsNone(last["next_cursor"])
+
+    def test_filters_and_account_scope_apply_on_the_server(self):
+        other = Account.objects.create(name="Other")
+        other_branch = Branch.objects.create(account=other, branch_name="Elsewhere")
+        other_product = Product.objects.create(
+            account=other, branch=other_branch, name="Soap", category="Care", cost_price=1, selling_price=2,
+        )
+        StockMovement.objects.create(product=other_product, branch=other_branch, movement_type="IN", quantity=9)
+
+        self.assertEqual([row["quantity"] for row in self.page(payment_method="momo")["results"]], [1])
+        self.assertEqual(len(self.page(q="soap")["results"]), 6)
+        self.assertEqual(self.page(date_from="2000-01-01", date_to="2000-01-31")["results"], [])
+
+
+class MovementExportTests(TestCase):
+    def setUp(self):
+        self.account, self.manager, self.branch, self.product = create_shop()
+        self.second = Branch.objects.create(account=self.account, branch_name="Second")
+        self.staff = UserInfo.objects.create(
+            account=self.account, branch=self.second, firstname="Sam", lastname="Staff",
+            email="staff@shop.test", password="secret", role="staff",
+        )
+        for branch, quantity in ((self.branch, 3), (self.second, 7)):
+            StockMovement.objects.create(
+                product=self.product, branch=branch, movement_type="IN", quantity=quantity, created_by=self.manager,
+            )
+        other = Account.objects.create(name="Other")
+        other_branch = Branch.objects.create(account=other, branch_name="Elsewhere")
+        other_product = Product.objects.create(
+            account=other, branch=other_branch, name="Oil", category="Food", cost_price=1, selling_price=2,
+        )
+        StockMovement.objects.create(product=other_product, branch=other_branch, movement_type="IN", quantity=9)
+
+    def export(self, client, **params):
+        response = client.get(reverse("stock_movement_export_view"), params)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        lines = b"".join(response.streaming_content).decode("utf-8-sig").splitlines()
+        rows = list(csv.DictReader(lines))
+        return sorted((row["Branch"], row["Quantity"]) for row in rows)
+
+    def test_export_is_scoped_like_the_records_page(self):
+        manager = login("manager", self.manager)
+
+        self.assertEqual(self.export(manager), [("Main", "3"), ("Second", "7")])
+        self.assertEqual(self.export(manager, branch=self.second.id), [("Second", "7")])
+        self.assertEqual(self.export(manager, date_from="2000-01-01", date_to="2000-01-31"), [])
+        self.assertEqual(self.export(login("staff", self.staff)), [("Second", "7")])
+
+
+# -------------------- Bulk import --------------------
+class ImportTests(TestCase):
+    def setUp(self):
+        self.account, self.manager, self.branch, self.product = create_shop()
+
+    def run_import(self, text, filename="receipt.csv", **kwargs):
+        return import_movements(
+            iter_rows(io.StringIO(text), filename), Product.objects.all(), Branch.objects.all(),
+            default_branch=self.branch, created_by=self.manager, **kwargs
+        )
+
+    def test_good_rows_are_saved_and_bad_rows_reported(self):
+        imported, errors = self.run_import(
+            "product,movement_type,quantity,selling_amount,payment_method\n"
+            "Soap,IN,10,,\n"
+            "Soap,OUT,2,30,cash\n"
+            "Soap,OUT,1,abc,cash\n"
+            "Soap,OUT,1,15,card\n"
+            "Soap,OUT,20,300,cash\n"
+            "Candle,IN,5,,\n"
+        )
+
+        self.assertEqual(imported, 2)
+        self.assertEqual(sorted(line for line, _ in errors), [4, 5, 6, 7])
+        self.assertIn("Invalid selling amount", dict(errors)[4])
+        self.assertIn("Invalid payment method", dict(errors)[5])
+        self.assertIn("Only 8 available", dict(errors)[6])
+        self.assertEqual(Stock.objects.quantity_of(self.product.id, self.branch.id), 8)
+
+    def test_json_lines_are_read_one_object_at_a_time(self):
+        imported, errors = self.run_import(
+            '{"product": "Soap", "quantity": 3}\n{"product": "Soap", "quantity": "x"}\n', "receipt.jsonl",
+        )
+
+        self.assertEqual(imported, 1)
+        self.assertEqual(errors, [(2, "Quantity must be a whole number.")])
+
+    def test_bad_row_in_the_middle_only_rejects_that_row(self):
+        text = (
+            "product,movement_type,quantity,selling_amount,payment_method\n"
+            "Soap,IN,5,,\n"
+            "Soap,OUT,3,45,cash\n"
+            "Soap,OUT,10,150,cash\n"
+            "Soap,IN,20,,\n"
+            "Soap,OUT,4,60,cash\n"
+        )
+        for chunk_size in (20000, 2):
+            with self.subTest(chunk_size=chunk_size), transaction.atomic():
+                imported, errors = self.run_import(text, chunk_size=chunk_size)
+
+                self.assertEqual(imported, 4)
+                self.assertEqual(errors, [(4, "Cannot sell 10 units of Soap. Only 2 available.")])
+                self.assertEqual(Stock.objects.quantity_of(self.product.id, self.branch.id), 18)
+                transaction.set_rollback(True)
+
+    def test_stock_taken_by_another_writer_rejects_only_the_rows_that_no_longer_fit(self):
+        text = "product,movement_type,quantity\n" + "Soap,IN,1\n" * 6 + "Soap,OUT,7\n" + "Soap,IN,1\n"
+        with mock.patch("app.importers._check_stock", lambda chunk, errors: chunk):
+            imported, errors = self.run_import(text)
+
+        self.assertEqual(imported, 7)
+        self.assertEqual([line for line, _ in errors], [8])
+        self.assertEqual(Stock.objects.quantity_of(self.product.id, self.branch.id), 7)
+
+    def test_unreadable_file_keeps_the_rows_already_saved(self):
+        imported, errors = self.run_import(
+            '{"product": "Soap", "quantity": 3}\n{"product": "Soap", "quantity": 2}\n{"product": ',
+            "receipt.jsonl", chunk_size=1,
+        )
+
+        self.assertEqual(imported, 2)
+        self.assertEqual(len(errors), 1)
+        self.assertEqual(errors[0][0], 0)
+        self.assertTrue(errors[0][1].startswith("Could not read file:"))
+        self.assertEqual(Stock.objects.quantity_of(self.product.id, self.branch.id), 5)
+
+
+# -------------------- Daily sales rollup --------------------
+class DailySalesRollupTests(TestCase):
+    def setUp(self):
+        self.account, self.manager, self.branch, self.product = create_shop()
+        StockMovement.objects.create(
+            product=self.product, branch=self.branch, movement_type="IN", quantity=20, created_by=self.manager,
+        )
+
+    def sell(self, quantity, amount, payment_method="cash"):
+        return StockMovement.objects.create(
+            product=self.product, branch=self.branch, movement_type="OUT", quantity=quantity,
+            selling_amount=amount, payment_method=payment_method, created_by=self.manager,
+        )
+
+    def totals(self):
+        return {
+            row.payment_method: (row.quantity, row.sales_amount, row.profit, row.count)
+            for row in DailySalesRollup.objects.filter(branch=self.branch)
+        }
+
+    def test_sales_edits_and_deletes_keep_rollup_in_step(self):
+        sale = self.sell(2, 30)
+        self.sell(1, 15)
+        self.assertEqual(self.totals(), {"cash": (3, 45, 15, 2)})
+
+        sale.quantity, sale.selling_amount, sale.payment_method = 4, 60, "momo"
+        sale.save()
+        self.assertEqual(self.totals(), {"cash": (1, 15, 5, 1), "momo": (4, 60, 20, 1)})
+
+        sale.delete()
+        self.assertEqual(self.totals(), {"cash": (1, 15, 5, 1)})
+
+    def test_bulk_sales_and_rebuild_agree(self):
+        StockMovement.objects.record_many([
+            StockMovement(
+                product=self.product, branch=self.branch, movement_type="OUT", quantity=1,
+                selling_amount=15, payment_method="cash", created_by=self.manager,
+            )
+            for _ in range(3)
+        ])
+        recorded = self.totals()
+        self.assertEqual(recorded, {"cash": (3, 45, 15, 3)})
+
+        DailySalesRollup.objects.all().delete()
+        DailySalesRollup.objects.rebuild()
+        self.assertEqual(self.totals(), recorded)
+
+
+# -------------------- Dashboard --------------------
+class DashboardCacheTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.account, self.manager, self.branch, self.product = create_shop()
+
+    def test_counters_are_cached_until_a_write_in_their_scope(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            StockMovement.objects.create(
+                product=self.product, branch=self.branch, movement_type="IN", quantity=4, created_by=self.manager,
+            )
+        self.assertEqual(dashboard.account_metrics(self.account.id)["total_stock"], 4)
+        self.assertEqual(dashboard.branch_metrics(self.branch.id)["total_stock"], 4)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(dashboard.account_metrics(self.account.id)["total_stock"], 4)
+            self.assertEqual(dashboard.branch_metrics(self.branch.id)["total_products"], 1)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            StockMovement.objects.create(
+                product=self.product, branch=self.branch, movement_type="IN", quantity=6, created_by=self.manager,
+            )
+        self.assertEqual(dashboard.account_metrics(self.account.id)["total_stock"], 10)
+        self.assertEqual(dashboard.branch_metrics(self.branch.id)["total_stock"], 10)
+
+
+class AccountStatsTests(TestCase):
+    # The admin settings page reads every shard.
+    databases = "__all__"
+
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.account, self.manager, self.branch, self.product = create_shop()
+        second = Branch.objects.create(account=self.account, branch_name="Second")
+        for name in ("Sam", "Sue"):
+            UserInfo.objects.create(
+                account=self.account, branch=second, firstname=name, lastname="Staff",
+                email=f"{name.lower()}@shop.test", password="secret", role="staff",
+            )
+        oil = Product.objects.create(
+            account=self.account, branch=self.branch, name="Oil", category="Food", cost_price=20, selling_price=25,
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            for product, quantity in ((self.product, 5), (oil, 3)):
+                StockMovement.objects.create(
+                    product=product, branch=self.branch, movement_type="IN", quantity=quantity, created_by=self.manager,
+                )
+            StockMovement.objects.create(
+                product=self.product, branch=self.branch, movement_type="OUT", quantity=2,
+                selling_amount=30, payment_method="cash", created_by=self.manager,
+            )
+
+    def test_each_metric_is_counted_once_per_account(self):
+        # Users x products x movements would inflate these in a single join.
+        [account] = dashboard.account_stats(Account.objects.filter(id=self.account.id))
+
+        self.assertEqual(
+            {metric: getattr(account, metric) for metric in dashboard.ACCOUNT_STATS},
+            {
+                "total_users": 3, "managers_count": 1, "staff_count": 2, "branches_count": 2,
+                "products_count": 2, "stock_value": 90, "monthly_sales": 30,
+            },
+        )
+
+        accounts = list(Account.objects.filter(id=self.account.id))
+        with self.assertNumQueries(0):
+            dashboard.account_stats(accounts)
+        self.assertEqual(accounts[0].products_count, 2)
+
+    def test_settings_page_lists_the_stats(self):
+        admin = AdminInfo.objects.create(firstname="Ada", lastname="Admin", email="ada@shop.test", password="secret")
+
+        response = login("admin", admin).get(reverse("settings_view"))
+
+        self.assertEqual(response.status_code, 200)
+        [account] = [a for a in response.context["accounts"] if a.id == self.account.id]
+        self.assertEqual((account.total_users, account.products_count, account.stock_value), (3, 2, 90))
+
+
+# -------------------- Request identity --------------------
+class IdentityTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        self.account, self.manager, self.branch, self.product = create_shop()
+        self.request = mock.Mock(session={"user_id": self.manager.id})
+
+    def test_identity_is_cached_until_the_branch_changes(self):
+        resolved = identity.resolve(self.request)
+        self.assertEqual(
+            (resolved.role, resolved.user, resolved.account, resolved.branch),
+            ("manager", self.manager, self.account, self.branch),
+        )
+
+        with self.assertNumQueries(0):
+            cached = identity.resolve(self.request)
+            self.assertEqual((cached.account.name, cached.branch.branch_name), ("Shop", "Main"))
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.branch.branch_name = "Downtown"
+            self.branch.save()
+        self.assertEqual(identity.resolve(self.request).branch.branch_name, "Downtown")
+
+    def test_unknown_session_user_is_anonymous(self):
+        self.request.session["user_id"] = self.manager.id + 100
+        self.assertFalse(identity.resolve(self.request).is_authenticated)
+
+
+# -------------------- Background jobs --------------------
+class JobQueueTests(TestCase):
+    # Compaction runs on every shard.
+    databases = "__all__"
+
+    def test_worker_sends_queued_email(self):
+        jobs.enqueue("send_email", subject="OTP", message="1234", recipients=["a@example.com"])
+        self.assertEqual(mail.outbox, [])
+
+        call_command("run_worker", once=True, stdout=io.StringIO())
+
+        self.assertEqual([message.to for message in mail.outbox], [["a@example.com"]])
+        self.assertFalse(Job.objects.exists())
+
+    def test_failing_job_backs_off_then_moves_to_failed_jobs(self):
+        job = jobs.enqueue("command", max_attempts=2, command="flush")
+
+        self.assertFalse(jobs.run(job))
+        job.refresh_from_db()
+        self.assertEqual(job.attempts, 1)
+        self.assertGreater(job.run_at, timezone.now())
+
+        self.assertFalse(jobs.run(job))
+        self.assertFalse(Job.objects.exists())
+        self.assertEqual(FailedJob.objects.get().attempts, 2)
+
+        self.assertEqual(jobs.retry_failed(), 1)
+        self.assertEqual(Job.objects.get().task, "command")
+
+    def test_password_reset_otps_are_purged_once_expired(self):
+        account, manager, branch, product = create_shop()
+        Client().post(reverse("forgot-password-otp"), {"email": manager.email})
+        job = Job.objects.get(task="purge_otps")
+        self.assertGreaterEqual(job.run_at, timezone.now() + timedelta(minutes=9))
+
+        stale = PasswordResetOTP.objects.create(email="old@shop.test", otp="123456")
+        PasswordResetOTP.objects.filter(pk=stale.pk).update(created_at=timezone.now() - timedelta(minutes=11))
+        Job.objects.filter(pk=job.pk).update(run_at=timezone.now())
+        call_command("run_worker", once=True, stdout=io.StringIO())
+
+        self.assertEqual(list(PasswordResetOTP.objects.values_list("email", flat=True)), [manager.email])
+        self.assertFalse(Job.objects.filter(task="purge_otps").exists())
+
+    def test_back_dated_edit_retakes_dropped_snapshots(self):
+        account, manager, branch, product = create_shop()
+        movement = StockMovement.objects.create(
+            product=product, branch=branch, movement_type="IN", quantity=5, created_by=manager,
+        )
+        StockMovement.objects.filter(pk=movement.pk).update(created_at=timezone.now() - timedelta(days=2))
+        movement.refresh_from_db()
+        moment = timezone.now() - timedelta(days=1)
+        StockSnapshot.objects.take([branch.id], moment)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            movement.quantity = 8
+            movement.save()
+        self.assertFalse(StockSnapshot.objects.exists())
+
+        call_command("run_worker", once=True, stdout=io.StringIO())
+        self.assertEqual(list(StockSnapshot.objects.values_list("taken_at", "quantity")), [(moment, 8)])
+
+    def test_compaction_keeps_month_starts(self):
+        account, manager, branch, product = create_shop()
+        month_start, now = datetime(2020, 3, 1, tzinfo=KIGALI_TZ), timezone.now()
+        movement = StockMovement.objects.create(
+            product=product, branch=branch, movement_type="IN", quantity=5, created_by=manager,
+        )
+        StockMovement.objects.filter(pk=movement.pk).update(created_at=month_start - timedelta(days=30))
+        for moment in (month_start, month_start + timedelta(days=1), now):
+            StockSnapshot.objects.take([branch.id], moment)
+
+        jobs.compact_snapshots()
+
+        self.assertEqual(sorted(StockSnapshot.objects.values_list("taken_at", flat=True)), [month_start, now])
+
+
+# -------------------- Instrumentation --------------------
+class RequestTimingTests(TestCase):
+    def setUp(self):
+        self.account, self.manager, self.branch, self.product = create_shop()
+        self.client = login("manager", self.manager)
+
+    @override_settings(SLOW_REQUEST_THRESHOLD_MS=0, SLOW_REQUEST_TOP_SQL=2)
+    def test_server_timing_header_and_slow_request_log(self):
+        with self.assertLogs("app.slow_requests", "WARNING") as logs:
+            response = self.client.get(reverse("stock_view"))
+
+        self.assertEqual(response.status_code, 200)
+        timing = dict(part.split(";", 1) for part in response["Server-Timing"].split(", "))
+        self.assertEqual(set(timing), {"db", "tpl", "app", "total"})
+
+        [entry] = [json.loads(record.getMessage()) for record in logs.records]
+        self.assertEqual((entry["view"], entry["role"], entry["account_id"]), ("stock_view", "manager", self.account.id))
+        self.assertIn(f'desc="{entry["queries"]} queries"', timing["db"])
+        self.assertGreater(entry["queries"], 0)
+        self.assertLessEqual(len(entry["slowest_sql"]), 2)
+        self.assertGreater(entry["template_ms"], 0)
+
+    @override_settings(SLOW_REQUEST_THRESHOLD_MS=60000)
+    def test_fast_requests_are_not_logged(self):
+        with self.assertNoLogs("app.slow_requests", "WARNING"):
+            self.client.get(reverse("stock_view"))
+
+
+class ProfilingTests(TestCase):
+    # Admin pages read every shard.
+    databases = "__all__"
+
+    def setUp(self):
+        self.account, self.manager, self.branch, self.product = create_shop()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+        self.enterContext(override_settings(PROFILE_DIR=directory.name, PROFILER="cprofile", PROFILE_VIEWS=[]))
+
+    def test_only_admins_can_ask_for_a_profile(self):
+        manager = login("manager", self.manager)
+        self.assertNotIn("X-Profile-File", manager.get(reverse("stock_view"), HTTP_X_PROFILE="1"))
+
+        admin = AdminInfo.objects.create(firstname="Ada", lastname="Admin", email="ada@shop.test", password="secret")
+        response = login("admin", admin).get(reverse("stock_view"), {"_profile": "1"})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue((self.directory / response["X-Profile-File"]).is_file())
+
+        out = io.StringIO()
+        call_command("profiles", stdout=out)
+        self.assertIn(response["X-Profile-File"], out.getvalue())
+        self.assertIn("stock_view", out.getvalue())
+
+    def test_listed_views_are_profiled_and_old_files_rotated(self):
+        for age, name in enumerate(("c.prof", "b.prof", "a.collapsed")):
+            path = self.directory / name
+            path.write_text("")
+            os.utime(path, (time.time() - 100 * (age + 1),) * 2)
+
+        with override_settings(PROFILE_VIEWS=["stock_view"], PROFILE_KEEP=2):
+            response = login("manager", self.manager).get(reverse("stock_view"))
+
+        self.assertEqual(
+            [path.name for path in profiling.profiles(self.directory)], [response["X-Profile-File"], "c.prof"],
+        )
+
+
+# -------------------- Sessions --------------------
+class SessionWriteTests(TestCase):
+    def setUp(self):
+        self.account, self.manager, self.branch, self.product = create_shop()
+        self.client = login("manager", self.manager)
+
+    def session_writes(self):
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self.client.get(reverse("stock_view")).status_code, 200)
+        return [
+            query["sql"] for query in queries
+            if "django_session" in query["sql"] and not query["sql"].lstrip().upper().startswith("SELECT")
+        ]
+
+    def test_session_is_written_only_when_it_changes(self):
+        self.assertEqual(len(self.session_writes()), 1)  # was_logged_in is set once
+        self.assertEqual(self.session_writes(), [])
+        self.assertEqual(self.session_writes(), [])
+
+    def test_expired_sessions_are_cleared_in_batches(self):
+        Session.objects.create(session_key="old1", session_data="", expire_date=timezone.now() - timedelta(days=1))
+        Session.objects.create(session_key="old2", session_data="", expire_date=timezone.now() - timedelta(days=1))
+        out = io.StringIO()
+
+        call_command("clear_expired_sessions", batch_size=1, stdout=out)
+
+        self.assertIn("Deleted 2 expired sessions.", out.getvalue())
+        self.assertEqual(Session.objects.count(), 1)  # the live login
+
+
+# -------------------- Metrics --------------------
+class MetricsTests(TestCase):
+    def test_workers_files_are_summed(self):
+        registry = metrics.registry
+        with tempfile.TemporaryDirectory() as directory, override_settings(METRICS_DIR=directory):
+            own = registry.snapshot()
+            conflicts = dict((tuple(k), v) for k, v in own["stock_adjust_conflicts"])[()]
+            latency = dict((tuple(k), v) for k, v in own["http_request_duration_seconds"])
+            home = latency.get(("home", "GET"), [0] * (len(metrics.LATENCY_BUCKETS) + 2))
+            # A worker that has since exited: 3 conflicts, one 4ms request.
+            (Path(directory) / "1.json").write_text(json.dumps({
+                "stock_adjust_conflicts": [[[], 3]],
+                "http_request_duration_seconds": [[["home", "GET"], [1] + [0] * 10 + [0.004, 1]]],
+            }))
+
+            totals = registry.collect()
+            text = registry.render()
+
+        self.assertEqual(totals["stock_adjust_conflicts"][()], conflicts + 3)
+        self.assertEqual(totals["http_request_duration_seconds"][("home", "GET")][-1], home[-1] + 1)
+        self.assertEqual(totals["http_request_duration_seconds"][("home", "GET")][0], home[0] + 1)
+        self.assertIn(f"stock_adjust_conflicts_total {conflicts + 3}", text)
+
+    def test_changes_are_flushed_on_a_timer(self):
+        registry = metrics.registry
+        with tempfile.TemporaryDirectory() as directory, override_settings(METRICS_DIR=directory, METRICS_FLUSH_INTERVAL=0.05):
+            registry.flush()
+            metrics.stock_conflicts.inc()
+            expected = registry.snapshot()["stock_adjust_conflicts"]
+            path = Path(directory) / f"{os.getpid()}.json"
+
+            deadline = time.monotonic() + 5
+            while json.loads(path.read_text())["stock_adjust_conflicts"] != expected and time.monotonic() < deadline:
+                time.sleep(0.01)
+
+            self.assertEqual(json.loads(path.read_text())["stock_adjust_conflicts"], expected)
+
+    def test_endpoint_needs_the_token_or_an_admin(self):
+        url = reverse("metrics")
+        self.assertEqual(Client().get(url).status_code, 403)
+
+        with override_settings(METRICS_TOKEN="scrape"):
+            self.assertEqual(Client().get(url, HTTP_AUTHORIZATION="Bearer wrong").status_code, 403)
+            self.assertEqual(Client().get(url, HTTP_AUTHORIZATION="Bearer scrape").status_code, 200)
+
+        admin = AdminInfo.objects.create(firstname="Ada", lastname="Admin", email="ada@shop.test", password="secret")
+        self.assertEqual(login("admin", admin).get(url).status_code, 200)
+        account, manager, branch, product = create_shop()
+        self.assertEqual(login("manager", manager).get(url).status_code, 403)
+
+
+# -------------------- Database settings --------------------
+class DatabaseSettingsTests(SimpleTestCase):
+    databases = {"default"}
+
+    def load_settings(self, **environ):
+        with mock.patch.dict(os.environ, environ):
+            for name in ("DATABASE_URL", "DB_POOL_MAX_SIZE", "DB_CONN_MAX_AGE"):
+                if name not in environ:
+                    os.environ.pop(name, None)
+            return runpy.run_path(str(Path(settings.BASE_DIR) / "Stock" / "settings.py"))["DATABASES"]["default"]
+
+    def test_sqlite_keeps_connections_and_takes_the_write_lock_up_front(self):
+        database = self.load_settings()
+
+        self.assertEqual(database["ENGINE"], "django.db.backends.sqlite3")
+        self.assertEqual((database["CONN_MAX_AGE"], database["CONN_HEALTH_CHECKS"]), (600, True))
+        self.assertEqual(database["OPTIONS"]["transaction_mode"], "IMMEDIATE")
+
+    def test_database_url_selects_postgres_with_a_pool(self):
+        database = self.load_settings(DATABASE_URL="postgres://stock:secret@db:5432/stock", DB_POOL_MAX_SIZE="8")
+
+        self.assertEqual((database["ENGINE"], database["HOST"], database["NAME"]), ("django.db.backends.postgresql", "db", "stock"))
+        # Django refuses persistent connections together with a pool.
+        self.assertEqual(database["CONN_MAX_AGE"], 0)
+        self.assertEqual(database["OPTIONS"]["pool"], {"min_size": 0, "max_size": 8})
+        self.assertIn("statement_timeout=30000", database["OPTIONS"]["options"])
+
+        database = self.load_settings(DATABASE_URL="postgres://stock:secret@db:5432/stock", DB_CONN_MAX_AGE="60")
+        self.assertEqual((database["CONN_MAX_AGE"], database["CONN_HEALTH_CHECKS"]), (60, True))
+        self.assertNotIn("pool", database["OPTIONS"])
+
+    def test_new_sqlite_connections_are_tuned(self):
+        with connection.cursor() as cursor:
+            cursor.execute("PRAGMA busy_timeout")
+            self.assertEqual(cursor.fetchone()[0], settings.SQLITE_PRAGMAS["busy_timeout"])
+            cursor.execute("PRAGMA synchronous")
+            self.assertEqual(cursor.fetchone()[0], 1)  # NORMAL
+
+
+# -------------------- Routing --------------------
+class RoutingTests(SimpleTestCase):
+    def setUp(self):
+        self.state = routers.RequestRouting()
+        token = routers.routing.set(self.state)
+        self.addCleanup(routers.routing.reset, token)
+
+    def test_shard_accounts_use_their_shard(self):
+        with sharding.use_shard("shard1"):
+            self.assertEqual(router.db_for_read(Branch), "shard1")
+            self.assertEqual(router.db_for_write(StockMovement), "shard1")
+            self.assertEqual(router.db_for_read(AdminInfo), "default")
+
+    def test_default_accounts_go_through_the_replica_router(self):
+        with sharding.use_shard("default"):
+            self.assertEqual(router.db_for_write(StockMovement), "default")
+        self.assertTrue(self.state.wrote)
+
+    def test_rows_loaded_from_a_shard_are_written_back_there(self):
+        user = UserInfo(id=1)
+        user._state.db = "shard1"
+        self.assertEqual(router.db_for_write(UserInfo, instance=user), "shard1")
+        self.assertEqual(router.db_for_read(Branch, instance=user), "shard1")
+
+        user._state.db = routers.REPLICA
+        self.assertEqual(router.db_for_write(UserInfo, instance=user), "default")
+
+    @override_settings(REPLICA_PIN_SECONDS=10)
+    def test_reads_after_a_write_are_pinned_to_the_primary(self):
+        reads = []
+
+        @routers.replica_reads
+        def view(request):
+            if request.method == "POST":
+                router.db_for_write(StockMovement)
+            reads.append(router.db_for_read(Product))
+            return None
+
+        session = {}
+        middleware = ReplicaMiddleware(view)
+        with mock.patch.object(routers, "replica_configured", return_value=True):
+            for method in ("GET", "POST", "GET"):
+                middleware(mock.Mock(method=method, session=session))
+            session[routers.WRITE_KEY] -= 11  # the pin has run out
+            middleware(mock.Mock(method="GET", session=session))
+
+        self.assertEqual(reads, [routers.REPLICA, "default", "default", routers.REPLICA])
+
+    @override_settings(SHARDS=["shard1"])
+    def test_per_shard_keeps_replica_reads_on_default(self):
+        movements = StockMovement.objects.all()
+        self.assertEqual([part.db for part in sharding.per_shard(movements)], ["default", "shard1"])
+        self.assertEqual(
+            [part.db for part in sharding.per_shard(movements.using(routers.REPLICA))], [routers.REPLICA, "shard1"],
+        )
+        with sharding.use_shard("shard1"):
+            self.assertEqual([part.db for part in sharding.per_shard(movements)], ["shard1"])
+
+
+@override_settings(SHARDS=["shard1"], SHARD_CACHE_TIMEOUT=0)
+class ShardDirectoryTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.account, self.manager, self.branch, self.product = create_shop()
+
+    def test_moving_account_refuses_writes_but_serves_reads(self):
+        AccountShard.objects.create(account_id=self.account.id, alias="default", moving=True)
+        client = login("manager", self.manager)
+
+        self.assertEqual(client.get(reverse("products")).status_code, 200)
+        response = client.post(reverse("products"), {"action": "delete", "product_id": self.product.id})
+        self.assertEqual(response.status_code, 503)
+        self.assertTrue(Product.objects.filter(id=self.product.id).exists())
+
+    def test_move_account_checks_its_target(self):
+        with self.assertRaisesMessage(CommandError, "Unknown shard 'nowhere'"):
+            call_command("move_account", self.account.id, "nowhere")
+        with self.assertRaisesMessage(CommandError, f"Account {self.account.id} is already on default"):
+            call_command("move_account", self.account.id, "default")
+
+
+@skipUnless(settings.SHARDS, "Set SHARD_DATABASE_URLS to test moving accounts between databases.")
+@override_settings(SHARD_CACHE_TIMEOUT=0)
+class ShardMoveTests(TransactionTestCase):
+    databases = "__all__"
+
+    def test_move_copies_rows_and_routes_the_account_there(self):
+        target = settings.SHARDS[0]
+        account, manager, branch, product = create_shop()
+        movement = StockMovement.objects.create(
+            product=product, branch=branch, movement_type="IN", quantity=5, created_by=manager,
+        )
+        StockMovement.objects.filter(pk=movement.pk).update(created_at=timezone.now() - timedelta(days=3))
+        movement.refresh_from_db()
+        StockMovement.objects.create(
+            product=product, branch=branch, movement_type="OUT", quantity=1,
+            selling_amount=15, payment_method="cash", created_by=manager,
+        )
+        StockSnapshot.objects.take([branch.id], timezone.now())
+
+        call_command("move_account", account.id, target, stdout=io.StringIO())
+
+        self.assertEqual(AccountShard.objects.get(account_id=account.id).alias, target)
+        for model in sharding.sharded_models():
+            with self.subTest(model=model.__name__):
+                self.assertFalse(model.objects.using("default").exists())
+                self.assertTrue(model.objects.using(target).exists())
+        moved = StockMovement.objects.using(target).get(id=movement.id)
+        self.assertEqual(moved.created_at, movement.created_at)
+
+        client = login("manager", UserInfo.objects.using(target).get(id=manager.id))
+        response = client.post(reverse("products"), {
+            "action": "add", "name": "Towel", "branch": branch.id, "category": "Home",
+            "cost_price": "1.00", "selling_price": "2.00",
+        })
+        self.assertEqual(response.status_code, 302)
+        added = Product.objects.using(target).get(name="Towel")
+        self.assertGreaterEqual(added.id, settings.SHARD_ID_BLOCK)
+
+    def test_admin_edits_and_password_resets_reach_the_shard(self):
+        target = settings.SHARDS[0]
+        account, manager, branch, product = create_shop()
+        call_command("move_account", account.id, target, stdout=io.StringIO())
+
+        admin = AdminInfo.objects.create(firstname="Root", lastname="Admin", email="root@shop.test", password="x")
+        response = login("admin", admin).post(reverse("products"), {
+            "action": "update", "product_id": product.id, "branch": branch.id, "name": "Soap bar",
+            "category": "Care", "cost_price": "10", "selling_price": "16",
+        })
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(Product.objects.using(target).get(id=product.id).name, "Soap bar")
+
+        PasswordResetOTP.objects.create(email=manager.email, otp="123456")
+        client = Client()
+        session = client.session
+        session["reset_email"] = manager.email
+        session.save()
+        client.cookies[settings.SESSION_COOKIE_NAME] = session.session_key
+        response = client.post(reverse("verify-otp"), {
+            "otp": "123456", "password": "New#pass1", "confirm": "New#pass1",
+        })
+        self.assertRedirects(response, reverse("login_view"), fetch_redirect_response=False)
+        self.assertTrue(UserInfo.objects.using(target).get(id=manager.id).check_password("New#pass1"))
+        self.assertFalse(UserInfo.objects.using("default").exists())
+
+
+# -------------------- Query budgets --------------------
+class ViewQueryBudgetTests(TestCase):
+    """
+    Every main view must run the same number of queries on small and large
+    data, within its budget, so a lazy foreign-key access per row (in a
+    view or a template) fails here. Counts are taken on a warm cache.
+    """
+    # Admin pages query every shard; only default's queries are counted.
+    databases = "__all__"
+
+    SIZES = (
+        {"accounts": 1, "branches": 1, "products": 2, "staff": 1, "movements": 20, "days": 3},
+        {"accounts": 2, "branches": 3, "products": 6, "staff": 3, "movements": 200, "days": 3},
+    )
+
+    # Queries per request, the session lookup included.
+    BUDGETS = {
+        "admin": {
+            "index": 1, "products_view": 2, "stock_movement_view": 4, "stock_movement_all_records_view": 4,
+            "stock_view": 2, "report_view": 4, "settings_view": 4,
+        },
+        "manager": {
+            "index": 1, "products_view": 3, "stock_movement_view": 4, "stock_movement_all_records_view": 4,
+            "stock_view": 2, "report_view": 4, "settings_view": 4,
+        },
+        "staff": {
+            "index": 1, "products_view": 3, "stock_movement_view": 4, "stock_movement_all_records_view": 4,
+            "report_view": 4,
+        },
+    }
+
+    def measure(self, size):
+        """
+        Seed ``size``, record today's sales for every product and return
+        ``{(role, view): [sql, ...]}``. The data is rolled back afterwards.
+        """
+        queries = {}
+        with transaction.atomic():
+            cache.clear()
+            data = seed(**size)
+            StockMovement.objects.record_many([
+                StockMovement(
+                    product=product, branch=product.branch, movement_type="OUT", quantity=1,
+                    selling_amount=product.selling_price, payment_method="cash",
+                    created_by=data["managers"][0],
+                )
+                for product in Product.objects.filter(account=data["accounts"][0]).select_related("branch")
+            ])
+
+            people = {"admin": data["admin"], "manager": data["managers"][0], "staff": data["staff"][0]}
+            for role, person in people.items():
+                client = login(role, person)
+                for view, url_name, roles in VIEWS:
+                    if role not in roles:
+                        continue
+                    url = reverse(url_name)
+                    client.get(url)
+
+                    executed = []
+                    with connection.execute_wrapper(self._record(executed)):
+                        response = client.get(url)
+                    self.assertEqual(response.status_code, 200, f"{role} {view}")
+                    queries[(role, view)] = executed
+
+            transaction.set_rollback(True)
+        cache.clear()
+        return queries
+
+    @staticmethod
+    def _record(executed):
+        def wrapper(execute, sql, params, many, context):
+            executed.append(sql)
+            return execute(sql, params, many, context)
+        return wrapper
+
+    def test_views_stay_within_query_budget(self):
+        small, large = (self.measure(size) for size in self.SIZES)
+
+        for role, budgets in self.BUDGETS.items():
+            for view, budget in budgets.items():
+                with self.subTest(role=role, view=view):
+                    executed = large[(role, view)]
+                    sql = "\n".join(f"  {i}. {query}" for i, query in enumerate(executed, 1))
+                    self.assertEqual(
+                        len(small[(role, view)]), len(executed),
+                        f"{role} {view} ran {len(small[(role, view)])} queries on small data "
+                        f"and {len(executed)} on large data:\n{sql}",
+                    )
+                    self.assertLessEqual(
+                        len(executed), budget,
+                        f"{role} {view} ran {len(executed)} queries, budget is {budget}:\n{sql}",
+                    )
@@ -15,6 +15,10 @@ urlpatterns = [
     # --- Stock Movement URLs ---
     path('stock/user/account/movements/', views.stock_movement_view, name='stock_movement_view'),
     path('stock/user/account/movements/all/records/', views.stock_movement_all_records_view, name='stock_movement_all_records_view'),
+    path('stock/user/account/movements/all/records/page/', views.stock_movement_records_page, name='stock_movement_records_page'),
+    path('stock/user/account/movements/checkout/', views.stock_checkout_view, name='stock_checkout_view'),
+    path('stock/user/account/movements/import/', views.stock_movement_import_view, name='stock_movement_import_view'),
+    path('stock/user/account/movements/export/', views.stock_movement_export_view, name='stock_movement_export_view'),
 
     # --- Stock URLs ---
     path('stock/user/account/stocks', views.stock_view, name='stock_view'),
@@ -39,4 +43,7 @@ urlpatterns = [
     path("verify-otp/", views.verify_otp, name="verify-otp"),
     path("resend-otp/", views.resend_otp, name="resend-otp"),
 
+    # --- monitoring URLs ---
+    path("metrics", views.metrics_view, name="metrics"),
+
 ] 
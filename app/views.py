@@ -1,25 +1,21 @@
 # Django shortcuts & utilities
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib import messages
-from django.http import JsonResponse
+from django.core.exceptions import ValidationError
+from django.http import HttpResponse, HttpResponseForbidden, JsonResponse, StreamingHttpResponse
 
 # Django auth & security
 from django.contrib.auth.hashers import make_password, check_password
 
 # Django DB
-from django.db import transaction
-from django.db.models import (
-    Sum, F, Case, When, Value, IntegerField,
-    ExpressionWrapper, DecimalField, Count, Q
-)
+from django.db import router, transaction
+from django.db.models import Sum, F, DecimalField, Q
 
 # Django time & utils
 from django.utils import timezone
-from django.utils.timezone import now
-from datetime import timedelta
+from datetime import datetime, time, timedelta
 
-# Email
-from django.core.mail import send_mail
+# Settings
 from django.conf import settings
 
 # Models
@@ -31,11 +27,23 @@ from .models import (
     Product,
     Stock,
     StockMovement,
+    StockSnapshot,
+    DailySalesRollup,
     PasswordResetOTP,
+    KIGALI_TZ,
 )
+from . import dashboard, jobs, metrics, sharding, sqlite
+from .routers import replica_reads
+from .importers import import_movements, iter_rows
 
 # Python stdlib
+import csv
+import io
+import json
 import re
+from collections import defaultdict
+from decimal import Decimal, InvalidOperation
+from itertools import zip_longest
 
 
 
@@ -43,87 +51,49 @@ def index(request):
     context = {}
 
     # Admin dashboard
-    if request.session.get('admin_id'):
-        admin = AdminInfo.objects.only('id', 'firstname', 'lastname').get(id=request.session['admin_id'])
+    identity = request.identity
+
+    if identity.admin:
+        admin = identity.admin
 
         context.update({
             'role': 'admin',
             'user': admin,  # So template can do {{ user.firstname }} etc.
-
-            'total_accounts': Account.objects.count(),
-            'total_users': UserInfo.objects.count(),
-            'total_branches': Branch.objects.count(),
-            'total_products': Product.objects.count(),
-
-            'total_stock': Stock.objects.aggregate(total=Sum('quantity'))['total'] or 0,
-            'total_profit': StockMovement.objects.aggregate(total=Sum('profit'))['total'] or 0,
+            **dashboard.global_metrics(),
         })
 
         return render(request, 'index.html', context)
 
     # Manager or Staff dashboard
-    if request.session.get('user_id'):
-        user = UserInfo.objects.select_related('account').get(id=request.session['user_id'])
+    if identity.user:
+        user = identity.user
 
         # Manager dashboard
         if user.role == 'manager':
-            branches = Branch.objects.filter(account=user.account)
-
             context.update({
                 'role': 'manager',
                 'user': user,
-
-                'total_branches': branches.count(),
-                'total_staff': UserInfo.objects.filter(account=user.account, role='staff').count(),
-                'total_products': Product.objects.filter(account=user.account).count(),
-
-                'total_stock': Stock.objects.filter(branch__in=branches).aggregate(total=Sum('quantity'))['total'] or 0,
-                'total_profit': StockMovement.objects.filter(branch__in=branches).aggregate(total=Sum('profit'))['total'] or 0,
+                **dashboard.account_metrics(user.account_id),
             })
 
-        # Staff dashboard
+        # Staff dashboard → assigned branch
         else:
-            # Detect staff branch - the first branch for their account with stock
-            staff_branch = Branch.objects.filter(account=user.account).filter(products__stocks__isnull=False).distinct().first()
-
             context.update({
                 'role': 'staff',
                 'user': user,
-
-                'branch_name': staff_branch.branch_name if staff_branch else "N/A",
-                'total_products': Product.objects.filter(branch=staff_branch).count() if staff_branch else 0,
-                'total_stock': Stock.objects.filter(branch=staff_branch).aggregate(total=Sum('quantity'))['total'] or 0 if staff_branch else 0,
-                'total_profit': StockMovement.objects.filter(branch=staff_branch).aggregate(total=Sum('profit'))['total'] or 0 if staff_branch else 0,
+                'branch_name': "N/A",
+                'total_products': 0,
+                'total_stock': 0,
+                'total_profit': 0,
             })
+            if user.branch_id:
+                context.update(dashboard.branch_metrics(user.branch_id))
 
         return render(request, 'index.html', context)
 
     # If no user found, redirect to login
     return redirect('login_view')
 
-class SessionExpiredMiddleware:
-    def __init__(self, get_response):
-        self.get_response = get_response
-
-    def __call__(self, request):
-
-        # If user was logged in but role/session is missing -> session expired
-        if request.session.get("was_logged_in") and not request.session.get("role"):
-
-            # Clear session
-            request.session.flush()
-
-            # Redirect to login with GET param
-            return redirect('/login_view/?session_expired=1')
-
-        response = self.get_response(request)
-
-        # Mark user as logged in if role exists
-        if request.session.get("role"):
-            request.session["was_logged_in"] = True
-
-        return response
-
 # ---------- login section ----------
 def login_view(request):
 
@@ -152,6 +122,7 @@ def login_view(request):
     if user_type == "admin":
         user = _authenticate_admin(email, password)
         if not user:
+            metrics.login_attempts.inc(user_type="admin", result="invalid")
             messages.error(request, "Invalid admin email or password.")
             return render(request, "auth-login.html")
 
@@ -160,6 +131,7 @@ def login_view(request):
         request.session["user_name"] = user.firstname
         request.session.set_expiry(1800)
 
+        metrics.login_attempts.inc(user_type="admin", result="success")
         messages.success(request, "Logged in successfully!")
         return redirect("index")
 
@@ -167,11 +139,13 @@ def login_view(request):
     elif user_type == "user":
         user = _authenticate_user(email, password)
         if not user:
+            metrics.login_attempts.inc(user_type="user", result="invalid")
             messages.error(request, "Invalid user email or password.")
             return render(request, "auth-login.html")
 
         # ---------- BLOCK DISABLED ACCOUNT ----------
         if not user.account or not user.account.is_active:
+            metrics.login_attempts.inc(user_type="user", result="inactive")
             messages.error(
                 request,
                 "Ifata buguzi ryawe ryarangiye. Please contact the administrator." #Your subscription has expired
@@ -180,6 +154,7 @@ def login_view(request):
 
         # ---------- BLOCK DISABLED USER ----------
         if not user.is_active:
+            metrics.login_attempts.inc(user_type="user", result="inactive")
             messages.error(request, "Access denied tolk to you boss")
             return render(request, "auth-login.html")
 
@@ -188,7 +163,8 @@ def login_view(request):
         branch_id = None
 
         if user.role == "manager":
-            branch = Branch.objects.filter(manager=user).first()
+            with sharding.use_shard_of(user):
+                branch = Branch.objects.filter(manager=user).first()
             if branch:
                 branch_name = branch.branch_name
                 branch_id = branch.id
@@ -207,6 +183,7 @@ def login_view(request):
         request.session["branch_id"] = branch_id
         request.session.set_expiry(1800)
 
+        metrics.login_attempts.inc(user_type="user", result="success")
         messages.success(request, "Logged in successfully!")
         return redirect("index")
 
@@ -229,9 +206,8 @@ def _authenticate_admin(email, password):
     return None
 
 def _authenticate_user(email, password):
-    try:
-        user = UserInfo.objects.get(email=email)
-    except UserInfo.DoesNotExist:
+    user = sharding.find_user(email)
+    if user is None:
         return None
 
     if check_password(password, user.password):
@@ -242,12 +218,11 @@ def _authenticate_user(email, password):
 # ---------- user profile section ----------
 def profile_view(request):
 
-    admin_id = request.session.get('admin_id')
-    user_id = request.session.get('user_id')
+    identity = request.identity
 
     # ---------- ADMIN ----------
-    if admin_id:
-        admin = AdminInfo.objects.get(id=admin_id)
+    if identity.admin:
+        admin = identity.admin
 
         if request.method == 'POST':
             admin.firstname = request.POST.get('firstname')
@@ -265,8 +240,8 @@ def profile_view(request):
         })
 
     # ---------- USER ----------
-    elif user_id:
-        user = UserInfo.objects.select_related('account').get(id=user_id)
+    elif identity.user:
+        user = identity.user
 
         if request.method == 'POST':
             user.firstname = request.POST.get('firstname')
@@ -280,7 +255,7 @@ def profile_view(request):
         return render(request, 'profile.html', {
             'person': user,
             'role': user.role.title(),
-            'branch': user.branch.branch_name if hasattr(user, 'branch') and user.branch else None
+            'branch': user.branch.branch_name if user.branch else None
         })
 
     # ---------- NOT LOGGED IN ----------
@@ -361,29 +336,20 @@ def logout_view(request):
     return redirect('login_view')
 
 # ---------- product section ----------
+@sharding.admin_writes((Product, "product_id"), (Branch, "branch"))
 def products_view(request):
     # -------------------- LOGIN CHECK --------------------
-    if not request.session.get('user_id') and not request.session.get('admin_id'):
+    if not request.identity.is_authenticated:
         return redirect('login_view')
 
-    role = request.session.get('role')
+    role = request.identity.role
     user = None
 
     if role != "admin":
-        user = get_object_or_404(UserInfo, id=request.session["user_id"])
+        user = request.identity.user
 
     # -------------------- BASE QUERY --------------------
-    if role == "admin":
-        products = Product.objects.all()
-
-    elif role == "manager":
-        products = Product.objects.filter(account=user.account)
-
-    else:  # staff → ONLY assigned branch
-        if not user.branch:
-            products = Product.objects.none()
-        else:
-            products = Product.objects.filter(branch=user.branch)
+    products = Product.objects.for_scope(request.identity)
 
     # -------------------- HANDLE POST --------------------
     if request.method == "POST":
@@ -412,13 +378,7 @@ def products_view(request):
 
             try:
                 # Branch scope
-                if role == "admin":
-                    branch = Branch.objects.get(id=branch_id)
-                else:
-                    branch = Branch.objects.get(
-                        id=branch_id,
-                        account=user.account
-                    )
+                branch = Branch.objects.for_scope(request.identity).get(id=branch_id)
 
                 # Duplicate check per branch
                 if Product.objects.filter(
@@ -457,20 +417,7 @@ def products_view(request):
                 return redirect("products")
 
             # Product scope
-            if role == "admin":
-                product = get_object_or_404(Product, id=int(product_id))
-            elif role == "manager":
-                product = get_object_or_404(
-                    Product,
-                    id=int(product_id),
-                    account=user.account
-                )
-            else:  # staff
-                product = get_object_or_404(
-                    Product,
-                    id=int(product_id),
-                    branch=user.branch
-                )
+            product = get_object_or_404(products, id=int(product_id))
 
             branch_id = request.POST.get("branch")
 
@@ -483,13 +430,7 @@ def products_view(request):
                 return redirect("products")
 
             try:
-                if role == "admin":
-                    branch = Branch.objects.get(id=branch_id)
-                else:
-                    branch = Branch.objects.get(
-                        id=branch_id,
-                        account=user.account
-                    )
+                branch = Branch.objects.for_scope(request.identity).get(id=branch_id)
 
                 # Duplicate name in target branch
                 if Product.objects.filter(
@@ -526,20 +467,7 @@ def products_view(request):
                 return redirect("products")
 
             # Product scope
-            if role == "admin":
-                product = get_object_or_404(Product, id=int(product_id))
-            elif role == "manager":
-                product = get_object_or_404(
-                    Product,
-                    id=int(product_id),
-                    account=user.account
-                )
-            else:  # staff
-                product = get_object_or_404(
-                    Product,
-                    id=int(product_id),
-                    branch=user.branch
-                )
+            product = get_object_or_404(products, id=int(product_id))
 
             product_name = product.name
             product.delete()
@@ -555,34 +483,29 @@ def products_view(request):
         return redirect("products")
 
     # -------------------- FINAL QUERY --------------------
-    products = products.select_related('branch').order_by("-id")
+    products = sharding.gather(products.listing().order_by("-id"), key=lambda p: p.id, reverse=True)
 
     return render(request, 'product_list.html', {
         'products': products,
+        'branches': Branch.objects.filter(account_id=user.account_id).listing() if user else [],
         'role': role,
         'user': user
     })
 
 
 # --- stock movement view section ---
-try:
-    from zoneinfo import ZoneInfo
-    KIGALI_TZ = ZoneInfo("Africa/Kigali")
-except ImportError:
-    import pytz
-    KIGALI_TZ = pytz.timezone("Africa/Kigali")
-
     # -------------------- stock movement view Section--------------------
+@sharding.admin_writes((StockMovement, "movement_id"), (Branch, "branch"))
 def stock_movement_view(request):
     # -------------------- LOGIN CHECK --------------------
-    if not request.session.get('user_id') and not request.session.get('admin_id'):
+    if not request.identity.is_authenticated:
         return redirect('login_view')
 
-    role = request.session.get('role')
+    role = request.identity.role
     user = None
 
     if role != "admin":
-        user = get_object_or_404(UserInfo, id=request.session["user_id"])
+        user = request.identity.user
 
     # -------------------- HANDLE POST --------------------
     if request.method == "POST":
@@ -620,7 +543,7 @@ def stock_movement_view(request):
 
                 # ---------- ADD ----------
                 if action == "add":
-                    StockMovement.objects.create(
+                    sqlite.record([StockMovement(
                         product=product,
                         branch=branch,
                         movement_type=movement_type,
@@ -629,7 +552,7 @@ def stock_movement_view(request):
                         notes=notes,
                         payment_method=payment_method,
                         created_by=user
-                    )
+                    )])
                     messages.success(request, "Stock movement recorded successfully.")
 
                 # ---------- UPDATE ----------
@@ -677,39 +600,17 @@ def stock_movement_view(request):
     now_kigali = timezone.now().astimezone(KIGALI_TZ)
     last_24_hours = now_kigali - timedelta(hours=24)
 
-    if role == "admin":
-        movements = StockMovement.objects.filter(
-            created_at__gte=last_24_hours
-        )
-
-    elif role == "manager":
-        movements = StockMovement.objects.filter(
-            branch__account=user.account,
-            created_at__gte=last_24_hours
-        )
-
-    else:  # staff → VIEW ALL activity in their branch
-        movements = StockMovement.objects.filter(
-            branch=user.branch,
-            created_at__gte=last_24_hours
-        )
-
-    movements = movements.select_related(
-        "product", "branch", "created_by"
-    ).order_by("-id")
+    movements = sharding.gather(
+        StockMovement.objects.for_scope(request.identity)
+        .filter(created_at__gte=last_24_hours)
+        .listing()
+        .order_by("-created_at", "-id"),
+        key=lambda m: (m.created_at, m.id), reverse=True,
+    )
 
     # -------------------- DROPDOWNS --------------------
-    if role == "admin":
-        branches = Branch.objects.all()
-        products = Product.objects.all()
-
-    elif role == "manager":
-        branches = Branch.objects.filter(account=user.account)
-        products = Product.objects.filter(account=user.account)
-
-    else:  # staff
-        branches = Branch.objects.filter(id=user.branch.id)
-        products = Product.objects.filter(branch=user.branch)
+    branches = sharding.gather(Branch.objects.for_scope(request.identity).listing())
+    products = sharding.gather(Product.objects.for_scope(request.identity))
 
     # -------------------- RENDER --------------------
     return render(request, "stock_movement_list.html", {
@@ -720,57 +621,319 @@ def stock_movement_view(request):
         "user": user,
     })
 
+# ---------- basket checkout section ----------
+def _checkout_lines(request):
+    """
+    Read basket lines from a JSON body or from repeated form fields
+    (product, quantity, selling_amount).
+    """
+    if request.content_type == "application/json":
+        data = json.loads(request.body or "{}")
+        if not isinstance(data, dict):
+            raise ValueError("Expected an object with branch, payment_method and lines.")
+        return data, data.get("lines") or []
+
+    data = request.POST
+    lines = [
+        {"product": product, "quantity": quantity, "selling_amount": amount or None}
+        for product, quantity, amount in zip_longest(
+            data.getlist("product"), data.getlist("quantity"), data.getlist("selling_amount")
+        )
+    ]
+    return data, lines
+
+
+def _parse_amount(value):
+    """
+    A line's selling amount as a Decimal, None when left blank, or False
+    when it is not a number of zero or more.
+    """
+    if value in (None, ""):
+        return None
+    try:
+        amount = Decimal(str(value))
+    except InvalidOperation:
+        return False
+    return amount if amount.is_finite() and amount >= 0 else False
+
+
+def stock_checkout_view(request):
+    """
+    Sell a whole basket in one request: one stock check/update and bulk
+    inserts in a single transaction, answered with one JSON receipt.
+    """
+    if not request.identity.is_authenticated:
+        return JsonResponse({"error": "Session expired"}, status=401)
+
+    if request.method != "POST":
+        return JsonResponse({"error": "POST required"}, status=405)
+
+    role = request.identity.role
+    user = None
+
+    if role != "admin":
+        user = request.identity.user
+
+    try:
+        data, lines = _checkout_lines(request)
+    except ValueError as e:
+        return JsonResponse({"error": f"Invalid JSON body. {e}"}, status=400)
+
+    branch_id = str(data.get("branch") or "")
+    payment_method = data.get("payment_method")
+    notes = data.get("notes") or ""
+
+    if not lines or not branch_id.isdigit():
+        return JsonResponse({"error": "A branch and at least one line are required."}, status=400)
+
+    if payment_method not in dict(StockMovement.PAYMENT_CHOICES):
+        return JsonResponse({"error": "Payment method is required."}, status=400)
+
+    # ---------- BRANCH SCOPE ----------
+    if role == "staff" and not user.branch_id:
+        return JsonResponse({"error": "You are not assigned to any branch."}, status=403)
+    branches = Branch.objects.for_scope(request.identity)
+
+    branch = branches.filter(id=int(branch_id)).first()
+    if not branch:
+        return JsonResponse({"error": "You can only act on your assigned branch."}, status=403)
+
+    # ---------- LINES ----------
+    try:
+        product_ids = {int(line["product"]) for line in lines}
+        quantities = [int(line["quantity"]) for line in lines]
+    except (KeyError, TypeError, ValueError):
+        return JsonResponse({"error": "Every line needs a product and a quantity."}, status=400)
+
+    if min(quantities) <= 0:
+        return JsonResponse({"error": "Quantities must be positive."}, status=400)
+
+    selling_amounts, bad_lines = [], []
+    for number, line in enumerate(lines, 1):
+        amount = _parse_amount(line.get("selling_amount"))
+        if amount is False:
+            bad_lines.append(number)
+        selling_amounts.append(amount)
+    if bad_lines:
+        return JsonResponse(
+            {"error": "Selling amounts must be numbers of zero or more.", "lines": bad_lines}, status=400
+        )
+
+    products = Product.objects.filter(id__in=product_ids, account_id=branch.account_id).in_bulk()
+    if len(products) != len(product_ids):
+        return JsonResponse({"error": "Unknown product in basket."}, status=400)
+
+    movements = []
+    for line, quantity, selling_amount in zip(lines, quantities, selling_amounts):
+        product = products[int(line["product"])]
+        movements.append(StockMovement(
+            product=product,
+            branch=branch,
+            movement_type="OUT",
+            quantity=quantity,
+            selling_amount=selling_amount if selling_amount is not None else product.selling_price * quantity,
+            payment_method=payment_method,
+            notes=notes,
+            created_by=user,
+        ))
+
+    try:
+        sqlite.record(movements)
+    except ValidationError as e:
+        return JsonResponse({"error": " ".join(e.messages)}, status=400)
+
+    return JsonResponse({
+        "receipt": {
+            "branch": branch.branch_name,
+            "payment_method": payment_method,
+            "created_at": timezone.now().astimezone(KIGALI_TZ).isoformat(),
+            "lines": [
+                {
+                    "movement_id": m.id,
+                    "product": m.product.name,
+                    "quantity": m.quantity,
+                    "selling_amount": str(m.selling_amount),
+                    "profit": str(m.profit),
+                }
+                for m in movements
+            ],
+            "total_quantity": sum(m.quantity for m in movements),
+            "total_amount": str(sum(Decimal(str(m.selling_amount)) for m in movements)),
+            "total_profit": str(sum(Decimal(str(m.profit)) for m in movements)),
+        }
+    })
+
+
+# ---------- bulk import section ----------
+IMPORT_REPORTED_ERRORS = 100
+
+
+def stock_movement_import_view(request):
+    """
+    Upload a CSV/JSON goods receipt. Answers JSON for ?format=json,
+    otherwise a message and a redirect back to the movements page.
+    """
+    if not request.identity.is_authenticated:
+        return redirect('login_view')
+
+    role = request.identity.role
+    if role not in ("admin", "manager"):
+        messages.error(request, "Access denied.")
+        return redirect("stock_movement_view")
+
+    if request.method != "POST" or not request.FILES.get("file"):
+        messages.error(request, "Please choose a file to import.")
+        return redirect("stock_movement_view")
+
+    user = request.identity.user
+    branches = list(Branch.objects.for_scope(request.identity))
+    products = Product.objects.for_scope(request.identity).only("id", "name", "branch_id", "account_id", "cost_price")
+
+    branch_id = request.POST.get("branch")
+    default_branch = next((b for b in branches if str(b.id) == branch_id), None)
+
+    upload = request.FILES["file"]
+    stream = io.TextIOWrapper(upload.file, encoding="utf-8-sig", newline="")
+
+    imported, errors = import_movements(
+        iter_rows(stream, upload.name), products, branches,
+        default_branch=default_branch, created_by=user,
+    )
+
+    if request.GET.get("format") == "json":
+        return JsonResponse({
+            "imported": imported,
+            "rejected": len(errors),
+            "errors": [
+                {"line": line, "error": message}
+                for line, message in errors[:IMPORT_REPORTED_ERRORS]
+            ],
+        })
+
+    if imported:
+        messages.success(request, f"Imported {imported} stock movements.")
+    if errors:
+        line, message = errors[0]
+        messages.error(request, f"{len(errors)} rows rejected. First: line {line}: {message}")
+
+    return redirect("stock_movement_view")
+
+
 # ---------- stock movement all records view section ----------
+RECORDS_PAGE_SIZE = 50
+RECORDS_MAX_PAGE_SIZE = 200
+
+
+def _movement_records_scope(identity):
+    """
+    Return the movements, products and branches visible to the current role.
+    """
+    return (
+        StockMovement.objects.for_scope(identity),
+        Product.objects.for_scope(identity),
+        Branch.objects.for_scope(identity),
+    )
+
+
+def _parse_date(value):
+    try:
+        return datetime.strptime(value, "%Y-%m-%d").date() if value else None
+    except ValueError:
+        return None
+
+
+def _filter_movement_records(movements, params):
+    """
+    Apply the all-records filters (product, branch, type, payment, date range, text).
+    Dates are Kigali calendar days turned into created_at bounds so the
+    created_at index can be used.
+    """
+    product_id = params.get("product")
+    branch_id = params.get("branch")
+    movement_type = params.get("movement_type")
+    payment_method = params.get("payment_method")
+    date_from = _parse_date(params.get("date_from"))
+    date_to = _parse_date(params.get("date_to"))
+    search = (params.get("q") or "").strip()
+
+    if product_id and product_id.isdigit():
+        movements = movements.filter(product_id=int(product_id))
+    if branch_id and branch_id.isdigit():
+        movements = movements.filter(branch_id=int(branch_id))
+    if movement_type in dict(StockMovement.MOVEMENT_CHOICES):
+        movements = movements.filter(movement_type=movement_type)
+    if payment_method in dict(StockMovement.PAYMENT_CHOICES):
+        movements = movements.filter(payment_method=payment_method)
+    if date_from:
+        movements = movements.filter(
+            created_at__gte=datetime.combine(date_from, time.min, tzinfo=KIGALI_TZ)
+        )
+    if date_to:
+        movements = movements.filter(
+            created_at__lt=datetime.combine(date_to + timedelta(days=1), time.min, tzinfo=KIGALI_TZ)
+        )
+    if search:
+        movements = movements.filter(
+            Q(product__name__icontains=search)
+            | Q(branch__branch_name__icontains=search)
+            | Q(notes__icontains=search)
+            | Q(created_by__firstname__icontains=search)
+        )
+
+    return movements
+
+
+def _movement_records_page(movements, params):
+    """
+    Keyset pagination on -id: return one page of rows and the cursor for the next.
+    """
+    cursor = params.get("cursor")
+    page_size = params.get("page_size")
+    page_size = int(page_size) if page_size and page_size.isdigit() else RECORDS_PAGE_SIZE
+    page_size = max(1, min(page_size, RECORDS_MAX_PAGE_SIZE))
+
+    if cursor and cursor.isdigit():
+        movements = movements.filter(id__lt=int(cursor))
+
+    rows = sharding.gather(
+        movements.listing().order_by("-id"), key=lambda m: m.id, reverse=True, limit=page_size + 1
+    )
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
+    next_cursor = rows[-1].id if has_more else None
+
+    return rows, next_cursor
+
+
+@replica_reads
 def stock_movement_all_records_view(request):
     # -------------------- LOGIN CHECK --------------------
-    if not request.session.get('user_id') and not request.session.get('admin_id'):
+    if not request.identity.is_authenticated:
         return redirect('login_view')
 
-    role = request.session.get('role')
+    role = request.identity.role
     user = None
 
     if role != "admin":
-        user = get_object_or_404(UserInfo, id=request.session["user_id"])
+        user = request.identity.user
 
-    # -------------------- GET : VIEW ALL RECORDS --------------------
-    if role == "admin":
-        movements = StockMovement.objects.select_related(
-            "product", "branch", "created_by"
-        ).order_by("-id")
+    # -------------------- GET : FIRST PAGE OF RECORDS --------------------
+    movements, products, branches = _movement_records_scope(request.identity)
+    movements = _filter_movement_records(movements, request.GET)
+    rows, next_cursor = _movement_records_page(movements, request.GET)
+    products, branches = sharding.gather(products), sharding.gather(branches)
 
-    elif role == "manager":
-        movements = StockMovement.objects.filter(
-            branch__account=user.account
-        ).select_related(
-            "product", "branch", "created_by"
-        ).order_by("-id")
-
-    else:  # staff → ALL activity in assigned branch
-        if not user.branch:
-            movements = StockMovement.objects.none()
-        else:
-            movements = StockMovement.objects.filter(
-                branch=user.branch
-            ).select_related(
-                "product", "branch", "created_by"
-            ).order_by("-id")
-
-    # -------------------- DROPDOWNS --------------------
-    if role == "admin":
-        products = Product.objects.all()
-        branches = Branch.objects.all()
-
-    elif role == "manager":
-        products = Product.objects.filter(account=user.account)
-        branches = Branch.objects.filter(account=user.account)
-
-    else:  # staff
-        products = Product.objects.filter(branch=user.branch)
-        branches = Branch.objects.filter(id=user.branch.id)
+    filters = request.GET.copy()
+    filters.pop("cursor", None)
 
     # -------------------- RENDER --------------------
     return render(request, "stock_movement_list_all_records.html", {
-        "movements": movements,
+        "movements": rows,
+        "next_cursor": next_cursor,
+        "filters": request.GET,
+        "filter_query": filters.urlencode(),
+        "movement_choices": StockMovement.MOVEMENT_CHOICES,
+        "payment_choices": StockMovement.PAYMENT_CHOICES,
         "products": products,
         "branches": branches,
         "role": role,
@@ -778,56 +941,195 @@ def stock_movement_all_records_view(request):
     })
 
 
+@replica_reads
+def stock_movement_records_page(request):
+    """
+    One page of the all-records list as an HTML fragment (default) or JSON (?format=json).
+    """
+    if not request.identity.is_authenticated:
+        return redirect('login_view')
+
+    role = request.identity.role
+    user = None
+
+    if role != "admin":
+        user = request.identity.user
+
+    movements, _, _ = _movement_records_scope(request.identity)
+    movements = _filter_movement_records(movements, request.GET)
+    rows, next_cursor = _movement_records_page(movements, request.GET)
+
+    if request.GET.get("format") == "json":
+        return JsonResponse({
+            "results": [
+                {
+                    "id": m.id,
+                    "product": m.product.name,
+                    "branch": m.branch.branch_name,
+                    "movement_type": m.movement_type,
+                    "quantity": m.quantity,
+                    "selling_amount": str(m.selling_amount) if m.selling_amount is not None else None,
+                    "profit": str(m.profit),
+                    "payment_method": m.payment_method,
+                    "notes": m.notes,
+                    "created_by": m.created_by.firstname if m.created_by else None,
+                    "created_at": m.created_at.isoformat(),
+                }
+                for m in rows
+            ],
+            "next_cursor": next_cursor,
+        })
+
+    response = render(request, "stock_movement_records_rows.html", {"movements": rows})
+    response["X-Next-Cursor"] = next_cursor or ""
+    return response
+
+
+# ---------- movement export section ----------
+EXPORT_CHUNK_SIZE = 2000
+EXPORT_COLUMNS = (
+    ("id", "ID"),
+    ("created_at", "Date"),
+    ("product__name", "Product"),
+    ("branch__branch_name", "Branch"),
+    ("movement_type", "Type"),
+    ("quantity", "Quantity"),
+    ("selling_amount", "Amount"),
+    ("profit", "Profit"),
+    ("payment_method", "Payment"),
+    ("notes", "Notes"),
+    ("created_by__firstname", "By"),
+)
+
+
+class _Echo:
+    """
+    File-like object whose write() hands the line back to csv.writer's caller.
+    """
+    def write(self, value):
+        return value
+
+
+def _export_rows(parts):
+    writer = csv.writer(_Echo())
+    # BOM so Excel opens the file as UTF-8.
+    yield "\ufeff" + writer.writerow([label for _, label in EXPORT_COLUMNS])
+
+    fields = [field for field, _ in EXPORT_COLUMNS]
+    for part in parts:
+        for row in part.values_list(*fields).iterator(chunk_size=EXPORT_CHUNK_SIZE):
+            row = list(row)
+            row[1] = row[1].astimezone(KIGALI_TZ).strftime("%Y-%m-%d %H:%M")
+            yield writer.writerow(row)
+
+
+def stock_movement_export_view(request):
+    """
+    Stream the movement history as CSV, scoped like the all-records page
+    and filtered by date range and branch (plus the other list filters).
+    """
+    if not request.identity.is_authenticated:
+        return redirect('login_view')
+
+    movements, _, _ = _movement_records_scope(request.identity)
+    # The rows are read while streaming, after the view returns, so pick the
+    # database now rather than through @replica_reads.
+    movements = _filter_movement_records(movements, request.GET).from_replica()
+
+    filename = "stock-movements-{}.csv".format(timezone.now().astimezone(KIGALI_TZ).strftime("%Y%m%d-%H%M"))
+    parts = sharding.per_shard(movements.order_by("id"))
+    response = StreamingHttpResponse(_export_rows(parts), content_type="text/csv; charset=utf-8")
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
+
+
 # --- list current stocks ---
+def _stock_summary_as_of(branch_ids, as_of):
+    """
+    Stock at the end of the Kigali day ``as_of``, from the latest snapshots plus
+    the movements since. Values use today's cost prices.
+    """
+    moment = datetime.combine(as_of + timedelta(days=1), time.min, tzinfo=KIGALI_TZ)
+    quantities = StockSnapshot.objects.quantities_as_of(branch_ids, moment)
+
+    products = Product.objects.only("name", "cost_price").in_bulk({p for p, _ in quantities})
+    summary = {}
+    for (product_id, _), quantity in quantities.items():
+        product = products[product_id]
+        item = summary.setdefault((product.name, product.cost_price), {
+            'product__name': product.name,
+            'product__cost_price': product.cost_price,
+            'stock': 0,
+            'total_cost': 0,
+        })
+        item['stock'] += quantity
+        item['total_cost'] += quantity * product.cost_price
+
+    return sorted(summary.values(), key=lambda item: item['product__name'])
+
+
+def _merge_stock_summaries(parts):
+    """
+    One stock summary from several (one per shard), rows added up by
+    product name and cost price.
+    """
+    summary = {}
+    for part in parts:
+        for row in part:
+            item = summary.setdefault((row['product__name'], row['product__cost_price']), {
+                'product__name': row['product__name'],
+                'product__cost_price': row['product__cost_price'],
+                'stock': 0,
+                'total_cost': 0,
+            })
+            item['stock'] += row['stock'] or 0
+            item['total_cost'] += row['total_cost'] or 0
+
+    return sorted(summary.values(), key=lambda item: item['product__name'])
+
+
+@replica_reads
 def stock_view(request):
-    if not request.session.get('user_id') and not request.session.get('admin_id'):
+    if not request.identity.is_authenticated:
         return redirect('login_view')
 
-    if request.session.get("role") == "staff":
+    role = request.identity.role
+    if role == "staff":
         messages.error(request, "Access denied.")
         return redirect("index")
 
-    role = request.session.get('role')
-    user = None
-    branch = None
-
-    if role != "admin":
-        user = UserInfo.objects.get(id=request.session["user_id"])
-        branch = (
-            Branch.objects.filter(manager=user).first()
-            if role == "manager"
-            else user.branch
-        )
+    branch = request.identity.branch
 
-    movements = (
-        StockMovement.objects.all()
-        if role == "admin"
-        else StockMovement.objects.filter(branch=branch)
-    )
+    as_of = _parse_date(request.GET.get("as_of"))
 
-    stock_summary = (
-        movements
-        .annotate(
-            adjusted_quantity=Case(
-                When(movement_type='IN', then=F('quantity')),
-                When(movement_type='OUT', then=-F('quantity')),
-                default=Value(0),
-                output_field=IntegerField()
+    def summarise():
+        if as_of:
+            branch_ids = (
+                list(Branch.objects.for_scope(request.identity).values_list("id", flat=True))
+                if role == "admin"
+                else [branch.id] if branch else []
             )
-        )
-        .values(
-            'product__name',
-            'product__cost_price'
-        )
-        .annotate(
-            stock=Sum('adjusted_quantity'),
-            total_cost=ExpressionWrapper(
-                Sum('adjusted_quantity') * F('product__cost_price'),
-                output_field=DecimalField(max_digits=14, decimal_places=2)
+            return _stock_summary_as_of(branch_ids, as_of)
+
+        stocks = Stock.objects.all() if role == "admin" else Stock.objects.filter(branch=branch)
+        return list(
+            stocks
+            .values('product__name', 'product__cost_price')
+            .annotate(
+                stock=Sum('quantity'),
+                total_cost=Sum(
+                    F('quantity') * F('product__cost_price'),
+                    output_field=DecimalField(max_digits=14, decimal_places=2)
+                )
             )
+            .order_by('product__name')
         )
-        .order_by('product__name')
-    )
+
+    # Admins see every shard's stock.
+    if role == "admin":
+        stock_summary = _merge_stock_summaries(summary for _, summary in sharding.fan_out(summarise))
+    else:
+        stock_summary = summarise()
 
     total_inventory_value = sum(
         item['total_cost'] or 0 for item in stock_summary
@@ -836,74 +1138,98 @@ def stock_view(request):
     return render(request, 'stock_list.html', {
         'stock_summary': stock_summary,
         'total_inventory_value': total_inventory_value,
+        'as_of': as_of,
         'branch': branch,
         'role': role,
     })
 
 # --- Report view ---
+@replica_reads
 def report_view(request):
     # ---------- LOGIN CHECK ----------
-    if not request.session.get('user_id') and not request.session.get('admin_id'):
+    if not request.identity.is_authenticated:
         return redirect('login_view')
 
-    role = request.session.get('role')
+    role = request.identity.role
     user = None
 
     if role != "admin":
-        user = get_object_or_404(UserInfo, id=request.session["user_id"])
-
-    # ---------- DATE ----------
-    selected_date = request.GET.get('date')
-    report_date = selected_date if selected_date else timezone.now().date()
+        user = request.identity.user
 
-    # ---------- BRANCH FILTERING ----------
-    if role == "admin":
-        branches = Branch.objects.select_related('manager', 'account')
-
-    elif role == "manager":
-        branches = Branch.objects.filter(
-            account=user.account
-        ).select_related('manager')
-
-    else:  # staff → ONLY assigned branch
-        if not user.branch:
-            branches = Branch.objects.none()
-        else:
-            branches = Branch.objects.filter(
-                id=user.branch.id
-            ).select_related('manager')
+    # ---------- DATE RANGE ----------
+    today = timezone.now().astimezone(KIGALI_TZ).date()
+    single_date = _parse_date(request.GET.get('date'))
+    date_from = _parse_date(request.GET.get('date_from')) or single_date or today
+    date_to = _parse_date(request.GET.get('date_to')) or single_date or date_from
+    if date_to < date_from:
+        date_from, date_to = date_to, date_from
 
     # ---------- BUILD REPORT ----------
-    branch_reports = []
-
-    for branch in branches:
-        movements = StockMovement.objects.filter(
-            branch=branch,
-            created_at__date=report_date
-        )
+    def build():
+        branches = Branch.objects.for_scope(request.identity).listing()
+        return _build_branch_reports(list(branches), date_from, date_to)
 
-        sales = movements.filter(movement_type='OUT')
-
-        summary = sales.aggregate(
-            total_sales=Sum('selling_amount'),
-            total_profit=Sum('profit'),
-            total_qty=Sum('quantity')
-        )
-
-        branch_reports.append({
-            'branch': branch,
-            'sales': sales,
-            'summary': summary
-        })
+    # Admins see the branches of every shard.
+    if role == "admin":
+        branch_reports = [report for _, reports in sharding.fan_out(build) for report in reports]
+    else:
+        branch_reports = build()
 
     return render(request, 'report.html', {
-        'report_date': report_date,
+        'report_date': date_from,
+        'date_from': date_from,
+        'date_to': date_to,
         'branch_reports': branch_reports,
         'role': role,
         'user': user,
     })
 
 
+def _build_branch_reports(branches, date_from, date_to):
+    """
+    Sales summary and sale lines per branch for Kigali days date_from..date_to.
+    Two queries whatever the number of branches: one GROUP BY branch over
+    the daily rollups and one fetch of the sale lines, bucketed in Python.
+    """
+    branch_ids = [branch.id for branch in branches]
+
+    summaries = {
+        row.pop('branch_id'): row
+        for row in DailySalesRollup.objects.filter(
+            branch_id__in=branch_ids,
+            day__gte=date_from,
+            day__lte=date_to,
+        ).values('branch_id').annotate(
+            total_sales=Sum('sales_amount'),
+            total_profit=Sum('profit'),
+            total_qty=Sum('quantity')
+        ).order_by()
+    }
+
+    sales = StockMovement.objects.filter(
+        branch_id__in=branch_ids,
+        movement_type='OUT',
+        created_at__gte=datetime.combine(date_from, time.min, tzinfo=KIGALI_TZ),
+        created_at__lt=datetime.combine(date_to + timedelta(days=1), time.min, tzinfo=KIGALI_TZ),
+    )
+
+    lines = defaultdict(list)
+    for sale in sales.select_related('product').only(
+        'branch_id', 'quantity', 'selling_amount', 'profit', 'payment_method', 'created_at', 'product__name'
+    ).order_by('-created_at'):
+        lines[sale.branch_id].append(sale)
+
+    empty = {'total_sales': None, 'total_profit': None, 'total_qty': None}
+    return [
+        {
+            'branch': branch,
+            'sales': lines.get(branch.id, []),
+            'summary': summaries.get(branch.id, empty),
+        }
+        for branch in branches
+    ]
+
+
 # -------------------------
 # CREATE ACCOUNT
 # -------------------------
@@ -918,17 +1244,17 @@ def create_user_account(request):
         email = request.POST.get("email")
 
         # Check if account already exists
-        if Account.objects.filter(name=account_name).exists():
+        if any(exists for _, exists in sharding.fan_out(Account.objects.filter(name=account_name).exists)):
             messages.error(request, "Account already exists.")
             return redirect("create_user_account")
 
         # Check if manager already exists
-        if UserInfo.objects.filter(email=email).exists():
+        if sharding.find_user(email):
             messages.error(request, "User with this email already exists.")
             return redirect("create_user_account")
 
         try:
-            with transaction.atomic():
+            with transaction.atomic(using=router.db_for_write(Account)):
                 account = Account.objects.create(
                     name=account_name,
                     phone=request.POST.get("account_phone"),
@@ -989,12 +1315,12 @@ def create_branch_with_manager(request):
             return redirect("create_branch_with_manager")
 
         # Check if manager already exists
-        if UserInfo.objects.filter(email=email).exists():
+        if sharding.find_user(email):
             messages.error(request, "Manager with this email already exists.")
             return redirect("create_branch_with_manager")
 
         try:
-            with transaction.atomic():
+            with transaction.atomic(using=router.db_for_write(UserInfo)):
 
                 manager = UserInfo.objects.create(
                     account=account,
@@ -1028,17 +1354,17 @@ def create_branch_with_manager(request):
 def create_staff_with_manager(request):
 
     # ===== AUTH CHECK =====
-    if not request.session.get("user_id"):
+    if not request.identity.user:
         return redirect("login_view")
 
-    if request.session.get("role") != "manager":
+    if request.identity.role != "manager":
         messages.error(request, "Access denied.")
         return redirect("index")
 
-    manager = UserInfo.objects.get(id=request.session["user_id"])
+    manager = request.identity.user
 
     # Manager's branch
-    branch = Branch.objects.filter(manager=manager).first()
+    branch = request.identity.branch
     if not branch:
         messages.error(request, "No branch assigned to you.")
         return redirect("index")
@@ -1077,12 +1403,12 @@ def create_staff_with_manager(request):
                 messages.error(request, "Password is required.")
                 return redirect("create_staff_with_manager")
 
-            if UserInfo.objects.filter(email=email).exists():
+            if sharding.find_user(email):
                 messages.error(request, "Email already exists.")
                 return redirect("create_staff_with_manager")
 
             try:
-                with transaction.atomic():
+                with transaction.atomic(using=router.db_for_write(UserInfo)):
                     UserInfo.objects.create(
                         account=manager.account,
                         branch=branch,
@@ -1109,20 +1435,13 @@ def create_staff_with_manager(request):
     })
 
 
-from django.shortcuts import render, redirect, get_object_or_404
-from django.contrib import messages
-from django.db.models import Count, Sum, F, Q, DecimalField, ExpressionWrapper, Value
-from django.db.models.functions import Coalesce
-from django.utils.timezone import now
-
-from .models import Account, Branch, UserInfo, Stock
-
+@replica_reads
 def settings_view(request):
     # ---------- AUTH ----------
-    if not request.session.get("user_id") and not request.session.get("admin_id"):
+    if not request.identity.is_authenticated:
         return redirect("login_view")
 
-    role = request.session.get("role")
+    role = request.identity.role
     if role == "staff":
         messages.error(request, "Access denied.")
         return redirect("index")
@@ -1135,18 +1454,20 @@ def settings_view(request):
 
         # ===== ADMIN =====
         if action == "update_account" and role == "admin":
-            account = get_object_or_404(Account, id=request.POST.get("account_id"))
-            account.name = request.POST.get("name")
-            account.phone = request.POST.get("phone")
-            account.address = request.POST.get("address")
-            account.save()
+            with sharding.use_account_shard(request.POST.get("account_id")):
+                account = get_object_or_404(Account, id=request.POST.get("account_id"))
+                account.name = request.POST.get("name")
+                account.phone = request.POST.get("phone")
+                account.address = request.POST.get("address")
+                account.save()
             messages.success(request, "Account updated successfully.")
             return redirect("settings_view")
 
         if action == "toggle_account" and role == "admin":
-            account = get_object_or_404(Account, id=request.POST.get("account_id"))
-            account.is_active = not account.is_active
-            account.save()
+            with sharding.use_account_shard(request.POST.get("account_id")):
+                account = get_object_or_404(Account, id=request.POST.get("account_id"))
+                account.is_active = not account.is_active
+                account.save()
             messages.success(request, f"Account {'enabled' if account.is_active else 'disabled'} successfully.")
             return redirect("settings_view")
 
@@ -1165,75 +1486,36 @@ def settings_view(request):
     context = {}
 
     if role == "admin":
-        current_month = now().month
-        current_year = now().year
-
-        accounts = (
-            Account.objects
-            .annotate(
-                total_users=Count("users"),
-                managers_count=Count("users", filter=Q(users__role="manager")),
-                staff_count=Count("users", filter=Q(users__role="staff")),
-                branches_count=Count("branches"),
-                products_count=Count("products"),
-                stock_value=Coalesce(
-                    Sum(
-                        ExpressionWrapper(
-                            F("products__stocks__quantity") * F("products__cost_price"),
-                            output_field=DecimalField(max_digits=14, decimal_places=2),
-                        )
-                    ),
-                    Value(0, output_field=DecimalField(max_digits=14, decimal_places=2)),
-                ),
-                monthly_sales=Coalesce(
-                    Sum(
-                        "products__movements__selling_amount",
-                        filter=Q(
-                            products__movements__movement_type="OUT",
-                            products__movements__created_at__month=current_month,
-                            products__movements__created_at__year=current_year,
-                        ),
-                    ),
-                    Value(0, output_field=DecimalField(max_digits=14, decimal_places=2)),
-                ),
-            )
-            .order_by("-id")
+        accounts = dashboard.account_stats(
+            sharding.gather(Account.objects.order_by("-id"), key=lambda a: a.id, reverse=True)
         )
 
-        selected_account = accounts.first()
+        selected_account = accounts[0] if accounts else None
+        branches, staff = [], []
+        if selected_account:
+            with sharding.use_shard_of(selected_account):
+                branches = list(Branch.objects.filter(account=selected_account).select_related("manager").with_totals())
+                staff = list(UserInfo.objects.filter(account=selected_account, role="staff"))
 
         context.update({
             "accounts": accounts,
             "account": selected_account,
-            "branches": Branch.objects.filter(account=selected_account) if selected_account else [],
-            "staff": UserInfo.objects.filter(account=selected_account, role="staff") if selected_account else [],
+            "branches": branches,
+            "staff": staff,
         })
 
     elif role == "manager":
         account = get_object_or_404(Account, id=account_id)
 
-        branches = (
+        branches = list(
             Branch.objects.filter(account=account)
             .select_related("manager")
-            .prefetch_related("products__stocks")
+            .with_totals()
         )
 
         staff = UserInfo.objects.filter(account=account, role="staff")
 
-        branch_stock = {}
-        for branch in branches:
-            total = Stock.objects.filter(branch=branch).aggregate(
-                total=Coalesce(
-                    Sum(
-                        ExpressionWrapper(
-                            F("quantity") * F("product__cost_price"),
-                            output_field=DecimalField(max_digits=14, decimal_places=2),
-                        )
-                    ),
-                    Value(0, output_field=DecimalField(max_digits=14, decimal_places=2)),
-                )
-            )["total"]
-            branch_stock[branch.id] = total
+        branch_stock = {branch.id: branch.stock_value for branch in branches}
 
         context.update({
             "account": account,
@@ -1250,10 +1532,11 @@ def forgot_password_otp(request):
     if request.method == "POST":
         email = request.POST.get("email")
 
-        user = UserInfo.objects.filter(email=email).first()
+        user = sharding.find_user(email)
         admin = AdminInfo.objects.filter(email=email).first()
 
         if not user and not admin:
+            metrics.otp_attempts.inc(action="send", result="unknown_email")
             messages.error(request, "Email not found")
             return redirect("forgot-password-otp")
 
@@ -1262,14 +1545,17 @@ def forgot_password_otp(request):
         otp = PasswordResetOTP.generate_otp()
         PasswordResetOTP.objects.create(email=email, otp=otp)
 
-        send_mail(
-            "Your Password Reset OTP",
-            f"Your OTP is {otp}. It expires in 10 minutes.",
-            settings.DEFAULT_FROM_EMAIL,
-            [email],
+        jobs.enqueue(
+            "send_email",
+            subject="Your Password Reset OTP",
+            message=f"Your OTP is {otp}. It expires in 10 minutes.",
+            recipients=[email],
         )
+        # Clear it out once it has expired, whether or not it was used.
+        jobs.enqueue("purge_otps", delay=10 * 60)
 
         request.session["reset_email"] = email
+        metrics.otp_attempts.inc(action="send", result="sent")
         messages.success(request, "OTP sent to your email")
         return redirect("verify-otp")
 
@@ -1300,10 +1586,12 @@ def verify_otp(request):
         ).first()
 
         if not record:
+            metrics.otp_attempts.inc(action="verify", result="invalid")
             messages.error(request, "Invalid OTP")
             return redirect("verify-otp")
 
         if record.is_expired():
+            metrics.otp_attempts.inc(action="verify", result="expired")
             record.delete()
             messages.error(request, "OTP expired")
             return redirect("forgot-password-otp")
@@ -1319,18 +1607,21 @@ def verify_otp(request):
             )
             return redirect("verify-otp")
 
-        user = UserInfo.objects.filter(email=email).first()
+        user = sharding.find_user(email)
         admin = AdminInfo.objects.filter(email=email).first()
 
         if user:
-            user.set_password(password)
-            user.save()
+            # No account in the session yet: save on the user's shard.
+            with sharding.use_shard_of(user):
+                user.set_password(password)
+                user.save()
         elif admin:
             admin.set_password(password)
             admin.save()
 
         record.delete()
         del request.session["reset_email"]
+        metrics.otp_attempts.inc(action="verify", result="success")
 
         messages.success(request, "Password reset successfully")
         return redirect("login_view")
@@ -1348,11 +1639,22 @@ def resend_otp(request):
     otp = PasswordResetOTP.generate_otp()
     PasswordResetOTP.objects.create(email=email, otp=otp)
 
-    send_mail(
-        "Your Password Reset OTP",
-        f"Your OTP is {otp}. It expires in 10 minutes.",
-        settings.DEFAULT_FROM_EMAIL,
-        [email],
+    jobs.enqueue(
+        "send_email",
+        subject="Your Password Reset OTP",
+        message=f"Your OTP is {otp}. It expires in 10 minutes.",
+        recipients=[email],
     )
+    jobs.enqueue("purge_otps", delay=10 * 60)
+
+    metrics.otp_attempts.inc(action="resend", result="sent")
+    return JsonResponse({"success": "OTP resent"})
+
 
-    return JsonResponse({"success": "OTP resent"})
\ No newline at end of file
+def metrics_view(request):
+    # Prometheus scrape endpoint: scrapers send METRICS_TOKEN as a bearer
+    # token, otherwise only a signed-in admin may look.
+    token = settings.METRICS_TOKEN
+    if not (token and request.headers.get("Authorization") == f"Bearer {token}") and not request.identity.admin:
+        return HttpResponseForbidden()
+    return HttpResponse(metrics.registry.render(), content_type="text/plain; version=0.0.4; charset=utf-8")
@@ -1,5 +0,0 @@
-const body = document.body;
-const theme = localStorage.getItem('theme')
-
-if (theme) 
-  document.documentElement.setAttribute('data-bs-theme', theme)
\ No newline at end of file
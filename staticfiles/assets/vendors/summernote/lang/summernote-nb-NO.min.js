@@ -1,2 +0,0 @@
-/*! For license information please see summernote-nb-NO.min.js.LICENSE.txt */
-!function(e,t){if("object"==typeof exports&&"object"==typeof module)module.exports=t();else if("function"==typeof define&&define.amd)define([],t);else{var r=t();for(var n in r)("object"==typeof exports?exports:e)[n]=r[n]}}(window,(function(){return function(e){var t={};function r(n){if(t[n])return t[n].exports;var i=t[n]={i:n,l:!1,exports:{}};return e[n].call(i.exports,i,i.exports,r),i.l=!0,i.exports}return r.m=e,r.c=t,r.d=function(e,t,n){r.o(e,t)||Object.defineProperty(e,t,{enumerable:!0,get:n})},r.r=function(e){"undefined"!=typeof Symbol&&Symbol.toStringTag&&Object.defineProperty(e,Symbol.toStringTag,{value:"Module"}),Object.defineProperty(e,"__esModule",{value:!0})},r.t=function(e,t){if(1&t&&(e=r(e)),8&t)return e;if(4&t&&"object"==typeof e&&e&&e.__esModule)return e;var n=Object.create(null);if(r.r(n),Object.defineProperty(n,"default",{enumerable:!0,value:e}),2&t&&"string"!=typeof e)for(var i in e)r.d(n,i,function(t){return e[t]}.bind(null,i));return n},r.n=function(e){var t=e&&e.__esModule?function(){return e.default}:function(){return e};return r.d(t,"a",t),t},r.o=function(e,t){return Object.prototype.hasOwnProperty.call(e,t)},r.p="",r(r.s=31)}({31:function(e,t){var r;(r=jQuery).extend(r.summernote.lang,{"nb-NO":{font:{bold:"Fet",italic:"Kursiv",underline:"Understrek",clear:"Fjern formatering",height:"Linjehøyde",name:"Skrifttype",strikethrough:"Gjennomstrek",subscript:"Subscript",superscript:"Superscript",size:"Skriftstørrelse"},image:{image:"Bilde",insert:"Sett inn bilde",resizeFull:"Sett full størrelse",resizeHalf:"Sett halv størrelse",resizeQuarter:"Sett kvart størrelse",floatLeft:"Flyt til venstre",floatRight:"Flyt til høyre",floatNone:"Fjern flyt",shapeRounded:"Form: Rundet",shapeCircle:"Form: Sirkel",shapeThumbnail:"Form: Miniatyr",shapeNone:"Form: Ingen",dragImageHere:"Dra et bilde hit",dropImage:"Drop image or Text",selectFromFiles:"Velg fra filer",maximumFileSize:"Max filstørrelse",maximumFileSizeError:"Maks filstørrelse overskredet.",url:"Bilde-URL",remove:"Fjern bilde",original:"Original"},video:{video:"Video",videoLink:"Videolenke",insert:"Sett inn video",url:"Video-URL",providers:"(YouTube, Vimeo, Vine, Instagram, DailyMotion eller Youku)"},link:{link:"Lenke",insert:"Sett inn lenke",unlink:"Fjern lenke",edit:"Rediger",textToDisplay:"Visningstekst",url:"Til hvilken URL skal denne lenken peke?",openInNewWindow:"Åpne i nytt vindu"},table:{table:"Tabell",addRowAbove:"Legg til rad over",addRowBelow:"Legg til rad under",addColLeft:"Legg til kolonne på venstre side",addColRight:"Legg til kolonne på høyre side",delRow:"Slett rad",delCol:"Slett kolonne",delTable:"Slett tabell"},hr:{insert:"Sett inn horisontal linje"},style:{style:"Stil",p:"Paragraf",blockquote:"Sitat",pre:"Kode",h1:"Overskrift 1",h2:"Overskrift 2",h3:"Overskrift 3",h4:"Overskrift 4",h5:"Overskrift 5",h6:"Overskrift 6"},lists:{unordered:"Punktliste",ordered:"Nummerert liste"},options:{help:"Hjelp",fullscreen:"Fullskjerm",codeview:"HTML-visning"},paragraph:{paragraph:"Avsnitt",outdent:"Tilbakerykk",indent:"Innrykk",left:"Venstrejustert",center:"Midtstilt",right:"Høyrejustert",justify:"Blokkjustert"},color:{recent:"Nylig valgt farge",more:"Flere farger",background:"Bakgrunnsfarge",foreground:"Skriftfarge",transparent:"Gjennomsiktig",setTransparent:"Sett gjennomsiktig",reset:"Nullstill",resetToDefault:"Nullstill til standard"},shortcut:{shortcuts:"Hurtigtaster",close:"Lukk",textFormatting:"Tekstformatering",action:"Handling",paragraphFormatting:"Avsnittsformatering",documentStyle:"Dokumentstil"},help:{insertParagraph:"Sett inn avsnitt",undo:"Angre siste handling",redo:"Gjør om siste handling",tab:"Tab",untab:"Untab",bold:"Angi en fet stil",italic:"Angi en kursiv stil",underline:"Sett en understreket stil",strikethrough:"Sett en gjennomgående sti",removeFormat:"Tøm formattering",justifyLeft:"Angi venstrejustering",justifyCenter:"Angi sentrert justering",justifyRight:"Angi høyre justering",justifyFull:"Angi full justering",insertUnorderedList:"Bytt uordnet liste",insertOrderedList:"Bytt sortert liste",outdent:"Utrykk på valgt avsnitt",indent:"Innrykk på valgt avsnitt",formatPara:"Endre gjeldende blokkformat til et avsnitt (P-kode)",formatH1:"Endre gjeldende blokkformat til H1",formatH2:"Endre gjeldende blokkformat til H2",formatH3:"Endre gjeldende blokkformat til H3",formatH4:"Endre gjeldende blokkformat til H4",formatH5:"Endre gjeldende blokkformat til H5",formatH6:"Endre gjeldende blokkformat til H6",insertHorizontalRule:"Sett inn horisontal deler","linkDialog.show":"Vis koblingsdialog"},history:{undo:"Angre",redo:"Gjør om"},specialChar:{specialChar:"SPESIELLE TEGN",select:"Velg spesielle tegn"}}})}})}));
\ No newline at end of file
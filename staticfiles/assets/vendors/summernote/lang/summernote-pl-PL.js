@@ -1,273 +0,0 @@
-/*!
- * 
- * Super simple wysiwyg editor v0.8.18
- * https://summernote.org
- * 
- * 
- * Copyright 2013- Alan Hong. and other contributors
- * summernote may be freely distributed under the MIT license.
- * 
- * Date: 2020-05-20T18:09Z
- * 
- */
-(function webpackUniversalModuleDefinition(root, factory) {
-	if(typeof exports === 'object' && typeof module === 'object')
-		module.exports = factory();
-	else if(typeof define === 'function' && define.amd)
-		define([], factory);
-	else {
-		var a = factory();
-		for(var i in a) (typeof exports === 'object' ? exports : root)[i] = a[i];
-	}
-})(window, function() {
-return /******/ (function(modules) { // webpackBootstrap
-/******/ 	// The module cache
-/******/ 	var installedModules = {};
-/******/
-/******/ 	// The require function
-/******/ 	function __webpack_require__(moduleId) {
-/******/
-/******/ 		// Check if module is in cache
-/******/ 		if(installedModules[moduleId]) {
-/******/ 			return installedModules[moduleId].exports;
-/******/ 		}
-/******/ 		// Create a new module (and put it into the cache)
-/******/ 		var module = installedModules[moduleId] = {
-/******/ 			i: moduleId,
-/******/ 			l: false,
-/******/ 			exports: {}
-/******/ 		};
-/******/
-/******/ 		// Execute the module function
-/******/ 		modules[moduleId].call(module.exports, module, module.exports, __webpack_require__);
-/******/
-/******/ 		// Flag the module as loaded
-/******/ 		module.l = true;
-/******/
-/******/ 		// Return the exports of the module
-/******/ 		return module.exports;
-/******/ 	}
-/******/
-/******/
-/******/ 	// expose the modules object (__webpack_modules__)
-/******/ 	__webpack_require__.m = modules;
-/******/
-/******/ 	// expose the module cache
-/******/ 	__webpack_require__.c = installedModules;
-/******/
-/******/ 	// define getter function for harmony exports
-/******/ 	__webpack_require__.d = function(exports, name, getter) {
-/******/ 		if(!__webpack_require__.o(exports, name)) {
-/******/ 			Object.defineProperty(exports, name, { enumerable: true, get: getter });
-/******/ 		}
-/******/ 	};
-/******/
-/******/ 	// define __esModule on exports
-/******/ 	__webpack_require__.r = function(exports) {
-/******/ 		if(typeof Symbol !== 'undefined' && Symbol.toStringTag) {
-/******/ 			Object.defineProperty(exports, Symbol.toStringTag, { value: 'Module' });
-/******/ 		}
-/******/ 		Object.defineProperty(exports, '__esModule', { value: true });
-/******/ 	};
-/******/
-/******/ 	// create a fake namespace object
-/******/ 	// mode & 1: value is a module id, require it
-/******/ 	// mode & 2: merge all properties of value into the ns
-/******/ 	// mode & 4: return value when already ns object
-/******/ 	// mode & 8|1: behave like require
-/******/ 	__webpack_require__.t = function(value, mode) {
-/******/ 		if(mode & 1) value = __webpack_require__(value);
-/******/ 		if(mode & 8) return value;
-/******/ 		if((mode & 4) && typeof value === 'object' && value && value.__esModule) return value;
-/******/ 		var ns = Object.create(null);
-/******/ 		__webpack_require__.r(ns);
-/******/ 		Object.defineProperty(ns, 'default', { enumerable: true, value: value });
-/******/ 		if(mode & 2 && typeof value != 'string') for(var key in value) __webpack_require__.d(ns, key, function(key) { return value[key]; }.bind(null, key));
-/******/ 		return ns;
-/******/ 	};
-/******/
-/******/ 	// getDefaultExport function for compatibility with non-harmony modules
-/******/ 	__webpack_require__.n = function(module) {
-/******/ 		var getter = module && module.__esModule ?
-/******/ 			function getDefault() { return module['default']; } :
-/******/ 			function getModuleExports() { return module; };
-/******/ 		__webpack_require__.d(getter, 'a', getter);
-/******/ 		return getter;
-/******/ 	};
-/******/
-/******/ 	// Object.prototype.hasOwnProperty.call
-/******/ 	__webpack_require__.o = function(object, property) { return Object.prototype.hasOwnProperty.call(object, property); };
-/******/
-/******/ 	// __webpack_public_path__
-/******/ 	__webpack_require__.p = "";
-/******/
-/******/
-/******/ 	// Load entry module and return exports
-/******/ 	return __webpack_require__(__webpack_require__.s = 33);
-/******/ })
-/************************************************************************/
-/******/ ({
-
-/***/ 33:
-/***/ (function(module, exports) {
-
-(function ($) {
-  $.extend($.summernote.lang, {
-    'pl-PL': {
-      font: {
-        bold: 'Pogrubienie',
-        italic: 'Pochylenie',
-        underline: 'Podkreślenie',
-        clear: 'Usuń formatowanie',
-        height: 'Interlinia',
-        name: 'Czcionka',
-        strikethrough: 'Przekreślenie',
-        subscript: 'Indeks dolny',
-        superscript: 'Indeks górny',
-        size: 'Rozmiar'
-      },
-      image: {
-        image: 'Grafika',
-        insert: 'Wstaw grafikę',
-        resizeFull: 'Zmień rozmiar na 100%',
-        resizeHalf: 'Zmień rozmiar na 50%',
-        resizeQuarter: 'Zmień rozmiar na 25%',
-        floatLeft: 'Po lewej',
-        floatRight: 'Po prawej',
-        floatNone: 'Równo z tekstem',
-        shapeRounded: 'Kształt: zaokrąglone',
-        shapeCircle: 'Kształt: okrąg',
-        shapeThumbnail: 'Kształt: miniatura',
-        shapeNone: 'Kształt: brak',
-        dragImageHere: 'Przeciągnij grafikę lub tekst tutaj',
-        dropImage: 'Przeciągnij grafikę lub tekst',
-        selectFromFiles: 'Wybierz z dysku',
-        maximumFileSize: 'Limit wielkości pliku',
-        maximumFileSizeError: 'Przekroczono limit wielkości pliku.',
-        url: 'Adres URL grafiki',
-        remove: 'Usuń grafikę',
-        original: 'Oryginał'
-      },
-      video: {
-        video: 'Wideo',
-        videoLink: 'Adres wideo',
-        insert: 'Wstaw wideo',
-        url: 'Adres wideo',
-        providers: '(YouTube, Vimeo, Vine, Instagram, DailyMotion lub Youku)'
-      },
-      link: {
-        link: 'Odnośnik',
-        insert: 'Wstaw odnośnik',
-        unlink: 'Usuń odnośnik',
-        edit: 'Edytuj',
-        textToDisplay: 'Tekst do wyświetlenia',
-        url: 'Na jaki adres URL powinien przenosić ten odnośnik?',
-        openInNewWindow: 'Otwórz w nowym oknie'
-      },
-      table: {
-        table: 'Tabela',
-        addRowAbove: 'Dodaj wiersz powyżej',
-        addRowBelow: 'Dodaj wiersz poniżej',
-        addColLeft: 'Dodaj kolumnę po lewej',
-        addColRight: 'Dodaj kolumnę po prawej',
-        delRow: 'Usuń wiersz',
-        delCol: 'Usuń kolumnę',
-        delTable: 'Usuń tabelę'
-      },
-      hr: {
-        insert: 'Wstaw poziomą linię'
-      },
-      style: {
-        style: 'Styl',
-        p: 'pny',
-        blockquote: 'Cytat',
-        pre: 'Kod',
-        h1: 'Nagłówek 1',
-        h2: 'Nagłówek 2',
-        h3: 'Nagłówek 3',
-        h4: 'Nagłówek 4',
-        h5: 'Nagłówek 5',
-        h6: 'Nagłówek 6'
-      },
-      lists: {
-        unordered: 'Lista wypunktowana',
-        ordered: 'Lista numerowana'
-      },
-      options: {
-        help: 'Pomoc',
-        fullscreen: 'Pełny ekran',
-        codeview: 'Źródło'
-      },
-      paragraph: {
-        paragraph: 'Akapit',
-        outdent: 'Zmniejsz wcięcie',
-        indent: 'Zwiększ wcięcie',
-        left: 'Wyrównaj do lewej',
-        center: 'Wyrównaj do środka',
-        right: 'Wyrównaj do prawej',
-        justify: 'Wyrównaj do lewej i prawej'
-      },
-      color: {
-        recent: 'Ostani kolor',
-        more: 'Więcej kolorów',
-        background: 'Tło',
-        foreground: 'Czcionka',
-        transparent: 'Przeźroczysty',
-        setTransparent: 'Przeźroczyste',
-        reset: 'Zresetuj',
-        resetToDefault: 'Domyślne'
-      },
-      shortcut: {
-        shortcuts: 'Skróty klawiaturowe',
-        close: 'Zamknij',
-        textFormatting: 'Formatowanie tekstu',
-        action: 'Akcja',
-        paragraphFormatting: 'Formatowanie akapitu',
-        documentStyle: 'Styl dokumentu',
-        extraKeys: 'Dodatkowe klawisze'
-      },
-      help: {
-        'insertParagraph': 'Wstaw paragraf',
-        'undo': 'Cofnij poprzednią operację',
-        'redo': 'Przywróć poprzednią operację',
-        'tab': 'Tabulacja',
-        'untab': 'Usuń tabulację',
-        'bold': 'Pogrubienie',
-        'italic': 'Kursywa',
-        'underline': 'Podkreślenie',
-        'strikethrough': 'Przekreślenie',
-        'removeFormat': 'Usuń formatowanie',
-        'justifyLeft': 'Wyrównaj do lewej',
-        'justifyCenter': 'Wyrównaj do środka',
-        'justifyRight': 'Wyrównaj do prawej',
-        'justifyFull': 'Justyfikacja',
-        'insertUnorderedList': 'Nienumerowana lista',
-        'insertOrderedList': 'Wypunktowana lista',
-        'outdent': 'Zmniejsz wcięcie paragrafu',
-        'indent': 'Zwiększ wcięcie paragrafu',
-        'formatPara': 'Zamień format bloku na paragraf (tag P)',
-        'formatH1': 'Zamień format bloku na H1',
-        'formatH2': 'Zamień format bloku na H2',
-        'formatH3': 'Zamień format bloku na H3',
-        'formatH4': 'Zamień format bloku na H4',
-        'formatH5': 'Zamień format bloku na H5',
-        'formatH6': 'Zamień format bloku na H6',
-        'insertHorizontalRule': 'Wstaw poziomą linię',
-        'linkDialog.show': 'Pokaż dialog linkowania'
-      },
-      history: {
-        undo: 'Cofnij',
-        redo: 'Ponów'
-      },
-      specialChar: {
-        specialChar: 'ZNAKI SPECJALNE',
-        select: 'Wybierz Znak specjalny'
-      }
-    }
-  });
-})(jQuery);
-
-/***/ })
-
-/******/ });
-});
\ No newline at end of file
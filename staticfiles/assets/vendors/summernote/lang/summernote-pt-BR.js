@@ -1,274 +0,0 @@
-/*!
- * 
- * Super simple wysiwyg editor v0.8.18
- * https://summernote.org
- * 
- * 
- * Copyright 2013- Alan Hong. and other contributors
- * summernote may be freely distributed under the MIT license.
- * 
- * Date: 2020-05-20T18:09Z
- * 
- */
-(function webpackUniversalModuleDefinition(root, factory) {
-	if(typeof exports === 'object' && typeof module === 'object')
-		module.exports = factory();
-	else if(typeof define === 'function' && define.amd)
-		define([], factory);
-	else {
-		var a = factory();
-		for(var i in a) (typeof exports === 'object' ? exports : root)[i] = a[i];
-	}
-})(window, function() {
-return /******/ (function(modules) { // webpackBootstrap
-/******/ 	// The module cache
-/******/ 	var installedModules = {};
-/******/
-/******/ 	// The require function
-/******/ 	function __webpack_require__(moduleId) {
-/******/
-/******/ 		// Check if module is in cache
-/******/ 		if(installedModules[moduleId]) {
-/******/ 			return installedModules[moduleId].exports;
-/******/ 		}
-/******/ 		// Create a new module (and put it into the cache)
-/******/ 		var module = installedModules[moduleId] = {
-/******/ 			i: moduleId,
-/******/ 			l: false,
-/******/ 			exports: {}
-/******/ 		};
-/******/
-/******/ 		// Execute the module function
-/******/ 		modules[moduleId].call(module.exports, module, module.exports, __webpack_require__);
-/******/
-/******/ 		// Flag the module as loaded
-/******/ 		module.l = true;
-/******/
-/******/ 		// Return the exports of the module
-/******/ 		return module.exports;
-/******/ 	}
-/******/
-/******/
-/******/ 	// expose the modules object (__webpack_modules__)
-/******/ 	__webpack_require__.m = modules;
-/******/
-/******/ 	// expose the module cache
-/******/ 	__webpack_require__.c = installedModules;
-/******/
-/******/ 	// define getter function for harmony exports
-/******/ 	__webpack_require__.d = function(exports, name, getter) {
-/******/ 		if(!__webpack_require__.o(exports, name)) {
-/******/ 			Object.defineProperty(exports, name, { enumerable: true, get: getter });
-/******/ 		}
-/******/ 	};
-/******/
-/******/ 	// define __esModule on exports
-/******/ 	__webpack_require__.r = function(exports) {
-/******/ 		if(typeof Symbol !== 'undefined' && Symbol.toStringTag) {
-/******/ 			Object.defineProperty(exports, Symbol.toStringTag, { value: 'Module' });
-/******/ 		}
-/******/ 		Object.defineProperty(exports, '__esModule', { value: true });
-/******/ 	};
-/******/
-/******/ 	// create a fake namespace object
-/******/ 	// mode & 1: value is a module id, require it
-/******/ 	// mode & 2: merge all properties of value into the ns
-/******/ 	// mode & 4: return value when already ns object
-/******/ 	// mode & 8|1: behave like require
-/******/ 	__webpack_require__.t = function(value, mode) {
-/******/ 		if(mode & 1) value = __webpack_require__(value);
-/******/ 		if(mode & 8) return value;
-/******/ 		if((mode & 4) && typeof value === 'object' && value && value.__esModule) return value;
-/******/ 		var ns = Object.create(null);
-/******/ 		__webpack_require__.r(ns);
-/******/ 		Object.defineProperty(ns, 'default', { enumerable: true, value: value });
-/******/ 		if(mode & 2 && typeof value != 'string') for(var key in value) __webpack_require__.d(ns, key, function(key) { return value[key]; }.bind(null, key));
-/******/ 		return ns;
-/******/ 	};
-/******/
-/******/ 	// getDefaultExport function for compatibility with non-harmony modules
-/******/ 	__webpack_require__.n = function(module) {
-/******/ 		var getter = module && module.__esModule ?
-/******/ 			function getDefault() { return module['default']; } :
-/******/ 			function getModuleExports() { return module; };
-/******/ 		__webpack_require__.d(getter, 'a', getter);
-/******/ 		return getter;
-/******/ 	};
-/******/
-/******/ 	// Object.prototype.hasOwnProperty.call
-/******/ 	__webpack_require__.o = function(object, property) { return Object.prototype.hasOwnProperty.call(object, property); };
-/******/
-/******/ 	// __webpack_public_path__
-/******/ 	__webpack_require__.p = "";
-/******/
-/******/
-/******/ 	// Load entry module and return exports
-/******/ 	return __webpack_require__(__webpack_require__.s = 34);
-/******/ })
-/************************************************************************/
-/******/ ({
-
-/***/ 34:
-/***/ (function(module, exports) {
-
-(function ($) {
-  $.extend($.summernote.lang, {
-    'pt-BR': {
-      font: {
-        bold: 'Negrito',
-        italic: 'Itálico',
-        underline: 'Sublinhado',
-        clear: 'Remover estilo da fonte',
-        height: 'Altura da linha',
-        name: 'Fonte',
-        strikethrough: 'Riscado',
-        subscript: 'Subscrito',
-        superscript: 'Sobrescrito',
-        size: 'Tamanho da fonte'
-      },
-      image: {
-        image: 'Imagem',
-        insert: 'Inserir imagem',
-        resizeFull: 'Redimensionar Completamente',
-        resizeHalf: 'Redimensionar pela Metade',
-        resizeQuarter: 'Redimensionar a um Quarto',
-        floatLeft: 'Flutuar para Esquerda',
-        floatRight: 'Flutuar para Direita',
-        floatNone: 'Não Flutuar',
-        shapeRounded: 'Forma: Arredondado',
-        shapeCircle: 'Forma: Círculo',
-        shapeThumbnail: 'Forma: Miniatura',
-        shapeNone: 'Forma: Nenhum',
-        dragImageHere: 'Arraste Imagem ou Texto para cá',
-        dropImage: 'Solte Imagem ou Texto',
-        selectFromFiles: 'Selecione a partir dos arquivos',
-        maximumFileSize: 'Tamanho máximo do arquivo',
-        maximumFileSizeError: 'Tamanho máximo do arquivo excedido.',
-        url: 'URL da imagem',
-        remove: 'Remover Imagem',
-        original: 'Original'
-      },
-      video: {
-        video: 'Vídeo',
-        videoLink: 'Link para vídeo',
-        insert: 'Inserir vídeo',
-        url: 'URL do vídeo?',
-        providers: '(YouTube, Vimeo, Vine, Instagram, DailyMotion ou Youku)'
-      },
-      link: {
-        link: 'Link',
-        insert: 'Inserir link',
-        unlink: 'Remover link',
-        edit: 'Editar',
-        textToDisplay: 'Texto para exibir',
-        url: 'Para qual URL este link leva?',
-        openInNewWindow: 'Abrir em uma nova janela'
-      },
-      table: {
-        table: 'Tabela',
-        addRowAbove: 'Adicionar linha acima',
-        addRowBelow: 'Adicionar linha abaixo',
-        addColLeft: 'Adicionar coluna à esquerda',
-        addColRight: 'Adicionar coluna à direita',
-        delRow: 'Excluir linha',
-        delCol: 'Excluir coluna',
-        delTable: 'Excluir tabela'
-      },
-      hr: {
-        insert: 'Linha horizontal'
-      },
-      style: {
-        style: 'Estilo',
-        p: 'Normal',
-        blockquote: 'Citação',
-        pre: 'Código',
-        h1: 'Título 1',
-        h2: 'Título 2',
-        h3: 'Título 3',
-        h4: 'Título 4',
-        h5: 'Título 5',
-        h6: 'Título 6'
-      },
-      lists: {
-        unordered: 'Lista com marcadores',
-        ordered: 'Lista numerada'
-      },
-      options: {
-        help: 'Ajuda',
-        fullscreen: 'Tela cheia',
-        codeview: 'Ver código-fonte'
-      },
-      paragraph: {
-        paragraph: 'Parágrafo',
-        outdent: 'Menor tabulação',
-        indent: 'Maior tabulação',
-        left: 'Alinhar à esquerda',
-        center: 'Alinhar ao centro',
-        right: 'Alinha à direita',
-        justify: 'Justificado'
-      },
-      color: {
-        recent: 'Cor recente',
-        more: 'Mais cores',
-        background: 'Fundo',
-        foreground: 'Fonte',
-        transparent: 'Transparente',
-        setTransparent: 'Fundo transparente',
-        reset: 'Restaurar',
-        resetToDefault: 'Restaurar padrão',
-        cpSelect: 'Selecionar'
-      },
-      shortcut: {
-        shortcuts: 'Atalhos do teclado',
-        close: 'Fechar',
-        textFormatting: 'Formatação de texto',
-        action: 'Ação',
-        paragraphFormatting: 'Formatação de parágrafo',
-        documentStyle: 'Estilo de documento',
-        extraKeys: 'Extra keys'
-      },
-      help: {
-        'insertParagraph': 'Inserir Parágrafo',
-        'undo': 'Desfazer o último comando',
-        'redo': 'Refazer o último comando',
-        'tab': 'Tab',
-        'untab': 'Desfazer tab',
-        'bold': 'Colocar em negrito',
-        'italic': 'Colocar em itálico',
-        'underline': 'Sublinhado',
-        'strikethrough': 'Tachado',
-        'removeFormat': 'Remover estilo',
-        'justifyLeft': 'Alinhar à esquerda',
-        'justifyCenter': 'Centralizar',
-        'justifyRight': 'Alinhar à esquerda',
-        'justifyFull': 'Justificar',
-        'insertUnorderedList': 'Lista não ordenada',
-        'insertOrderedList': 'Lista ordenada',
-        'outdent': 'Recuar parágrafo atual',
-        'indent': 'Avançar parágrafo atual',
-        'formatPara': 'Alterar formato do bloco para parágrafo(tag P)',
-        'formatH1': 'Alterar formato do bloco para H1',
-        'formatH2': 'Alterar formato do bloco para H2',
-        'formatH3': 'Alterar formato do bloco para H3',
-        'formatH4': 'Alterar formato do bloco para H4',
-        'formatH5': 'Alterar formato do bloco para H5',
-        'formatH6': 'Alterar formato do bloco para H6',
-        'insertHorizontalRule': 'Inserir Régua horizontal',
-        'linkDialog.show': 'Inserir um Hiperlink'
-      },
-      history: {
-        undo: 'Desfazer',
-        redo: 'Refazer'
-      },
-      specialChar: {
-        specialChar: 'CARACTERES ESPECIAIS',
-        select: 'Selecionar Caracteres Especiais'
-      }
-    }
-  });
-})(jQuery);
-
-/***/ })
-
-/******/ });
-});
\ No newline at end of file
@@ -1,273 +0,0 @@
-/*!
- * 
- * Super simple wysiwyg editor v0.8.18
- * https://summernote.org
- * 
- * 
- * Copyright 2013- Alan Hong. and other contributors
- * summernote may be freely distributed under the MIT license.
- * 
- * Date: 2020-05-20T18:09Z
- * 
- */
-(function webpackUniversalModuleDefinition(root, factory) {
-	if(typeof exports === 'object' && typeof module === 'object')
-		module.exports = factory();
-	else if(typeof define === 'function' && define.amd)
-		define([], factory);
-	else {
-		var a = factory();
-		for(var i in a) (typeof exports === 'object' ? exports : root)[i] = a[i];
-	}
-})(window, function() {
-return /******/ (function(modules) { // webpackBootstrap
-/******/ 	// The module cache
-/******/ 	var installedModules = {};
-/******/
-/******/ 	// The require function
-/******/ 	function __webpack_require__(moduleId) {
-/******/
-/******/ 		// Check if module is in cache
-/******/ 		if(installedModules[moduleId]) {
-/******/ 			return installedModules[moduleId].exports;
-/******/ 		}
-/******/ 		// Create a new module (and put it into the cache)
-/******/ 		var module = installedModules[moduleId] = {
-/******/ 			i: moduleId,
-/******/ 			l: false,
-/******/ 			exports: {}
-/******/ 		};
-/******/
-/******/ 		// Execute the module function
-/******/ 		modules[moduleId].call(module.exports, module, module.exports, __webpack_require__);
-/******/
-/******/ 		// Flag the module as loaded
-/******/ 		module.l = true;
-/******/
-/******/ 		// Return the exports of the module
-/******/ 		return module.exports;
-/******/ 	}
-/******/
-/******/
-/******/ 	// expose the modules object (__webpack_modules__)
-/******/ 	__webpack_require__.m = modules;
-/******/
-/******/ 	// expose the module cache
-/******/ 	__webpack_require__.c = installedModules;
-/******/
-/******/ 	// define getter function for harmony exports
-/******/ 	__webpack_require__.d = function(exports, name, getter) {
-/******/ 		if(!__webpack_require__.o(exports, name)) {
-/******/ 			Object.defineProperty(exports, name, { enumerable: true, get: getter });
-/******/ 		}
-/******/ 	};
-/******/
-/******/ 	// define __esModule on exports
-/******/ 	__webpack_require__.r = function(exports) {
-/******/ 		if(typeof Symbol !== 'undefined' && Symbol.toStringTag) {
-/******/ 			Object.defineProperty(exports, Symbol.toStringTag, { value: 'Module' });
-/******/ 		}
-/******/ 		Object.defineProperty(exports, '__esModule', { value: true });
-/******/ 	};
-/******/
-/******/ 	// create a fake namespace object
-/******/ 	// mode & 1: value is a module id, require it
-/******/ 	// mode & 2: merge all properties of value into the ns
-/******/ 	// mode & 4: return value when already ns object
-/******/ 	// mode & 8|1: behave like require
-/******/ 	__webpack_require__.t = function(value, mode) {
-/******/ 		if(mode & 1) value = __webpack_require__(value);
-/******/ 		if(mode & 8) return value;
-/******/ 		if((mode & 4) && typeof value === 'object' && value && value.__esModule) return value;
-/******/ 		var ns = Object.create(null);
-/******/ 		__webpack_require__.r(ns);
-/******/ 		Object.defineProperty(ns, 'default', { enumerable: true, value: value });
-/******/ 		if(mode & 2 && typeof value != 'string') for(var key in value) __webpack_require__.d(ns, key, function(key) { return value[key]; }.bind(null, key));
-/******/ 		return ns;
-/******/ 	};
-/******/
-/******/ 	// getDefaultExport function for compatibility with non-harmony modules
-/******/ 	__webpack_require__.n = function(module) {
-/******/ 		var getter = module && module.__esModule ?
-/******/ 			function getDefault() { return module['default']; } :
-/******/ 			function getModuleExports() { return module; };
-/******/ 		__webpack_require__.d(getter, 'a', getter);
-/******/ 		return getter;
-/******/ 	};
-/******/
-/******/ 	// Object.prototype.hasOwnProperty.call
-/******/ 	__webpack_require__.o = function(object, property) { return Object.prototype.hasOwnProperty.call(object, property); };
-/******/
-/******/ 	// __webpack_public_path__
-/******/ 	__webpack_require__.p = "";
-/******/
-/******/
-/******/ 	// Load entry module and return exports
-/******/ 	return __webpack_require__(__webpack_require__.s = 35);
-/******/ })
-/************************************************************************/
-/******/ ({
-
-/***/ 35:
-/***/ (function(module, exports) {
-
-(function ($) {
-  $.extend($.summernote.lang, {
-    'pt-PT': {
-      font: {
-        bold: 'Negrito',
-        italic: 'Itálico',
-        underline: 'Sublinhado',
-        clear: 'Remover estilo da fonte',
-        height: 'Altura da linha',
-        name: 'Fonte',
-        strikethrough: 'Riscado',
-        subscript: 'Subscript',
-        superscript: 'Superscript',
-        size: 'Tamanho da fonte'
-      },
-      image: {
-        image: 'Imagem',
-        insert: 'Inserir imagem',
-        resizeFull: 'Redimensionar Completo',
-        resizeHalf: 'Redimensionar Metade',
-        resizeQuarter: 'Redimensionar Um Quarto',
-        floatLeft: 'Float Esquerda',
-        floatRight: 'Float Direita',
-        floatNone: 'Sem Float',
-        shapeRounded: 'Forma: Arredondado',
-        shapeCircle: 'Forma: Círculo',
-        shapeThumbnail: 'Forma: Minhatura',
-        shapeNone: 'Forma: Nenhum',
-        dragImageHere: 'Arraste uma imagem para aqui',
-        dropImage: 'Arraste uma imagem ou texto',
-        selectFromFiles: 'Selecione a partir dos arquivos',
-        maximumFileSize: 'Tamanho máximo do fixeiro',
-        maximumFileSizeError: 'Tamanho máximo do fixeiro é maior que o permitido.',
-        url: 'Endereço da imagem',
-        remove: 'Remover Imagem',
-        original: 'Original'
-      },
-      video: {
-        video: 'Vídeo',
-        videoLink: 'Link para vídeo',
-        insert: 'Inserir vídeo',
-        url: 'URL do vídeo?',
-        providers: '(YouTube, Vimeo, Vine, Instagram, DailyMotion ou Youku)'
-      },
-      link: {
-        link: 'Link',
-        insert: 'Inserir ligação',
-        unlink: 'Remover ligação',
-        edit: 'Editar',
-        textToDisplay: 'Texto para exibir',
-        url: 'Que endereço esta licação leva?',
-        openInNewWindow: 'Abrir numa nova janela'
-      },
-      table: {
-        table: 'Tabela',
-        addRowAbove: 'Adicionar linha acima',
-        addRowBelow: 'Adicionar linha abaixo',
-        addColLeft: 'Adicionar coluna à Esquerda',
-        addColRight: 'Adicionar coluna à Esquerda',
-        delRow: 'Excluir linha',
-        delCol: 'Excluir coluna',
-        delTable: 'Excluir tabela'
-      },
-      hr: {
-        insert: 'Inserir linha horizontal'
-      },
-      style: {
-        style: 'Estilo',
-        p: 'Parágrafo',
-        blockquote: 'Citação',
-        pre: 'Código',
-        h1: 'Título 1',
-        h2: 'Título 2',
-        h3: 'Título 3',
-        h4: 'Título 4',
-        h5: 'Título 5',
-        h6: 'Título 6'
-      },
-      lists: {
-        unordered: 'Lista com marcadores',
-        ordered: 'Lista numerada'
-      },
-      options: {
-        help: 'Ajuda',
-        fullscreen: 'Janela Completa',
-        codeview: 'Ver código-fonte'
-      },
-      paragraph: {
-        paragraph: 'Parágrafo',
-        outdent: 'Menor tabulação',
-        indent: 'Maior tabulação',
-        left: 'Alinhar à esquerda',
-        center: 'Alinhar ao centro',
-        right: 'Alinha à direita',
-        justify: 'Justificado'
-      },
-      color: {
-        recent: 'Cor recente',
-        more: 'Mais cores',
-        background: 'Fundo',
-        foreground: 'Fonte',
-        transparent: 'Transparente',
-        setTransparent: 'Fundo transparente',
-        reset: 'Restaurar',
-        resetToDefault: 'Restaurar padrão',
-        cpSelect: 'Selecionar'
-      },
-      shortcut: {
-        shortcuts: 'Atalhos do teclado',
-        close: 'Fechar',
-        textFormatting: 'Formatação de texto',
-        action: 'Ação',
-        paragraphFormatting: 'Formatação de parágrafo',
-        documentStyle: 'Estilo de documento'
-      },
-      help: {
-        'insertParagraph': 'Inserir Parágrafo',
-        'undo': 'Desfazer o último comando',
-        'redo': 'Refazer o último comando',
-        'tab': 'Maior tabulação',
-        'untab': 'Menor tabulação',
-        'bold': 'Colocar em negrito',
-        'italic': 'Colocar em itálico',
-        'underline': 'Colocar em sublinhado',
-        'strikethrough': 'Colocar em riscado',
-        'removeFormat': 'Limpar o estilo',
-        'justifyLeft': 'Definir alinhado à esquerda',
-        'justifyCenter': 'Definir alinhado ao centro',
-        'justifyRight': 'Definir alinhado à direita',
-        'justifyFull': 'Definir justificado',
-        'insertUnorderedList': 'Alternar lista não ordenada',
-        'insertOrderedList': 'Alternar lista ordenada',
-        'outdent': 'Recuar parágrafo atual',
-        'indent': 'Avançar parágrafo atual',
-        'formatPara': 'Alterar formato do bloco para parágrafo',
-        'formatH1': 'Alterar formato do bloco para Título 1',
-        'formatH2': 'Alterar formato do bloco para Título 2',
-        'formatH3': 'Alterar formato do bloco para Título 3',
-        'formatH4': 'Alterar formato do bloco para Título 4',
-        'formatH5': 'Alterar formato do bloco para Título 5',
-        'formatH6': 'Alterar formato do bloco para Título 6',
-        'insertHorizontalRule': 'Inserir linha horizontal',
-        'linkDialog.show': 'Inserir uma ligração'
-      },
-      history: {
-        undo: 'Desfazer',
-        redo: 'Refazer'
-      },
-      specialChar: {
-        specialChar: 'SPECIAL CHARACTERS',
-        select: 'Select Special characters'
-      }
-    }
-  });
-})(jQuery);
-
-/***/ })
-
-/******/ });
-});
\ No newline at end of file
@@ -1,9 +0,0 @@
-/**
- * Copyright (c) Tiny Technologies, Inc. All rights reserved.
- * Licensed under the LGPL or a commercial license.
- * For LGPL see License.txt in the project root for license information.
- * For commercial licenses see https://www.tiny.cloud/
- *
- * Version: 5.6.2 (2020-12-08)
- */
-!function () { "use strict"; tinymce.util.Tools.resolve("tinymce.PluginManager").add("textcolor", function () { console.warn("Text color plugin is now built in to the core editor, please remove it from your editor configuration") }) }();
\ No newline at end of file